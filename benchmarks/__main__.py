@@ -0,0 +1,140 @@
+"""
+Benchmark the SQL behind the leaderboard commands.
+
+Spins up a throwaway Postgres, applies the migrations in ``postgres/migrations``, seeds synthetic data
+and runs every registered query with ``EXPLAIN (ANALYZE, BUFFERS)``.
+
+    python -m benchmarks --records 100k --users 5000 --maps 1000 --output benchmarks/baseline.json
+    python -m benchmarks --records 100k --users 5000 --maps 1000 --compare benchmarks/baseline.json
+
+With ``--compare`` the exit code is 1 when any query's p95 regressed past ``--tolerance``.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import math
+import pathlib
+import random
+import sys
+import time
+
+import asyncpg
+
+from benchmarks.cluster import DockerCluster, ExistingCluster, PgCtlCluster
+from benchmarks.queries import QUERIES, BenchQuery
+from benchmarks.seed import SeedInfo, parse_scale, seed
+from postgres.migrate import apply_migrations
+
+
+def percentile(values: list[float], pct: float) -> float:
+    """Nearest-rank percentile."""
+    ordered = sorted(values)
+    return ordered[max(math.ceil(pct / 100 * len(ordered)) - 1, 0)]
+
+
+async def run_query(
+    connection: asyncpg.Connection,
+    bench: BenchQuery,
+    info: SeedInfo,
+    rng: random.Random,
+    runs: int,
+    warmup: int,
+) -> dict[str, float | int]:
+    explain = "EXPLAIN (ANALYZE, BUFFERS, FORMAT JSON) " + bench.query
+    timings = []
+    plan = {}
+    for i in range(warmup + runs):
+        raw = await connection.fetchval(explain, *bench.args(info, rng))
+        plan = json.loads(raw)[0] if isinstance(raw, str) else raw[0]
+        if i >= warmup:
+            timings.append(plan["Planning Time"] + plan["Execution Time"])
+    top = plan["Plan"]
+    return {
+        "p50_ms": round(percentile(timings, 50), 3),
+        "p95_ms": round(percentile(timings, 95), 3),
+        "runs": runs,
+        "shared_hit_blocks": top.get("Shared Hit Blocks", 0),
+        "shared_read_blocks": top.get("Shared Read Blocks", 0),
+    }
+
+
+def compare(results: dict, baseline: dict, tolerance: float) -> list[str]:
+    regressions = []
+    for name, result in results["queries"].items():
+        old = baseline["queries"].get(name)
+        if not old:
+            continue
+        # A 1 ms floor keeps sub-millisecond noise from failing the run.
+        if result["p95_ms"] > max(old["p95_ms"] * tolerance, old["p95_ms"] + 1):
+            regressions.append(f"{name}: p95 {old['p95_ms']}ms -> {result['p95_ms']}ms")
+    return regressions
+
+
+async def main(args: argparse.Namespace) -> int:
+    if args.dsn:
+        cluster = ExistingCluster(args.dsn)
+    elif args.cluster == "docker":
+        cluster = DockerCluster()
+    else:
+        cluster = PgCtlCluster()
+
+    selected = [q for q in QUERIES if not args.only or q.name in args.only]
+    async with cluster as dsn:
+        connection = await asyncpg.connect(dsn)
+        try:
+            await apply_migrations(connection)
+            started = time.perf_counter()
+            info = await seed(
+                connection,
+                records=parse_scale(args.records),
+                users=parse_scale(args.users),
+                maps=parse_scale(args.maps),
+                seed_value=args.seed,
+            )
+            print(f"Seeded in {time.perf_counter() - started:.1f}s", file=sys.stderr)
+
+            rng = random.Random(args.seed)
+            results = {
+                "scale": {"records": args.records, "users": args.users, "maps": args.maps, "seed": args.seed},
+                "server_version": await connection.fetchval("SHOW server_version;"),
+                "queries": {},
+            }
+            for bench in selected:
+                results["queries"][bench.name] = await run_query(connection, bench, info, rng, args.runs, args.warmup)
+                print(f"{bench.name:<28} {results['queries'][bench.name]}", file=sys.stderr)
+        finally:
+            await connection.close()
+
+    if args.output:
+        pathlib.Path(args.output).write_text(json.dumps(results, indent=2) + "\n")
+
+    if args.compare:
+        regressions = compare(results, json.loads(pathlib.Path(args.compare).read_text()), args.tolerance)
+        for line in regressions:
+            print(f"REGRESSION {line}", file=sys.stderr)
+        return 1 if regressions else 0
+    return 0
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks", description=__doc__.split("\n\n")[0].strip())
+    parser.add_argument("--records", default="10k", help="Number of map records, e.g. 10k, 100k, 1M.")
+    parser.add_argument("--users", default="1k", help="Number of users.")
+    parser.add_argument("--maps", default="500", help="Number of maps.")
+    parser.add_argument("--runs", type=int, default=20, help="Timed runs per query.")
+    parser.add_argument("--warmup", type=int, default=2, help="Untimed runs per query.")
+    parser.add_argument("--seed", type=int, default=0, help="Random seed for data and arguments.")
+    parser.add_argument("--cluster", choices=["pg_ctl", "docker"], default="pg_ctl")
+    parser.add_argument("--dsn", help="Use an existing, empty database instead of starting one.")
+    parser.add_argument("--only", nargs="*", help="Only run these queries.")
+    parser.add_argument("--output", help="Write results to this JSON file.")
+    parser.add_argument("--compare", help="Baseline JSON to compare against.")
+    parser.add_argument("--tolerance", type=float, default=1.5, help="Allowed p95 slowdown factor.")
+    return parser.parse_args(argv)
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(main(parse_args())))
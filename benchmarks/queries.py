@@ -0,0 +1,329 @@
+"""
+SQL behind the slowest leaderboard commands, registered for benchmarking.
+
+Each constant is a copy of the query its command runs.
+Keep them in sync when a command's query changes.
+"""
+
+from __future__ import annotations
+
+import random
+import typing
+
+if typing.TYPE_CHECKING:
+    from benchmarks.seed import SeedInfo
+
+
+class BenchQuery(typing.NamedTuple):
+    name: str
+    query: str
+    args: typing.Callable[[SeedInfo, random.Random], tuple[typing.Any, ...]]
+
+
+# view_records
+VIEW_RECORDS = """
+    WITH all_tournament_records AS (SELECT user_id,
+                                           inserted_at,
+                                           record,
+                                           screenshot,
+                                           code                                                          as map_code,
+                                           level                                                         as level_name,
+                                           RANK() OVER (partition by user_id, code, level order by inserted_at) as latest
+                                    FROM tournament_records tr
+                                             LEFT JOIN tournament_maps tm on tr.category = tm.category
+                                        AND tr.tournament_id = tm.id),
+         _tournament_records AS (SELECT user_id,
+                                        record,
+                                        screenshot,
+                                        map_code,
+                                        level_name,
+                                        inserted_at,
+                                        true as verified,
+                                        null as video
+                                 FROM all_tournament_records
+                                 WHERE latest = 1),
+         combined_t_all_records AS (SELECT user_id,
+                                           map_code,
+                                           level_name,
+                                           record,
+                                           screenshot,
+                                           video,
+                                           verified,
+                                           inserted_at,
+                                           true as tournament
+                                    FROM _tournament_records _tr
+                                    UNION
+                                    DISTINCT
+                                    (SELECT user_id,
+                                            map_code,
+                                            level_name,
+                                            record,
+                                            screenshot,
+                                            video,
+                                            verified,
+                                            inserted_at,
+                                            false as tournament
+                                     FROM records)),
+    final AS (SELECT *
+    FROM (SELECT u.nickname,
+                 level_name,
+                 record,
+                 screenshot,
+                 video,
+                 tournament,
+                 verified,
+                 r.map_code,
+                 m.map_name,
+                 rank() OVER (
+                     partition by r.map_code, r.user_id, level_name
+                     order by inserted_at DESC
+                     ) as latest,
+                 RANK() OVER (
+                     PARTITION BY level_name
+                     ORDER BY record
+                     )    rank_num
+          FROM combined_t_all_records r
+                   LEFT JOIN users u on r.user_id = u.user_id
+                   LEFT JOIN maps m on m.map_code = r.map_code) as ranks
+    WHERE map_code = $1
+      AND ($4::boolean IS FALSE OR video is not null)
+      AND ($2::boolean IS NOT FALSE OR rank_num = 1)
+      AND ($3::text IS NULL OR level_name = $3)
+      AND latest = 1
+      AND verified = TRUE
+    ORDER BY record, substr(level_name, 1, 5) <> 'Level', level_name)
+    SELECT nickname, level_name, record, screenshot, video, tournament, verified, map_code, map_name, latest, RANK() OVER (
+                     PARTITION BY level_name
+                     ORDER BY record
+                     )    rank_num FROM final;
+"""
+
+# cache_records (/personal_records and the PR/WR context menus are served from this in memory)
+RECORD_INDEX = """
+    SELECT DISTINCT ON (map_code, level_name, user_id)
+           map_code, level_name, user_id, record, screenshot, video
+    FROM records
+    WHERE verified = TRUE
+    ORDER BY map_code, level_name, user_id, inserted_at DESC;
+"""
+
+# cache_map_stats (/map_search and /random_map are served from this in memory)
+MAP_STATS = """
+    SELECT m.map_code,
+           map_name,
+           map_type,
+           "desc",
+           official,
+           image,
+           coalesce(c.user_ids, '{}') as creator_ids,
+           coalesce(r.total, 0)       as rating_total,
+           coalesce(r.count, 0)       as rating_count
+    FROM maps m
+             LEFT JOIN (SELECT map_code, array_agg(user_id) as user_ids
+                        FROM map_creators
+                        GROUP BY map_code) c ON m.map_code = c.map_code
+             LEFT JOIN (SELECT map_code, sum(rating) as total, count(rating) as count
+                        FROM map_level_ratings
+                        GROUP BY map_code) r ON m.map_code = r.map_code;
+"""
+
+# _get_card_data
+RANK_CARD = """
+    WITH all_users AS (SELECT u.user_id,
+                                  coalesce(xp, 0) as xp, nickname
+                           FROM user_xp ux
+                                RIGHT JOIN users u ON ux.user_id = u.user_id WHERE season = $2),
+         all_positions as (SELECT user_id, nickname,
+                                      xp,
+                                      rank() OVER (
+                                          ORDER BY xp DESC
+                                          ) AS pos
+                               FROM all_users),
+         ranks AS (SELECT u.user_id,
+                              COALESCE((SELECT value
+                                        FROM user_ranks
+                                        WHERE category = 'Time Attack'
+                                          AND user_id = $1),
+                                       'Unranked') as "Time Attack",
+                              COALESCE((SELECT value
+                                        FROM user_ranks
+                                        WHERE category = 'Mildcore'
+                                          AND user_id = $1),
+                                       'Unranked') as "Mildcore",
+                              COALESCE((SELECT value
+                                        FROM user_ranks
+                                        WHERE category = 'Hardcore'
+                                          AND user_id = $1),
+                                       'Unranked') as "Hardcore",
+                              COALESCE((SELECT value FROM user_ranks WHERE category = 'Bonus' AND user_id = $1),
+                                       'Unranked') as "Bonus"
+                       FROM users u
+                                LEFT JOIN user_ranks ur on u.user_id = ur.user_id)
+
+        SELECT all_positions.user_id, nickname,
+               xp,
+               pos,
+               "Time Attack",
+               "Mildcore",
+               "Hardcore",
+               "Bonus",
+               coalesce(wins, 0)   as wins,
+               coalesce(losses, 0) as losses
+        FROM all_positions
+                 RIGHT JOIN ranks ON all_positions.user_id = ranks.user_id
+                 LEFT JOIN user_duels ON all_positions.user_id = user_duels.user_id
+
+        WHERE all_positions.user_id = $1
+        GROUP BY all_positions.user_id, xp, pos, "Time Attack", "Mildcore", "Hardcore", "Bonus", wins, losses, nickname
+"""
+
+# tournament_leaderboard
+TOURNAMENT_LEADERBOARD = """
+    WITH all_ranks AS (SELECT u.user_id, nickname, cats.value as category, COALESCE(ur.value, 'Unranked') as value
+                       FROM users u
+                                JOIN tournament_ranks cats ON TRUE
+                                LEFT JOIN user_ranks ur on u.user_id = ur.user_id AND cats.value = ur.category),
+         all_records AS (SELECT nickname,
+                                record,
+                                screenshot,
+                                value,
+                                rank()
+                                over (partition by nickname, value, tr.category, ar.category order by inserted_at DESC) as date_rank
+                         FROM tournament_records tr
+                                  LEFT JOIN all_ranks ar ON ar.user_id = tr.user_id
+                         WHERE tournament_id =
+                               (SELECT id FROM tournament WHERE id = (SELECT max(id) FROM tournament))
+                           AND tr.category = $1
+                           AND ar.category = $1
+                           AND ($2::text IS NULL OR ar.value = $2)
+                         ORDER BY record)
+    SELECT *
+    FROM all_records
+    WHERE date_rank = 1;
+"""
+
+# _computer_leaderboard_xp
+LEADERBOARD_XP = """
+    WITH
+    all_ranks AS (SELECT u.user_id, nickname, cats.value as category, COALESCE(ur.value, 'Unranked') as value
+                       FROM users u
+                                JOIN tournament_ranks cats ON TRUE
+                                LEFT JOIN user_ranks ur on u.user_id = ur.user_id AND cats.value = ur.category),
+    t_records AS (SELECT tr.user_id,
+                              record,
+                              ur.value                                                            as value,
+                              tr.category,
+                              rank()
+                              over (partition by ur.user_id, value, tr.category, ur.category order by inserted_at DESC) as date_rank
+                       FROM tournament_records tr
+                                LEFT JOIN all_ranks ur on tr.user_id = ur.user_id and tr.category = ur.category
+                       WHERE tournament_id = $1),
+         top AS (SELECT category, min(record) as top_record FROM t_records GROUP BY category, value),
+         top_recs AS (SELECT user_id, record, top.category, value as "rank"
+                      FROM top
+                               LEFT JOIN t_records r ON top.category = r.category
+                          AND record = top.top_record)
+    SELECT nickname, r.user_id, r.record, r.category, tr.record as top_record, value
+    FROM top_recs tr
+
+             RIGHT JOIN t_records r ON tr.category = r.category AND tr.rank = r.value
+             LEFT JOIN users u on r.user_id = u.user_id
+    WHERE date_rank = 1
+    ORDER BY r.category, value, record;
+"""
+
+# _compute_difficulty_missions
+DIFFICULTY_MISSIONS = """
+    WITH t_records AS (SELECT tr.user_id, record, coalesce(ur.value, 'Unranked') as value, tr.category FROM tournament_records tr
+                                LEFT JOIN user_ranks ur on tr.user_id = ur.user_id and tr.category = ur.category
+                       WHERE tournament_id = $1),
+         top AS (SELECT category, min(record) as top_record FROM t_records GROUP BY category, value),
+         top_recs AS (SELECT user_id, record, top.category, value as "rank"
+                         FROM top
+                                  LEFT JOIN t_records r ON top.category = r.category
+                             AND record = top.top_record),
+
+         sub_time_missions AS (SELECT target,
+                                      t_records.user_id,
+                                      t_records.category,
+                                      nickname,
+                                      difficulty,
+                                      value,
+                                      record
+                               FROM tournament_missions
+                                        RIGHT JOIN t_records ON t_records.category = tournament_missions.category
+                                        LEFT JOIN users ON users.user_id = t_records.user_id
+                               WHERE id = $1
+                                 AND CASE
+                                         WHEN type = 'Sub Time' THEN record < target
+                                         WHEN type = 'Completion' THEN record > -10000000
+                                         ELSE true
+                                   END
+                               ORDER BY t_records.category != 'Time Attack',
+                                        t_records.category != 'Mildcore',
+                                        t_records.category != 'Hardcore',
+                                        t_records.category != 'Bonus',
+                                        difficulty != 'Expert',
+                                        difficulty != 'Hard',
+                                        difficulty != 'Medium',
+                                        difficulty != 'Easy'),
+         distinct_values AS (SELECT DISTINCT ON (user_id, category, nickname) user_id,
+                                                                    category,
+                                                                    nickname,
+                                                                    difficulty,
+                                                                    value as rank,
+                                                                    record
+                   FROM sub_time_missions
+                   ORDER BY user_id, category, nickname,
+                            difficulty != 'Expert',
+                            difficulty != 'Hard',
+                            difficulty != 'Medium',
+                            difficulty != 'Easy')
+    SELECT t.user_id, t.category, nickname, difficulty, tr.record as top_record
+    FROM distinct_values t
+             LEFT JOIN top_recs tr ON tr.category = t.category AND tr.rank = t.rank;
+"""
+
+# _compute_top_placement
+TOP_PLACEMENT = """
+    WITH t_records AS (SELECT tr.user_id, record, coalesce(ur.value, 'Unranked') as value, tr.category, rank()
+                                over (partition by ur.user_id, value, tr.category, ur.category order by inserted_at DESC) as date_rank
+                       FROM tournament_records tr
+                                LEFT JOIN user_ranks ur on tr.user_id = ur.user_id and tr.category = ur.category
+                       WHERE tournament_id = $1),
+         ranks AS (SELECT user_id,
+                          record,
+                          value,
+                          category,
+                          rank() OVER (
+                              PARTITION BY value, category
+                              ORDER BY record
+                              ) rank_num
+                   FROM t_records
+                   WHERE date_rank = 1),
+         top_three AS (SELECT user_id, count(user_id) as amount
+                       FROM ranks
+                       WHERE rank_num <= 3
+                       GROUP BY user_id)
+    SELECT *
+    FROM top_three
+    WHERE amount >= $2;
+"""
+
+
+def _map_level(seed: SeedInfo, rng: random.Random) -> tuple[str, bool, str, bool]:
+    map_code, level_name = rng.choice(seed.levels)
+    return map_code, True, level_name, False
+
+
+QUERIES: list[BenchQuery] = [
+    BenchQuery("view_records", VIEW_RECORDS, lambda s, r: (r.choice(s.map_codes), False, None, False)),
+    BenchQuery("view_records_level", VIEW_RECORDS, _map_level),
+    BenchQuery("record_index", RECORD_INDEX, lambda s, r: ()),
+    BenchQuery("map_stats", MAP_STATS, lambda s, r: ()),
+    BenchQuery("rank_card", RANK_CARD, lambda s, r: (r.choice(s.user_ids), s.season)),
+    BenchQuery("tournament_leaderboard", TOURNAMENT_LEADERBOARD, lambda s, r: (r.choice(s.categories), None)),
+    BenchQuery("xp_leaderboard", LEADERBOARD_XP, lambda s, r: (s.tournament_id,)),
+    BenchQuery("xp_difficulty_missions", DIFFICULTY_MISSIONS, lambda s, r: (s.tournament_id,)),
+    BenchQuery("xp_top_placement", TOP_PLACEMENT, lambda s, r: (s.tournament_id, 1)),
+]
@@ -0,0 +1,161 @@
+"""
+Benchmark the record listing embed builders against the per-row builders they replaced.
+
+    python -m benchmarks.render --rows 10k
+
+Both builders render the same synthetic rows; the run fails if their embeds differ. The legacy PR
+builder emits an empty field when a page ends on a map's last level, which the current one doesn't,
+so empty fields are ignored when comparing.
+"""
+
+from __future__ import annotations
+
+import argparse
+import decimal
+import random
+import sys
+import timeit
+
+import core  # noqa: F401  (imported first to settle the utils <-> cogs import cycle)
+import utils
+from benchmarks.seed import parse_scale
+from benchmarks.times import legacy_pretty_record as pretty_record
+from utils.records import make_ordinal
+
+
+def legacy_all_levels_records_embed(records, title, single=False):
+    embed_list = []
+    embed = utils.DoomEmbed(title=title)
+    for i, record in enumerate(records):
+        if record["tournament"]:
+            description = (
+                f"┣ `Name` {record['nickname']}\n"
+                f"┗ `Record` [{pretty_record(record['record'])}]"
+                f"({record['screenshot']}) "
+                f"{utils.TROPHY}\n"
+            )
+        elif not record["video"]:
+            description = (
+                f"┣ `Name` {record['nickname']}\n"
+                f"┗ `Record` [{pretty_record(record['record'])}]"
+                f"({record['screenshot']}) "
+                f"{utils.HALF_VERIFIED}\n"
+            )
+        else:
+            description = (
+                f"┣ `Name` {record['nickname']}\n"
+                f"┣ `Record` [{pretty_record(record['record'])}]"
+                f"({record['screenshot']}) "
+                f"{utils.VERIFIED}\n "
+                f"┗ `Video` [Link]({record['video']})\n"
+            )
+        embed.add_field(
+            name=(
+                f"{utils.PLACEMENTS.get(record['rank_num'], '')} {make_ordinal(record['rank_num'])}"
+                if single
+                else record["level_name"]
+            ),
+            value=description,
+            inline=False,
+        )
+        if utils.split_nth_conditional(i, 9, records):
+            embed = utils.set_embed_thumbnail_maps(record["map_name"], embed)
+            embed_list.append(embed)
+            embed = utils.DoomEmbed(title=title)
+    return embed_list
+
+
+def legacy_pr_records_embed(records, title):
+    embed_list = []
+    embed = utils.DoomEmbed(title=title)
+    description = ""
+    cur_code = f"{records[0]['map_name']} by {records[0]['creators']} ({records[0]['map_code']})"
+    for i, record in enumerate(records):
+        if cur_code != f"{record['map_name']} by {record['creators']} ({record['map_code']})":
+            cur_code, description = _legacy_add_pr_field(cur_code, description, embed, record)
+        if not record["video"]:
+            description += (
+                f"┣ `Level` ***{record['level_name']}***\n"
+                f"┣ `Record` [{pretty_record(record['record'])}]"
+                f"({record['screenshot']}) "
+                f"{utils.HALF_VERIFIED}\n┃\n"
+            )
+        else:
+            description += (
+                f"┣ `Level` ***{record['level_name']}***\n"
+                f"┣ `Record` [{pretty_record(record['record'])}]"
+                f"({record['screenshot']})"
+                f"{utils.VERIFIED}\n "
+                f"┣ `Video` [Link]({record['video']})\n┃\n"
+            )
+        if utils.split_nth_conditional(i, 9, records):
+            cur_code, description = _legacy_add_pr_field(cur_code, description, embed, record)
+            embed_list.append(embed)
+            embed = utils.DoomEmbed(title=title)
+    return embed_list
+
+
+def _legacy_add_pr_field(cur_code, description, embed, record):
+    embed.add_field(name=f"{cur_code}", value="┗".join(description[:-3].rsplit("┣", 1)), inline=False)
+    return f"{record['map_name']} by {record['creators']} ({record['map_code']})", ""
+
+
+def make_rows(count: int, rng: random.Random) -> list[dict]:
+    """Rows ordered by map code like the record queries, 1-30 levels per map."""
+    rows = []
+    while len(rows) < count:
+        map_code = f"{len(rows):06X}"
+        map_name = rng.choice(list(utils.embed_assets._REGISTRY))
+        for level in range(rng.randint(1, 30)):
+            record = decimal.Decimal(rng.randint(-500, 400_000)) / 100
+            rows.append(
+                {
+                    "map_code": map_code,
+                    "map_name": map_name,
+                    "creators": "Someone, Someone Else",
+                    "level_name": f"Level {level}",
+                    "nickname": f"user{rng.randrange(1000)}",
+                    "record": record,
+                    "screenshot": f"https://example.com/{len(rows)}.png",
+                    "video": f"https://youtu.be/{len(rows)}" if rng.random() < 0.5 else None,
+                    "tournament": rng.random() < 0.1,
+                    "rank_num": len(rows) + 1,
+                }
+            )
+    return rows[:count]
+
+
+def _rendered(embeds: list) -> list[dict]:
+    rendered = [embed.to_dict() for embed in embeds]
+    for embed in rendered:
+        embed["fields"] = [field for field in embed.get("fields", []) if field["value"]]
+    return rendered
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.render", description=__doc__.split("\n\n")[0].strip())
+    parser.add_argument("--rows", default="10k", help="Number of record rows, e.g. 1k, 10k.")
+    parser.add_argument("--repeat", type=int, default=5, help="Timed runs per builder; the best is reported.")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    rows = make_rows(parse_scale(args.rows), random.Random(args.seed))
+    cases = {
+        "all_levels_records_embed": (legacy_all_levels_records_embed, utils.all_levels_records_embed, ()),
+        "all_levels_records_embed_single": (legacy_all_levels_records_embed, utils.all_levels_records_embed, (True,)),
+        "pr_records_embed": (legacy_pr_records_embed, utils.pr_records_embed, ()),
+    }
+    failed = False
+    for name, (legacy, current, extra) in cases.items():
+        if _rendered(legacy(rows, "Title", *extra)) != _rendered(current(rows, "Title", *extra)):
+            print(f"{name}: output differs from the legacy builder", file=sys.stderr)
+            failed = True
+            continue
+        old = min(timeit.repeat(lambda: legacy(rows, "Title", *extra), number=1, repeat=args.repeat))
+        new = min(timeit.repeat(lambda: current(rows, "Title", *extra), number=1, repeat=args.repeat))
+        print(f"{name:<32} legacy {old * 1000:8.1f}ms  current {new * 1000:8.1f}ms  x{old / new:.2f}")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,219 @@
+"""Synthetic data for the benchmark database."""
+
+from __future__ import annotations
+
+import dataclasses
+import datetime
+import decimal
+import random
+import string
+
+import asyncpg
+
+CATEGORIES = ["Time Attack", "Mildcore", "Hardcore", "Bonus"]
+RANKS = ["Unranked", "Gold", "Diamond", "Grandmaster"]
+DIFFICULTIES = ["Easy", "Medium", "Hard", "Expert"]
+MAP_NAMES = ["Hanamura", "Ilios", "Nepal", "Busan", "Dorado", "Numbani", "Oasis", "Paris", "Petra", "Rialto"]
+MAP_TYPES = ["Single", "Multilevel", "Pioneer", "Time Attack", "Hardcore", "Tutorial"]
+RECORD_CHANNELS = [813768098191769640, 979491570237730817]
+
+
+@dataclasses.dataclass
+class SeedInfo:
+    """What the seeder created, used to pick realistic query arguments."""
+
+    user_ids: list[int]
+    map_codes: list[str]
+    levels: list[tuple[str, str]]
+    categories: list[str]
+    tournament_id: int
+    season: int
+
+
+def parse_scale(value: str) -> int:
+    """Parse counts such as ``10k`` or ``1M``."""
+    value = value.strip().lower()
+    multiplier = {"k": 1_000, "m": 1_000_000}.get(value[-1], 1)
+    if multiplier != 1:
+        value = value[:-1]
+    return int(float(value) * multiplier)
+
+
+def _map_code(rng: random.Random) -> str:
+    return "".join(rng.choices(string.ascii_uppercase + string.digits, k=rng.randint(4, 6)))
+
+
+def _record(rng: random.Random, low: float = 5, high: float = 3600) -> decimal.Decimal:
+    return decimal.Decimal(f"{rng.uniform(low, high):.2f}")
+
+
+async def seed(
+    connection: asyncpg.Connection,
+    *,
+    records: int,
+    users: int,
+    maps: int,
+    tournaments: int = 20,
+    seed_value: int = 0,
+) -> SeedInfo:
+    """Fill an empty schema with ``records`` map records spread over ``users`` and ``maps``."""
+    rng = random.Random(seed_value)
+    now = datetime.datetime.now(datetime.timezone.utc)
+
+    user_ids = rng.sample(range(10**17, 10**18), users)
+    await connection.copy_records_to_table(
+        "users",
+        records=[(user_id, f"user{i}", rng.random() > 0.1) for i, user_id in enumerate(user_ids)],
+        columns=["user_id", "nickname", "alertable"],
+    )
+
+    map_codes: set[str] = set()
+    while len(map_codes) < maps:
+        map_codes.add(_map_code(rng))
+    map_code_list = sorted(map_codes)
+    await connection.copy_records_to_table(
+        "maps",
+        records=[
+            (
+                code,
+                rng.choice(MAP_NAMES),
+                rng.sample(MAP_TYPES, rng.randint(1, 2)),
+                "Synthetic map",
+                rng.random() < 0.2,
+            )
+            for code in map_code_list
+        ],
+        columns=["map_code", "map_name", "map_type", "desc", "official"],
+    )
+    await connection.copy_records_to_table(
+        "map_creators",
+        records=[(code, creator) for code in map_code_list for creator in set(rng.choices(user_ids, k=rng.randint(1, 2)))],
+        columns=["map_code", "user_id"],
+    )
+    levels = [(code, f"Level {i}") for code in map_code_list for i in range(1, rng.randint(2, 16))]
+    await connection.copy_records_to_table("map_levels", records=levels, columns=["map_code", "level"])
+
+    record_rows = []
+    ratings: dict[tuple[str, str, int], int] = {}
+    for i in range(records):
+        map_code, level_name = rng.choice(levels)
+        user_id = rng.choice(user_ids)
+        verified = rng.random() > 0.05
+        record_rows.append(
+            (
+                map_code,
+                user_id,
+                level_name,
+                _record(rng),
+                f"https://discord.com/channels/1/2/{i}",
+                "https://youtu.be/synthetic" if rng.random() < 0.4 else None,
+                10**17 + i,
+                rng.choice(RECORD_CHANNELS),
+                None if verified else 2 * 10**17 + i,
+                verified,
+                now - datetime.timedelta(minutes=rng.randint(0, 3 * 365 * 24 * 60)),
+            )
+        )
+        if rng.random() < 0.3:
+            ratings[(map_code, level_name, user_id)] = rng.randint(1, 6)
+    await connection.copy_records_to_table(
+        "records",
+        records=record_rows,
+        columns=[
+            "map_code",
+            "user_id",
+            "level_name",
+            "record",
+            "screenshot",
+            "video",
+            "message_id",
+            "channel_id",
+            "hidden_id",
+            "verified",
+            "inserted_at",
+        ],
+    )
+    await connection.copy_records_to_table(
+        "map_level_ratings",
+        records=[(*key, rating) for key, rating in ratings.items()],
+        columns=["map_code", "level", "user_id", "rating"],
+    )
+
+    await connection.copy_records_to_table("tournament_ranks", records=[(c,) for c in CATEGORIES], columns=["value"])
+    await connection.copy_records_to_table(
+        "user_ranks",
+        records=[(user_id, category, rng.choice(RANKS)) for user_id in user_ids[::2] for category in CATEGORIES],
+        columns=["user_id", "category", "value"],
+    )
+
+    tournament_id = 0
+    tournament_records = []
+    for t in range(tournaments):
+        start = now - datetime.timedelta(days=7 * (tournaments - t))
+        tournament_id = await connection.fetchval(
+            'INSERT INTO tournament (title, start, "end", active) VALUES ($1, $2, $3, $4) RETURNING id;',
+            f"Tournament {t}",
+            start,
+            start + datetime.timedelta(days=7),
+            t == tournaments - 1,
+        )
+        await connection.executemany(
+            "INSERT INTO tournament_maps (id, code, level, creator, category) VALUES ($1, $2, $3, $4, $5);",
+            [(tournament_id, *rng.choice(levels), "Synthetic", category) for category in CATEGORIES],
+        )
+        await connection.executemany(
+            """
+            INSERT INTO tournament_missions (id, type, target, difficulty, category)
+            VALUES ($1, $2, $3, $4, $5);
+            """,
+            [
+                (tournament_id, rng.choice(["Sub Time", "Completion"]), rng.randint(60, 600), difficulty, category)
+                for category in CATEGORIES
+                for difficulty in DIFFICULTIES
+            ]
+            + [(tournament_id, "Top Placement", 1, "General", "General")],
+        )
+        for _ in range(max(records // 10 // tournaments, 1)):
+            tournament_records.append(
+                (
+                    tournament_id,
+                    rng.choice(user_ids),
+                    rng.choice(CATEGORIES),
+                    _record(rng, 20, 900),
+                    "https://cdn.discordapp.com/synthetic.png",
+                    start + datetime.timedelta(minutes=rng.randint(0, 7 * 24 * 60)),
+                )
+            )
+    await connection.copy_records_to_table(
+        "tournament_records",
+        records=tournament_records,
+        columns=["tournament_id", "user_id", "category", "record", "screenshot", "inserted_at"],
+    )
+
+    season = 3
+    await connection.copy_records_to_table(
+        "user_xp",
+        records=[
+            (user_id, rng.randint(0, 50_000), s) for s in range(1, season + 1) for user_id in user_ids if rng.random() < 0.6
+        ],
+        columns=["user_id", "xp", "season"],
+    )
+    duel_rows = []
+    for duel_id in range(users // 4):
+        for num, user_id in enumerate(rng.sample(user_ids, 2), start=1):
+            duel_rows.append((user_id, duel_id, num, True, rng.choice([-1, 0, 1])))
+    await connection.copy_records_to_table(
+        "user_duels",
+        records=duel_rows,
+        columns=["user_id", "duel_id", "num", "ready", "result"],
+    )
+    await connection.execute("ANALYZE;")
+
+    return SeedInfo(
+        user_ids=user_ids,
+        map_codes=map_code_list,
+        levels=levels,
+        categories=CATEGORIES,
+        tournament_id=tournament_id,
+        season=season,
+    )
@@ -0,0 +1,115 @@
+"""
+Micro-benchmark the record time formatter and parser against the datetime-based versions they replaced.
+
+    python -m benchmarks.times --samples 100k
+
+Before timing, the current functions are checked against the legacy ones on random times, negative
+times included. Times of 24 hours or more are left out of the formatter check because the legacy
+formatter wrapped them into the next day. The parser must accept everything the formatter produces
+and format back to the same string, except ``-0.00``.
+"""
+
+from __future__ import annotations
+
+import argparse
+import datetime
+import decimal
+import random
+import sys
+import timeit
+
+import core  # noqa: F401  (imported first to settle the utils <-> cogs import cycle)
+from benchmarks.seed import parse_scale
+from utils.times import pretty_record, pretty_records, time_convert
+
+
+def legacy_time_convert(string: str) -> float:
+    negative = -1 if string[0] == "-" else 1
+    time = string.split(":")
+    match len(time):
+        case 1:
+            res = float(time[0])
+        case 2:
+            res = float((int(time[0]) * 60) + (negative * float(time[1])))
+        case 3:
+            res = float((int(time[0]) * 3600) + (negative * (int(time[1]) * 60)) + (negative * float(time[2])))
+        case _:
+            raise ValueError("Failed to match any cases.")
+    return res
+
+
+def legacy_pretty_record(record: decimal.Decimal | float) -> str:
+    record = float(record)
+    negative = "-" if record < 0 else ""
+    dt = datetime.datetime.min + datetime.timedelta(seconds=abs(record))
+    hour_remove = 0
+    seconds_remove = -4
+    if dt.hour == 0 and dt.minute == 0:
+        hour_remove = 6
+        if dt.second < 10:
+            hour_remove += 1
+    elif dt.hour == 0:
+        hour_remove = 3
+        if dt.minute < 10:
+            hour_remove = 4
+    return negative + dt.strftime("%H:%M:%S.%f")[hour_remove:seconds_remove]
+
+
+def make_times(count: int, rng: random.Random) -> list[decimal.Decimal | float]:
+    """Half ``numeric(10, 2)`` values as asyncpg returns them, half arbitrary floats; 10% negative."""
+    times = []
+    for i in range(count):
+        magnitude = rng.choice((10, 600, 86_399))
+        sign = -1 if rng.random() < 0.1 else 1
+        if i % 2:
+            times.append(sign * rng.uniform(0, magnitude))
+        else:
+            times.append(sign * decimal.Decimal(rng.randrange(magnitude * 100)) / 100)
+    return times
+
+
+def check(times: list[decimal.Decimal | float]) -> list[str]:
+    failures = []
+    bulk = pretty_records(times)
+    for record, formatted in zip(times, bulk):
+        expected = legacy_pretty_record(record)
+        if pretty_record(record) != expected or formatted != expected:
+            failures.append(f"pretty_record({record!r}): {pretty_record(record)!r} / {formatted!r} != {expected!r}")
+            continue
+        if time_convert(expected) != legacy_time_convert(expected):
+            failures.append(f"time_convert({expected!r}): {time_convert(expected)!r} != {legacy_time_convert(expected)!r}")
+        elif time_convert(expected) and pretty_record(time_convert(expected)) != expected:
+            failures.append(f"round trip {expected!r} -> {pretty_record(time_convert(expected))!r}")
+    return failures
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.times", description=__doc__.split("\n\n")[0].strip())
+    parser.add_argument("--samples", default="100k", help="Number of random times, e.g. 10k, 1M.")
+    parser.add_argument("--repeat", type=int, default=5, help="Timed runs per function; the best is reported.")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    times = make_times(parse_scale(args.samples), random.Random(args.seed))
+    failures = check(times)
+    for line in failures[:20]:
+        print(line, file=sys.stderr)
+    if failures:
+        print(f"{len(failures)} mismatches", file=sys.stderr)
+        return 1
+
+    strings = [legacy_pretty_record(record) for record in times]
+    cases = {
+        "pretty_record": (lambda: [legacy_pretty_record(t) for t in times], lambda: [pretty_record(t) for t in times]),
+        "pretty_records": (lambda: [legacy_pretty_record(t) for t in times], lambda: pretty_records(times)),
+        "time_convert": (lambda: [legacy_time_convert(s) for s in strings], lambda: [time_convert(s) for s in strings]),
+    }
+    for name, (legacy, current) in cases.items():
+        old = min(timeit.repeat(legacy, number=1, repeat=args.repeat)) / len(times)
+        new = min(timeit.repeat(current, number=1, repeat=args.repeat)) / len(times)
+        print(f"{name:<16} legacy {old * 1e9:7.0f}ns  current {new * 1e9:7.0f}ns  x{old / new:.2f}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -6,6 +6,7 @@ import typing
 from discord import app_commands
 
 if typing.TYPE_CHECKING:
+    import database
     from core import DoomItx
 
 EXTENSIONS = [module.name for module in pkgutil.iter_modules(__path__, f"{__package__}.")]
@@ -38,11 +39,25 @@ async def autocomplete(
     return response
 
 
+async def search_autocomplete(
+    itx: DoomItx,
+    kind: database.SearchKind,
+    current: str,
+    *,
+    map_code: str | None = None,
+) -> list[app_commands.Choice[str]]:
+    """Choices from ``Database.search``, for when the in-memory choices aren't loaded."""
+    rows = await itx.client.database.search(kind, current, 25, map_code=map_code)
+    return [app_commands.Choice(name=row["name"], value=row["value"]) for row in rows]
+
+
 async def exercise_name_autocomplete(itx: DoomItx, current: str) -> list[app_commands.Choice[str]]:
     return await autocomplete(current, itx.client.exercise_names)
 
 
 async def tags_autocomplete(itx: DoomItx, current: str) -> list[app_commands.Choice[str]]:
+    if not itx.client.tag_choices:
+        return await search_autocomplete(itx, "tag", current)
     return await autocomplete(current, itx.client.tag_choices)
 
 
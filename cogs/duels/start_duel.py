@@ -65,10 +65,10 @@ class Duels(commands.Cog):
             raise NotEnoughXP
 
         if not map_code:
-            map_code = await self._get_random_map()
-            level = await self._get_random_level(map_code)
+            map_code = self._get_random_map()
+            level = self._get_random_level(map_code)
         elif map_code and not level:
-            level = await self._get_random_level(map_code)
+            level = self._get_random_level(map_code)
 
         start = discord.utils.utcnow() + datetime.timedelta(days=1)
         end = (
@@ -159,18 +159,9 @@ class Duels(commands.Cog):
         row = await self.bot.database.fetchrow(query, player1, player2, wager)
         return False if not row else all((row["p1_xp"], row["p2_xp"]))
 
-    async def _get_random_map(self):
-        query = """
-            SELECT map_code FROM maps OFFSET floor(random() * (SELECT count(*) FROM maps)) LIMIT 1;
-        """
-        return await self.bot.database.fetchval(query)
+    def _get_random_map(self) -> str | None:
+        return self.bot.map_picker.random_map()
 
-    async def _get_random_level(self, map_code: str):
-        query = """
-            SELECT level 
-            FROM map_levels 
-            WHERE map_code = $1 
-            OFFSET floor(random() * (SELECT count(*) FROM map_levels WHERE map_code = $1)) 
-            LIMIT 1;
-        """
-        return await self.bot.database.fetchval(query, map_code)
+    def _get_random_level(self, map_code: str) -> str | None:
+        _, level = self.bot.map_picker.random_level(map_code) or (None, None)
+        return level
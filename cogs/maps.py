@@ -7,7 +7,6 @@ import discord
 from discord import app_commands
 from discord.ext import commands
 
-import database
 import utils
 import views
 
@@ -62,6 +61,7 @@ class Maps(commands.Cog):
             creator,
         )
         itx.client.map_cache[map_code]["user_ids"].remove(creator)
+        itx.client.map_stats.remove_creator(map_code, creator)
 
         await itx.edit_original_response(
             content=(
@@ -91,6 +91,7 @@ class Maps(commands.Cog):
             creator,
         )
         itx.client.map_cache[map_code]["user_ids"].append(creator)
+        itx.client.map_stats.add_creator(map_code, creator)
 
         await itx.edit_original_response(
             content=(
@@ -124,6 +125,7 @@ class Maps(commands.Cog):
         )
         itx.client.map_cache[map_code]["levels"].append(new_level_name)
         itx.client.map_cache[map_code]["choices"].append(app_commands.Choice(name=new_level_name, value=new_level_name))
+        itx.client.map_picker.add_level(map_code, new_level_name)
 
     @_level.command(**utils.remove_level)
     @app_commands.describe(**utils.remove_level_args)
@@ -154,6 +156,7 @@ class Maps(commands.Cog):
                 itx.client.map_cache[map_code]["choices"],
             )
         )
+        itx.client.map_picker.remove_level(map_code, level_name)
 
     @staticmethod
     async def _check_creator_code(itx, map_code, new_level_name=None):
@@ -204,6 +207,7 @@ class Maps(commands.Cog):
                 itx.client.map_cache[map_code]["choices"],
             )
         )
+        itx.client.map_picker.rename_level(map_code, level_name, new_level_name)
 
     @app_commands.command(**utils.submit_map)
     @app_commands.describe(**utils.submit_map_args)
@@ -236,166 +240,69 @@ class Maps(commands.Cog):
         map_code: app_commands.Transform[str, utils.MapCodeAutoTransformer] | None = None,
     ) -> None:
         await itx.response.defer(ephemeral=True)
-
-        query = f"""
-            WITH valid_ratings AS (
-                SELECT mr.map_code, level, rating, mr.user_id, level_name 
-                FROM map_level_ratings mr
-                LEFT JOIN records r on mr.user_id = r.user_id 
-                    AND level_name = level
-                    AND r.map_code = mr.map_code
-            )
-            SELECT map_code,
-                   map_type,
-                   map_name,
-                   "desc",
-                   official,
-                   image,
-                   creators,
-                   creators_ids,
-                   avg(rating) as rating
-            FROM (SELECT mc.map_code,
-                         array_to_string((map_type), ', ')     as map_type,
-                         map_name,
-                         "desc",
-                         official,
-                         image,
-                         string_agg(distinct (nickname), ', ') as creators,
-                         array_agg(distinct mc.user_id)        as creators_ids,
-                         AVG(COALESCE(rating, 0))              as rating
-                  FROM maps
-                           JOIN map_creators mc on maps.map_code = mc.map_code
-                           JOIN users u on u.user_id = mc.user_id
-                           LEFT JOIN valid_ratings vr on maps.map_code = vr.map_code
-                  WHERE ($1::text IS NULL OR $1 = ANY (map_type))
-                    AND ($2::text IS NULL OR map_name = $2)
-                    AND ($3::text IS NULL OR maps.map_code = $3)
-                  GROUP BY map_type, mc.map_code, map_name, "desc", official, rating, image
-                  HAVING ($4::bigint IS NULL OR $4 = ANY(array_agg(distinct (mc.user_id))))
-                  ORDER BY map_code) layer0
-            GROUP BY map_code, map_type, map_name, "desc", official, creators, creators_ids, image
-            ORDER BY map_code
-            """
-        maps = await itx.client.database.fetch(
-            query,
-            map_type,
-            map_name,
-            map_code,
-            creator,
-        )
+        maps = itx.client.map_stats.search(map_type=map_type, map_name=map_name, creator=creator, map_code=map_code)
         if not maps:
             raise utils.NoMapsFoundError
-        embeds = self.create_map_embeds(maps)
-        if map_code and maps[0].get("image", None):
-            embeds[0].set_image(url=maps[0].image)
-        view = views.Paginator(embeds, itx.user, None)
+        pages = views.LazyPages(maps, 10, self.create_map_embed)
+        if map_code and maps[0]["image"]:
+            pages[0].set_image(url=maps[0]["image"])
+        view = views.Paginator(pages, itx.user, None)
         await view.start(itx)
 
     @app_commands.command()
     @app_commands.guilds(discord.Object(id=utils.GUILD_ID))
-    async def random_map(self, itx: DoomItx, random_level: bool | None = False) -> None:
+    async def random_map(
+        self,
+        itx: DoomItx,
+        random_level: bool | None = False,
+        rating_weighted: bool | None = False,
+    ) -> None:
         await itx.response.defer(ephemeral=True)
-        query = """
-            WITH valid_ratings AS (
-                SELECT m.map_code, ml.level, rating, mr.user_id 
-                FROM maps m
-                LEFT JOIN map_levels ml on m.map_code = ml.map_code
-                LEFT JOIN map_level_ratings mr ON m.map_code = mr.map_code AND ml.level = mr.level
-                LEFT JOIN records r on mr.user_id = r.user_id 
-                    AND level_name = ml.level
-                    AND r.map_code = mr.map_code
-            ),
-            levels_with_ratings AS (
-                SELECT map_code, level, avg(rating) as avg_rating FROM valid_ratings GROUP BY map_code, level
-                ),
-            random_map_level AS (
-            SELECT map_code, level, avg_rating FROM levels_with_ratings offset random() * (select count(*) from levels_with_ratings) limit 1)
-            SELECT map_code,
-                   map_type,
-                   map_name,
-                   "desc",
-                   official,
-                   image,
-                   creators,
-                   creators_ids,
-                   level,
-                   avg_rating,
-                   avg(rating) as rating
-            FROM (SELECT mc.map_code,
-                         array_to_string((map_type), ', ')     as map_type,
-                         map_name,
-                         "desc",
-                         official,
-                         image,
-                         rml.level,
-                         avg_rating,
-                         string_agg(distinct (nickname), ', ') as creators,
-                         array_agg(distinct mc.user_id)        as creators_ids,
-                         AVG(rating)              as rating
-                  FROM maps
-                           JOIN map_creators mc on maps.map_code = mc.map_code
-                           JOIN users u on u.user_id = mc.user_id
-                           LEFT JOIN random_map_level rml on maps.map_code = rml.map_code
-                            LEFT JOIN valid_ratings vr on maps.map_code = vr.map_code
-                    WHERE (maps.map_code = rml.map_code)
-                  GROUP BY map_type, mc.map_code, map_name, "desc", official, image, rml.level, rml.avg_rating
-                  ORDER BY map_code) layer0 GROUP BY map_code,
-                   map_type,
-                   map_name,
-                   "desc",
-                   official,
-                   image,
-                   creators,
-                   creators_ids,
-                   level, avg_rating
-                   
-        """
-        embed = utils.DoomEmbed(title="Map Search")
-        embed.set_thumbnail(url=None)
-        _map = await itx.client.database.fetchrow(query)
+        level = None
+        if random_level or rating_weighted:
+            map_code, level = itx.client.map_picker.random_level(weighted=bool(rating_weighted)) or (None, None)
+        else:
+            map_code = itx.client.map_picker.random_map()
+        _map = itx.client.map_stats.get(map_code) if map_code else None
         if not _map:
             raise utils.NoMapsFoundError
-        embed = self.create_random_map_embeds(_map, random_level)
-        if _map.get("image", None):
-            embed.set_image(url=_map.image)
+        embed = self.create_random_map_embed(
+            _map,
+            level if random_level else None,
+            itx.client.map_picker.level_rating(map_code, level) if level else None,
+        )
+        if _map["image"]:
+            embed.set_image(url=_map["image"])
         view = views.Paginator([embed], itx.user, None)
         await view.start(itx)
 
-    def create_map_embeds(self, maps: list[database.DotRecord]) -> list[utils.Embed | utils.DoomEmbed]:
-        embed_list = []
+    def _map_field_value(self, _map: utils.MapStats) -> str:
+        return (
+            self.display_official(_map["official"]) + f"┣ `Rating` {utils.create_stars(utils.MapStatsStore.rating(_map))}\n"
+            f"┣ `Creator` {discord.utils.escape_markdown(utils.MapStatsStore.creators(_map, self.bot.all_users))}\n"
+            f"┣ `Map` {_map['map_name']}\n"
+            f"┣ `Type` {', '.join(_map['map_type'])}\n"
+            f"┗ `Description` {_map['desc']}"
+        )
+
+    def create_map_embed(self, maps: typing.Sequence[utils.MapStats]) -> utils.Embed | utils.DoomEmbed:
         embed = utils.DoomEmbed(title="Map Search")
-        for i, _map in enumerate(maps):
-            embed.add_description_field(
-                name=f"{_map['map_code']}",
-                value=(
-                    self.display_official(_map["official"]) + f"┣ `Rating` {utils.create_stars(_map['rating'])}\n"
-                    f"┣ `Creator` {discord.utils.escape_markdown(_map['creators'])}\n"
-                    f"┣ `Map` {_map['map_name']}\n"
-                    f"┣ `Type` {_map['map_type']}\n"
-                    f"┗ `Description` {_map['desc']}"
-                ),
-            )
-            if utils.split_nth_conditional(i, 10, maps):
-                embed_list.append(embed)
-                embed = utils.DoomEmbed(title="Map Search")
-        return embed_list
+        for _map in maps:
+            embed.add_description_field(name=f"{_map['map_code']}", value=self._map_field_value(_map))
+        return embed
 
-    def create_random_map_embeds(self, _map: database.DotRecord, level: bool) -> utils.Embed | utils.DoomEmbed:
+    def create_random_map_embed(
+        self,
+        _map: utils.MapStats,
+        level: str | None,
+        level_rating: float | None,
+    ) -> utils.Embed | utils.DoomEmbed:
         embed = utils.DoomEmbed(title="Map Search")
-        embed.add_description_field(
-            name=f"{_map['map_code']}",
-            value=(
-                self.display_official(_map["official"]) + f"┣ `Rating` {utils.create_stars(_map['rating'])}\n"
-                f"┣ `Creator` {discord.utils.escape_markdown(_map['creators'])}\n"
-                f"┣ `Map` {_map['map_name']}\n"
-                f"┣ `Type` {_map['map_type']}\n"
-                f"┗ `Description` {_map['desc']}"
-            ),
-        )
+        embed.add_description_field(name=f"{_map['map_code']}", value=self._map_field_value(_map))
         if level:
             embed.add_field(
                 name="Random Level",
-                value=f"{_map['level']} - {utils.create_stars(_map['avg_rating'])}",
+                value=f"{level} - {utils.create_stars(level_rating)}",
             )
         return embed
 
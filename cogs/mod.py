@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import typing
+from logging import getLogger
 
 import discord
 from discord import app_commands
@@ -13,6 +14,15 @@ if typing.TYPE_CHECKING:
     import core
     from core import DoomCtx, DoomItx
 
+logger = getLogger(__name__)
+
+# No newer submission, pending or verified, exists for the record ``r``'s user and level.
+_NOT_SUPERSEDED = """NOT EXISTS (
+    SELECT 1 FROM records n
+    WHERE n.user_id = r.user_id AND n.map_code = r.map_code AND n.level_name = r.level_name
+      AND n.inserted_at > r.inserted_at
+)"""
+
 
 class ModCommands(commands.Cog):
     def __init__(self, bot: core.Doom):
@@ -119,27 +129,164 @@ class ModCommands(commands.Cog):
         query = """
               WITH
                 latest AS (
-                  SELECT max(inserted_at)
+                  SELECT max(inserted_at) AS inserted_at
+                    FROM records
+                   WHERE
+                       user_id = $1
+                   AND map_code = $2
+                   AND level_name = $3
+                ),
+                deleted AS (
+                  DELETE
                     FROM records
                    WHERE
                        user_id = $1
                    AND map_code = $2
                    AND level_name = $3
+                   AND inserted_at = (SELECT inserted_at FROM latest)
                 )
-            DELETE
+            SELECT record, screenshot, video
               FROM records
              WHERE
                  user_id = $1
              AND map_code = $2
              AND level_name = $3
-             AND inserted_at = latest
+             AND verified = TRUE
+             AND inserted_at < (SELECT inserted_at FROM latest)
+             ORDER BY inserted_at DESC
+             LIMIT 1
         """
-        await self.bot.database.execute(
+        previous = await self.bot.database.fetchrow(
             query,
             user.id,
             map_code,
             level_name,
         )
+        # The user's next most recent verified record, if any, becomes their PR again.
+        if previous:
+            self.bot.record_index.set(user.id, map_code, level_name, utils.PersonalRecord(*previous.values()))
+        else:
+            self.bot.record_index.remove(user.id, map_code, level_name)
+
+    @mod.command(**utils.bulk_verify)
+    @app_commands.describe(**utils.bulk_verify_args)
+    async def bulk_verify(
+        self,
+        itx: DoomItx,
+        action: typing.Literal["Verify", "Reject"],
+        amount: app_commands.Range[int, 1, 100],
+        map_code: app_commands.Transform[str, utils.MapCodeRecordsTransformer] | None = None,
+        user: app_commands.Transform[int, utils.UserTransformer] | None = None,
+        reason: str = "No reason given.",
+    ):
+        await itx.response.defer(ephemeral=True)
+        verified = action == "Verify"
+        query = f"""
+            SELECT hidden_id, map_code, level_name
+            FROM records r
+            WHERE hidden_id IS NOT NULL
+              AND ($1::text IS NULL OR map_code = $1)
+              AND ($2::bigint IS NULL OR user_id = $2)
+              AND ($4 OR {_NOT_SUPERSEDED})
+            ORDER BY inserted_at
+            LIMIT $3;
+        """
+        # Verifying an older submission after a newer one would make the slower time the cached PR.
+        queued = await self.bot.database.fetch(query, map_code, user, amount, not verified)
+        if not queued:
+            raise utils.NoRecordsFoundError
+
+        view = views.Confirm(itx)
+        await itx.edit_original_response(
+            content=(
+                f"{action} these {len(queued)} records?\n"
+                + "\n".join(f"`{row['map_code']}` {row['level_name']}" for row in queued[:20])
+                + (f"\n...and {len(queued) - 20} more" if len(queued) > 20 else "")
+            ),
+            view=view,
+        )
+        await view.wait()
+        if not view.value:
+            return
+
+        async with self.bot.database.pool.acquire() as connection:
+            async with connection.transaction():
+                # Re-read under lock; some may have been handled or superseded since the preview.
+                query = f"""
+                    SELECT * FROM records r
+                    WHERE hidden_id = ANY($1::bigint[]) AND ($2 OR {_NOT_SUPERSEDED})
+                    ORDER BY inserted_at
+                    FOR UPDATE;
+                """
+                rows = await self.bot.database.fetch(
+                    query,
+                    [row["hidden_id"] for row in queued],
+                    not verified,
+                    connection=connection,
+                )
+                if verified:
+                    query = "UPDATE records SET verified=TRUE, hidden_id=null WHERE hidden_id=$1;"
+                    await self.bot.database.executemany(
+                        query,
+                        [(row["hidden_id"],) for row in rows],
+                        connection=connection,
+                    )
+                    query = """
+                        INSERT INTO verification_counts (user_id, amount)
+                        VALUES ($1, $2)
+                        ON CONFLICT (user_id)
+                            DO UPDATE SET amount = verification_counts.amount + excluded.amount;
+                    """
+                    if rows:
+                        await self.bot.database.execute(query, itx.user.id, len(rows), connection=connection)
+                else:
+                    query = "DELETE FROM records WHERE user_id=$1 AND map_code=$2 AND level_name=$3;"
+                    await self.bot.database.executemany(
+                        query,
+                        [(row["user_id"], row["map_code"], row["level_name"]) for row in rows],
+                        connection=connection,
+                    )
+        if verified and rows:
+            views.VerificationView.increment_verification_count(itx, len(rows))
+
+        for row in rows:
+            try:
+                views.VerificationView.update_record_index(itx, row, verified)
+                data = (
+                    views.VerificationView.accepted(itx, row)
+                    if verified
+                    else views.VerificationView.rejected(itx, row, reason)
+                )
+                self._dispatch_verification(itx, row, data)
+            except Exception:
+                # The records are already committed; don't let one row stop the rest from being announced.
+                logger.exception("Could not queue verification messages for record %s.", row["hidden_id"])
+        await itx.edit_original_response(
+            content=(
+                f"{'Verified' if verified else 'Rejected'} {len(rows)} records. "
+                "Messages and alerts are being sent in the background."
+            ),
+            view=None,
+        )
+
+    def _dispatch_verification(self, itx: DoomItx, row, data: dict[str, str]) -> None:
+        channel = itx.guild.get_channel(row["channel_id"])
+        if channel is not None:
+            original = channel.get_partial_message(row["message_id"])
+            self.bot.dispatcher.submit(("channel", row["channel_id"]), lambda: original.edit(content=data["edit"]))
+        queue = itx.guild.get_channel(utils.VERIFICATION_QUEUE)
+        if queue is not None:
+            self.bot.dispatcher.submit(
+                ("channel", utils.VERIFICATION_QUEUE), queue.get_partial_message(row["hidden_id"]).delete
+            )
+        member = itx.guild.get_member(row["user_id"])
+        if member and self.bot.all_users.get(row["user_id"], {}).get("alertable"):
+            message = views.VerificationView.direct_message(data)
+            self.bot.dispatcher.submit(
+                ("dm", row["user_id"]),
+                lambda: member.send(message),
+                key=("verification", row["hidden_id"]),
+            )
 
     @mod.command(**utils.change_name)
     @app_commands.describe(**utils.change_name_args)
@@ -0,0 +1,123 @@
+from __future__ import annotations
+
+import typing
+
+from discord.ext import commands
+
+import utils
+
+if typing.TYPE_CHECKING:
+    import core
+    from core import DoomCtx
+
+
+class Perf(commands.Cog):
+    """Owner-only performance reports."""
+
+    def __init__(self, bot: core.Doom):
+        self.bot = bot
+
+    @commands.group(invoke_without_command=True)
+    @commands.is_owner()
+    async def perf(self, ctx: DoomCtx):
+        """Event loop lag, the slowest callbacks since startup and loaded asset sizes."""
+        monitor = self.bot.loop_monitor
+        lag = monitor.lag_summary()
+        lines = [
+            f"**Loop lag** over {len(monitor.lag)} probes: "
+            f"p50 {lag['p50'] * 1000:.1f}ms, p99 {lag['p99'] * 1000:.1f}ms, max {lag['max'] * 1000:.1f}ms",
+            f"**Slow callbacks** (over {monitor.slow_callback * 1000:.0f}ms):",
+        ]
+        slow = monitor.slow_callbacks()
+        lines += [f"`{s.label}` x{s.count}, {s.total * 1000:.0f}ms total, {s.longest * 1000:.0f}ms max" for s in slow] or [
+            "None"
+        ]
+        sizes = utils.asset_sizes()
+        lines.append(
+            "**Assets:** " + (", ".join(f"{name} {size / 1024:.0f} KiB" for name, size in sizes.items()) or "none loaded")
+        )
+        await ctx.send("\n".join(lines)[:2000])
+
+    @perf.command(name="threshold")
+    @commands.is_owner()
+    async def perf_threshold(self, ctx: DoomCtx, milliseconds: float):
+        """Set how long a callback may block the event loop before it is logged."""
+        self.bot.loop_monitor.slow_callback = milliseconds / 1000
+        await ctx.send(f"Slow callback threshold set to {milliseconds:g}ms.")
+
+    @perf.command(name="commands")
+    @commands.is_owner()
+    async def perf_commands(self, ctx: DoomCtx, limit: int = 15):
+        """Commands by total wall time: latency percentiles and average queries, DB and API time."""
+        top = self.bot.metrics.top(limit)
+        if not top:
+            await ctx.send("No commands measured yet.")
+            return
+        rows = [f"{'command (ms)':<28} {'n':>5} {'p50':>6} {'p99':>6} {'defer99':>7} {'q':>4} {'db':>6} {'api':>6}"]
+        for name, stats in top:
+            rows.append(
+                f"{name[:28]:<28} {stats.wall.count:>5} "
+                f"{stats.wall.percentile(50) * 1000:>6.0f} {stats.wall.percentile(99) * 1000:>6.0f} "
+                f"{stats.defer.percentile(99) * 1000:>7.0f} {stats.queries.mean:>4.1f} "
+                f"{stats.db.mean * 1000:>6.0f} {stats.api.mean * 1000:>6.0f}"
+            )
+        table = "\n".join(rows)[:1980]
+        await ctx.send(f"```\n{table}\n```")
+
+    @perf.command(name="trace")
+    @commands.is_owner()
+    async def perf_trace(self, ctx: DoomCtx, action: typing.Literal["on", "off", "reset"]):
+        """Turn query tracing on or off, or clear what it has collected."""
+        tracer = self.bot.query_tracer
+        if action == "on":
+            tracer.start()
+        elif action == "off":
+            tracer.stop()
+        else:
+            tracer.reset()
+        await ctx.send(f"Query tracing is {'on' if tracer.enabled else 'off'}.")
+
+    @perf.command(name="queries")
+    @commands.is_owner()
+    async def perf_queries(self, ctx: DoomCtx, limit: int = 8):
+        """Traced queries by total time, with their top callers."""
+        tracer = self.bot.query_tracer
+        top = tracer.top(limit)
+        if not top:
+            await ctx.send(f"No queries traced yet. Tracing is {'on' if tracer.enabled else 'off'}.")
+            return
+        entries = []
+        for query, stats in top:
+            callers = ", ".join(f"{caller} x{count}" for caller, count in stats.callers.most_common(3))
+            entries.append(
+                f"{stats.total * 1000:.0f}ms total, {stats.count} calls, "
+                f"{stats.mean * 1000:.1f}ms avg, {stats.max * 1000:.0f}ms max, {stats.rows} rows\n"
+                f"{callers}\n{query[:300]}"
+            )
+        text = "\n\n".join(entries)[:1980]
+        await ctx.send(f"```\n{text}\n```")
+
+    @perf.command(name="slow")
+    @commands.is_owner()
+    async def perf_slow(self, ctx: DoomCtx, index: int | None = None):
+        """Recent slow queries, newest first. Pass an index to see its plan."""
+        slow = list(reversed(self.bot.query_tracer.slow))
+        if not slow:
+            await ctx.send("No slow queries recorded.")
+            return
+        if index is None:
+            lines = [
+                f"{i}. {trace.duration * 1000:.0f}ms, {trace.rows} rows, {trace.operation or trace.caller}: "
+                f"{trace.fingerprint[:120]}"
+                for i, trace in enumerate(slow)
+            ]
+            text = "\n".join(lines)[:1980]
+        else:
+            trace = slow[min(max(index, 0), len(slow) - 1)]
+            plan = self.bot.query_tracer.plans.get(trace.fingerprint, "No plan captured.")
+            text = f"{trace.fingerprint}\n\n{plan}"[:1980]
+        await ctx.send(f"```\n{text}\n```")
+
+
+async def setup(bot: core.Doom):
+    await bot.add_cog(Perf(bot))
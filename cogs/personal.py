@@ -1,7 +1,6 @@
 from __future__ import annotations
 
 import asyncio
-import json
 import random
 import typing
 
@@ -16,9 +15,6 @@ if typing.TYPE_CHECKING:
     import core
     from core import DoomCtx, DoomItx
 
-with open("assets/emoji-data.json", "r", encoding="utf8") as f:
-    mapping = json.load(f)
-
 
 class Personal(commands.Cog):
     length = 0
@@ -53,6 +49,7 @@ class Personal(commands.Cog):
             value_bool,
             itx.user.id,
         )
+        itx.client.all_users[itx.user.id]["alertable"] = value_bool
 
         await itx.response.send_message(f"Alerts set to {value}.", ephemeral=True)
         # await itx.followup.send(await itx.translate("Testing123"), ephemeral=True)
@@ -77,7 +77,7 @@ class Records(commands.Cog):
             itx,
             f"{utils.TIME} Waiting for verification...\n",
         )
-        new_screenshot = await screenshot.to_file(filename="image.png")
+        image = await utils.Screenshot.from_attachment(screenshot)
 
         embed = utils.record_embed(
             {
@@ -93,13 +93,12 @@ class Records(commands.Cog):
             content=f"{itx.user.mention}, is this correct?",
             embed=embed,
             view=view,
-            attachments=[new_screenshot],
+            attachments=[image.to_file()],
         )
         await view.wait()
         if not view.value:
             return
-        new_screenshot2 = await screenshot.to_file(filename="image.png")
-        verification_msg = await itx.client.get_channel(utils.VERIFICATION_QUEUE).send(embed=embed, file=new_screenshot2)
+        verification_msg = await itx.client.get_channel(utils.VERIFICATION_QUEUE).send(embed=embed, file=image.to_file())
 
         if old_row and old_row["hidden_id"]:
             with contextlib.suppress(discord.NotFound):
@@ -127,17 +126,24 @@ class Records(commands.Cog):
         )
         if rating:
             query = """
-                INSERT INTO map_level_ratings (map_code, level, rating, user_id) 
-                VALUES ($1, $2, $3, $4)
-                ON CONFLICT (map_code, level, user_id) DO UPDATE SET rating = excluded.rating 
+                WITH old AS (
+                    SELECT rating FROM map_level_ratings WHERE map_code = $1 AND level = $2 AND user_id = $4
+                ), upsert AS (
+                    INSERT INTO map_level_ratings (map_code, level, rating, user_id) 
+                    VALUES ($1, $2, $3, $4)
+                    ON CONFLICT (map_code, level, user_id) DO UPDATE SET rating = excluded.rating 
+                )
+                SELECT rating FROM old;
             """
-            await itx.client.database.execute(
+            old_rating = await itx.client.database.fetchval(
                 query,
                 map_code,
                 level_name,
                 rating,
                 itx.user.id,
             )
+            itx.client.map_picker.rate(map_code, level_name, old_rating, rating)
+            itx.client.map_stats.rate(map_code, old_rating, rating)
 
     @app_commands.command(**utils.leaderboard)
     @app_commands.describe(**utils.leaderboard_args)
@@ -265,43 +271,20 @@ class Records(commands.Cog):
         if not user:
             user = itx.user
 
-        query = """
-        SELECT *
-        FROM (SELECT u.nickname,
-                     r.user_id,
-                     level_name,
-                     record,
-                     screenshot,
-                     video,
-                     verified,
-                     r.map_code,
-                     r.channel_id,
-                     r.message_id,
-                     m.map_name,
-                     m.creators,
-                     rank() OVER (
-                         partition by r.map_code, level_name
-                         order by inserted_at DESC
-                         ) as latest,
-                     RANK() OVER (
-                         PARTITION BY level_name
-                         ORDER BY record
-                         ) rank_num
-              FROM records r
-                       LEFT JOIN users u on r.user_id = u.user_id
-                       LEFT JOIN (SELECT m.map_code,
-                                         m.map_name,
-                                         string_agg(distinct (nickname), ', ') as creators
-                                  FROM maps m
-                                           LEFT JOIN map_creators mc on m.map_code = mc.map_code
-                                           LEFT JOIN users u on mc.user_id = u.user_id
-                                  GROUP BY m.map_code, m.map_name) m
-                                 on m.map_code = r.map_code) as ranks
-        WHERE user_id = $1 AND ($2 IS FALSE OR rank_num = 1) AND latest = 1 AND verified = TRUE
-        ORDER BY map_code, substr(level_name, 1, 5) <> 'Level', level_name;
-
-        """
-        records = await itx.client.database.fetch(query, user.id, wr_only)
+        records = []
+        for map_code, level_name, record in itx.client.record_index.personal_records(user.id, wr_only=bool(wr_only)):
+            _map = itx.client.map_stats.get(map_code)
+            records.append(
+                {
+                    "map_code": map_code,
+                    "level_name": level_name,
+                    "record": record.record,
+                    "screenshot": record.screenshot,
+                    "video": record.video,
+                    "map_name": _map["map_name"] if _map else None,
+                    "creators": utils.MapStatsStore.creators(_map, itx.client.all_users) if _map else None,
+                }
+            )
         if not records:
             raise utils.NoRecordsFoundError
         embeds = utils.pr_records_embed(
@@ -320,36 +303,27 @@ class Records(commands.Cog):
         user: app_commands.Transform[int, utils.UserTransformer] | None = None,
     ):
         await itx.response.defer(ephemeral=True)
+        leaderboard = itx.client.verifier_leaderboard
         if user:
-            query = """
-                SELECT v.user_id, amount, nickname
-                FROM verification_counts v
-                         LEFT JOIN users u on v.user_id = u.user_id
-                WHERE v.user_id = $1;
-            """
-            res = await itx.client.database.fetchrow(
-                query,
-                user,
+            await itx.edit_original_response(
+                content=f"{itx.client.all_users[user]['nickname']} has **{leaderboard.count(user)}** verifications!"
+            )
+            return
+        if not leaderboard:
+            raise utils.NoRecordsFoundError
+        pages = leaderboard.pages(lambda entries: views.LazyPages(entries, 20, self._verification_page(entries)))
+        view = views.Paginator(pages, itx.user)
+        await view.start(itx)
+
+    def _verification_page(self, entries: list[tuple[int, int]]) -> typing.Callable[[typing.Sequence[tuple[int, int]]], str]:
+        def render(page: typing.Sequence[tuple[int, int]]) -> str:
+            return "".join(
+                f"`{utils.make_ordinal(utils.VerifierLeaderboard.entry_rank(entries, entry)):^6}` `{-entry[0]:^6}` "
+                f"`{self.bot.all_users.get(entry[1], {}).get('nickname', entry[1])}`\n"
+                for entry in page
             )
-            await itx.edit_original_response(content=f"{res['nickname']} has **{res['amount']}** verifications!")
-        else:
-            query = """
-                SELECT v.user_id,
-                       amount,
-                       nickname,
-                       RANK() OVER (
-                           ORDER BY amount DESC
-                           ) rank
-                FROM verification_counts v
-                         LEFT JOIN users u on v.user_id = u.user_id
-                ORDER BY amount DESC;
-            """
-            res = await itx.client.database.fetch(query)
-            leaderboard = ""
-            for placement, record in enumerate(res):
-                leaderboard += f"`{utils.make_ordinal(record['rank']):^6}` `{record['amount']:^6}` `{record['nickname']}`\n"
 
-            await itx.edit_original_response(content=leaderboard)
+        return render
 
 
 async def setup(bot):
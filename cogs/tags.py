@@ -28,8 +28,13 @@ class Tags(discord.ext.commands.GroupCog, group_name=utils.tags["name"]):
         name: str,
     ) -> None:
         await itx.response.defer()
-        if name not in itx.client.tag_cache:
-            fuzzed_options = utils.fuzz_multiple(name, itx.client.tag_cache)
+        content = itx.client.tags.get(name)
+        if content is None:
+            fuzzed_options = itx.client.tags.suggest(name)
+            if not fuzzed_options:
+                embed = utils.DoomEmbed(title="Tags", description=f"Couldn't find `{name}`.")
+                await itx.edit_original_response(embed=embed)
+                return
             fuzz_desc = [f"{utils.NUMBER_EMOJI[i + 1]} - {x}\n" for i, x in enumerate(fuzzed_options)]
 
             embed = utils.DoomEmbed(
@@ -41,14 +46,7 @@ class Tags(discord.ext.commands.GroupCog, group_name=utils.tags["name"]):
             await view.wait()
 
             return
-        query = "SELECT * FROM tags WHERE name=$1;"
-        tag = await itx.client.database.fetchrow(
-            query,
-            name,
-        )
-
-        value = discord.utils.escape_mentions(tag["value"]).replace(r"\n", "\n")
-        await itx.edit_original_response(content=f"**{tag['name']}**\n\n{value}")
+        await itx.edit_original_response(content=content)
 
     @app_commands.command(**utils.create_tag)
     async def create(self, itx: DoomItx):
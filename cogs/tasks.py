@@ -26,6 +26,9 @@ class Tasks(commands.Cog):
         self.cache_map_names.start()
         self.cache_map_types.start()
         self.cache_map_data.start()
+        self.cache_map_stats.start()
+        self.cache_verification_counts.start()
+        self.cache_records.start()
         self.cache_exercise_names.start()
         self.cache_exercise_names_search.start()
         self.cache_tags.start()
@@ -33,6 +36,7 @@ class Tasks(commands.Cog):
         self.cache_auto_join.start()
         self.cache_insults.start()
         self.cache_tournament.start()
+        self.cache_seasons.start()
 
     @commands.command()
     @commands.is_owner()
@@ -45,12 +49,16 @@ class Tasks(commands.Cog):
         self.cache_map_names.restart()
         self.cache_map_types.restart()
         self.cache_map_data.restart()
+        self.cache_map_stats.restart()
+        self.cache_verification_counts.restart()
+        self.cache_records.restart()
         self.cache_exercise_names.restart()
         self.cache_exercise_names_search.restart()
         self.cache_tags.restart()
         self.cache_keep_alives.restart()
         self.cache_auto_join.restart()
         self.cache_insults.restart()
+        self.cache_seasons.restart()
         await ctx.message.delete()
 
     @tasks.loop(hours=24, count=1)
@@ -170,6 +178,60 @@ class Tasks(commands.Cog):
                 user_ids=[y for y in row["user_ids"]],
                 choices=[app_commands.Choice(name=y, value=y) for y in row["levels"]],
             )
+        query = """
+            SELECT map_code, level, sum(rating) as total, count(rating) as count
+            FROM map_level_ratings
+            GROUP BY map_code, level;
+        """
+        ratings = await self.bot.database.fetch(query)
+        self.bot.map_picker.load(self.bot.map_cache, [tuple(row.values()) for row in ratings])
+
+    @tasks.loop(hours=24, count=1)
+    async def cache_map_stats(self):
+        query = """
+            SELECT m.map_code,
+                   map_name,
+                   map_type,
+                   "desc",
+                   official,
+                   image,
+                   coalesce(c.user_ids, '{}') as creator_ids,
+                   coalesce(r.total, 0)       as rating_total,
+                   coalesce(r.count, 0)       as rating_count
+            FROM maps m
+                     LEFT JOIN (SELECT map_code, array_agg(user_id) as user_ids
+                                FROM map_creators
+                                GROUP BY map_code) c ON m.map_code = c.map_code
+                     LEFT JOIN (SELECT map_code, sum(rating) as total, count(rating) as count
+                                FROM map_level_ratings
+                                GROUP BY map_code) r ON m.map_code = r.map_code;
+        """
+        rows = await self.bot.database.fetch(query)
+        self.bot.map_stats.load(utils.MapStats(**row) for row in rows)
+
+    @tasks.loop(hours=24, count=1)
+    async def cache_verification_counts(self):
+        query = "SELECT user_id, amount FROM verification_counts;"
+        rows = await self.bot.database.fetch(query)
+        self.bot.verifier_leaderboard.load((row["user_id"], row["amount"]) for row in rows)
+
+    @tasks.loop(hours=24, count=1)
+    async def cache_seasons(self):
+        query = "SELECT number, name, active FROM tournament_seasons;"
+        rows = await self.bot.database.fetch(query)
+        self.bot.seasons.load(rows)
+
+    @tasks.loop(hours=24, count=1)
+    async def cache_records(self):
+        query = """
+            SELECT DISTINCT ON (map_code, level_name, user_id)
+                   map_code, level_name, user_id, record, screenshot, video
+            FROM records
+            WHERE verified = TRUE
+            ORDER BY map_code, level_name, user_id, inserted_at DESC;
+        """
+        rows = await self.bot.database.fetch(query)
+        self.bot.record_index.load(rows)
 
     @tasks.loop(hours=24, count=1)
     async def cache_all_users(self):
@@ -188,6 +250,7 @@ class Tasks(commands.Cog):
         self.bot.tag_choices = []
         query = "SELECT * FROM tags;"
         rows = await self.bot.database.fetch(query)
+        self.bot.tags.load(rows)
         for row in rows:
             self.bot.tag_cache.append(row["name"])
             self.bot.tag_choices.append(app_commands.Choice(name=row["name"], value=row["name"]))
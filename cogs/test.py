@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import asyncio
 import datetime
+import functools
 import io
 import typing
 
@@ -146,8 +147,17 @@ class Test(commands.Cog):
         )
 
         for u in users:
-            await u.send(timeout_notice(name=u.name))
-            await u.timeout(datetime.timedelta(hours=1), reason=f"Cool off for an hour. {reason}")
+            # Same route so the notice goes out before the timeout lands.
+            itx.client.dispatcher.submit(
+                ("member", u.id),
+                functools.partial(u.send, timeout_notice(name=u.name)),
+                key=("timeout_notice", u.id),
+            )
+            itx.client.dispatcher.submit(
+                ("member", u.id),
+                functools.partial(u.timeout, datetime.timedelta(hours=1), reason=f"Cool off for an hour. {reason}"),
+                key=("timeout", u.id),
+            )
 
         content = (
             f"# Intervened in {itx.channel.mention}\n"
@@ -164,47 +174,62 @@ class Test(commands.Cog):
         self,
         ctx: DoomCtx,
         guilds: commands.Greedy[discord.Object],
-        spec: typing.Literal["~", "*", "^"] | None = None,
+        spec: typing.Literal["~", "~!", "*", "^", "+", "!"] | None = None,
     ) -> None:
         """
         ?sync -> global sync
         ?sync ~ -> sync current guild
+        ?sync ~! -> sync current guild, even if nothing changed
         ?sync * -> copies all global app commands to current guild and syncs
         ?sync ^ -> clears all commands from the current
                         guild target and syncs (removes guild commands)
+        ?sync + -> syncs global and every guild whose commands changed
+        ?sync ! -> global sync, even if nothing changed
         ?sync id_1 id_2 -> syncs guilds with id 1 and 2
+        ?sync id_1 id_2 ! -> syncs guilds with id 1 and 2, even if nothing changed
         >sync $ -> Clears global commands
+
+        Scopes whose commands haven't changed since their last sync are skipped,
+        unless forced with "!" (e.g. after Discord's copy drifted from a manual delete).
         """
+        manager = ctx.bot.sync_manager
         if not guilds:
-            if spec == "~":
-                synced = await ctx.bot.tree.sync(guild=ctx.guild)
+            if spec in ("~", "~!"):
+                synced = await manager.sync(guild=ctx.guild, force=spec == "~!")
             elif spec == "*":
                 ctx.bot.tree.copy_global_to(guild=ctx.guild)
-                synced = await ctx.bot.tree.sync(guild=ctx.guild)
+                synced = await manager.sync(guild=ctx.guild)
             elif spec == "^":
                 ctx.bot.tree.clear_commands(guild=ctx.guild)
-                await ctx.bot.tree.sync(guild=ctx.guild)
+                await manager.sync(guild=ctx.guild)
                 synced = []
             elif spec == "$":
                 ctx.bot.tree.clear_commands()
-                await ctx.bot.tree.sync()
+                await manager.sync()
                 synced = []
+            elif spec == "+":
+                results = await manager.sync_all()
+                await ctx.send(f"Synced {sum(results.values())}/{len(results)} scopes, the rest were unchanged or failed.")
+                return
             else:
-                synced = await ctx.bot.tree.sync()
+                synced = await manager.sync(force=spec == "!")
 
-            await ctx.send(f"Synced {len(synced)} commands " f"{'globally' if spec is None else 'to the current guild.'}")
+            where = "globally" if spec in (None, "!") else "to the current guild."
+            if synced is None:
+                await ctx.send(f"Commands are already up to date {where}")
+            else:
+                await ctx.send(f"Synced {len(synced)} commands {where}")
             return
 
         ret = 0
         for guild in guilds:
             try:
-                await ctx.bot.tree.sync(guild=guild)
+                if await manager.sync(guild=guild, force=spec == "!") is not None:
+                    ret += 1
             except discord.HTTPException:
                 pass
-            else:
-                ret += 1
 
-        await ctx.send(f"Synced the tree to {ret}/{len(guilds)}.")
+        await ctx.send(f"Synced the tree to {ret}/{len(guilds)}, the rest were unchanged or failed.")
 
     @commands.command()
     @commands.is_owner()
@@ -11,6 +11,7 @@ import views
 from cogs.tournament.utils import Categories_NoGen, Category
 from cogs.tournament.utils.errors import TournamentNotActiveError
 from cogs.tournament.utils.utils import ORG_CHAT, ORGANIZER
+from database import DotRecord
 
 if typing.TYPE_CHECKING:
     import core
@@ -26,26 +27,53 @@ class TournamentSubmissions(commands.Cog):
         guild_ids=[195387617972322306, utils.GUILD_ID],
     )
 
-    async def insert_record(self, category: Category, user_id: int, screenshot_url: str, record: float):
+    async def insert_record(
+        self,
+        category: Category,
+        user_id: int,
+        screenshot_url: str,
+        record: float,
+        tournament_id: int,
+    ) -> DotRecord:
+        """Insert a submission and return whether it was inserted and the user's rank.
+
+        Runs as a single statement (and therefore a single transaction).
+        The insert is skipped if the latest record became faster in the meantime.
+        """
         query = """
-            INSERT INTO tournament_records (user_id, category, record, tournament_id, screenshot)
-            VALUES ($1, $2, $3, (SELECT id FROM tournament WHERE active = TRUE LIMIT 1), $4)
+            WITH previous AS (SELECT record
+                              FROM tournament_records
+                              WHERE user_id = $1
+                                AND category = $2
+                                AND tournament_id = $4
+                              ORDER BY inserted_at DESC
+                              LIMIT 1),
+                 inserted AS (
+                     INSERT INTO tournament_records (user_id, category, record, tournament_id, screenshot)
+                     SELECT $1, $2, $3, $4, $5
+                     WHERE NOT EXISTS (SELECT 1 FROM previous WHERE record < $3)
+                     RETURNING record)
+            SELECT EXISTS (SELECT 1 FROM inserted) as inserted,
+                   coalesce(
+                       (SELECT value FROM user_ranks WHERE user_id = $1 AND category = $2), 'Unranked'
+                   ) as rank
         """
-        await self.bot.database.execute(query, user_id, category, record, screenshot_url)
+        return await self.bot.database.fetchrow(query, user_id, category, record, tournament_id, screenshot_url)
 
-    async def get_tournament_id(self) -> int:
-        tournament_id_if_exists = self.bot.current_tournament and self.bot.current_tournament.id
-        query = "SELECT id FROM tournament WHERE active = TRUE;"
-        fetch_id_if_needed = self.bot.database.fetchval(query)
-        return tournament_id_if_exists or await fetch_id_if_needed
+    def get_tournament_id(self) -> int:
+        if not self.bot.current_tournament or not self.bot.current_tournament.id:
+            raise TournamentNotActiveError
+        return self.bot.current_tournament.id
 
     async def get_old_record(self, user_id: int, category: Category, tournament_id: int):
         query = """
-            SELECT record, rank()
-                over (order by inserted_at DESC) as date_rank FROM tournament_records 
-            WHERE user_id = $1 AND
-            category = $2 AND 
-            tournament_id = $3;
+            SELECT record
+            FROM tournament_records
+            WHERE user_id = $1
+              AND category = $2
+              AND tournament_id = $3
+            ORDER BY inserted_at DESC
+            LIMIT 1;
         """
         return await self.bot.database.fetchval(
             query,
@@ -66,9 +94,7 @@ class TournamentSubmissions(commands.Cog):
         category: Category,
     ):
         await itx.response.defer()
-        tournament_id = await self.get_tournament_id()
-        if not tournament_id:
-            raise TournamentNotActiveError
+        tournament_id = self.get_tournament_id()
         old_record = await self.get_old_record(
             itx.user.id,
             category,
@@ -94,17 +120,10 @@ class TournamentSubmissions(commands.Cog):
         if not view.value:
             return
         url = await self.get_image_url(itx)
-        await self.insert_record(category, itx.user.id, url, record)
-        query = """
-            SELECT value FROM (SELECT 
-            coalesce(value, 'Unranked') as value ,
-            coalesce(category, $2) as category
-            FROM users u
-            LEFT JOIN user_ranks ur on u.user_id = ur.user_id
-            WHERE u.user_id = $1) pre WHERE category = $2
-        """
-        value = await itx.client.database.fetchval(query, itx.user.id, category)
-        if value == "Unranked" and category != "Bonus":
+        result = await self.insert_record(category, itx.user.id, url, record, tournament_id)
+        if not result["inserted"]:
+            raise utils.RecordNotFasterError
+        if result["rank"] == "Unranked" and category != "Bonus":
             await itx.guild.get_channel(ORG_CHAT).send(
                 f"{itx.user.mention} is **UNRANKED** in {category}.\n"
                 "Please change this users rank before the end of the tournament!"
@@ -167,9 +186,7 @@ class TournamentSubmissions(commands.Cog):
         category: Categories_NoGen,
         user: discord.Member | None = None,
     ):
-        tournament_id = await self.get_tournament_id()
-        if not tournament_id:
-            raise TournamentNotActiveError
+        tournament_id = self.get_tournament_id()
 
         if user and user != itx.user and itx.guild.get_role(ORGANIZER) not in itx.user.roles:
             raise utils.NoPermissionsError
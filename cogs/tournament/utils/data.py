@@ -41,6 +41,57 @@ class SeasonData(typing.TypedDict):
 Seasons: typing.TypeAlias = dict[int, SeasonData]
 
 
+class SeasonStore:
+    """Tournament seasons by number, with name lookups for ``SeasonsTransformer``.
+
+    Loaded with the other caches and kept current by ``SeasonManager``.
+    """
+
+    def __init__(self):
+        self.data: Seasons = {}
+        self._numbers: dict[str, int] = {}
+        self._index = utils.TrigramIndex()
+
+    def load(self, rows: typing.Iterable[typing.Mapping[str, typing.Any]]) -> None:
+        """Rebuild from rows with number, name and active."""
+        self.__init__()
+        for row in rows:
+            self.add(row["number"], row["name"], row["active"])
+
+    def add(self, number: int, name: str, active: bool = False) -> None:
+        self.data[number] = {"name": name, "active": active}
+        self._numbers[name] = number
+        self._numbers.setdefault(name.casefold(), number)
+        self._index.add(name)
+
+    def activate(self, number: int) -> None:
+        for season_number, season in self.data.items():
+            season["active"] = season_number == number
+
+    def number(self, value: str) -> int | None:
+        """Season number for an ID or name, falling back to the closest name. None if there are no seasons."""
+        if value.isdigit():
+            return int(value)
+        number = self._numbers.get(value, self._numbers.get(value.casefold()))
+        if number is None and self.data:
+            matches = self._index.search(value, 1)
+            name = matches[0] if matches else utils.fuzz_(value, (season["name"] for season in self.data.values()))
+            number = self._numbers[name]
+        return number
+
+    def choices(self, value: str, limit: int = 25) -> list[discord.app_commands.Choice[str]]:
+        """Autocomplete choices: newest seasons first, or the closest names to ``value``."""
+        if value:
+            names = self._index.search(value, limit)
+            numbers = [self._numbers[name] for name in names]
+        else:
+            numbers = sorted(self.data, reverse=True)[:limit]
+        return [
+            discord.app_commands.Choice(name=f"{self.data[number]['name']} (ID {number})", value=self.data[number]["name"])
+            for number in numbers
+        ]
+
+
 def base_embed(
     description: str,
     embed_type: Literal["start", "end", "announcement", "leaderboard", "hall_of_fame", "missions"],
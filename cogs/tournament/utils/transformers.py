@@ -6,6 +6,7 @@ from discord import app_commands
 
 import cogs
 import utils
+from cogs.tournament.utils.data import SeasonStore
 from cogs.tournament.utils.utils import parse
 
 if typing.TYPE_CHECKING:
@@ -15,24 +16,19 @@ import datetime
 
 class SeasonsTransformer(app_commands.Transformer):
     async def transform(self, itx: core.DoomItx, value: str) -> int:
-        try:
-            value = int(value)
-            return value
-        except ValueError:
-            pass
-
-        query = "SELECT name, number FROM tournament_seasons;"
-        rows = await itx.client.database.fetch(query)
-        values = {row["name"]: row["number"] for row in rows}
-        if value not in values:
-            value = utils.fuzz_(value, values)
-        return values[value]
+        seasons = itx.client.seasons
+        if not seasons.data:
+            seasons = SeasonStore()
+            seasons.load(await itx.client.database.fetch("SELECT number, name, active FROM tournament_seasons;"))
+        number = seasons.number(value)
+        if number is None:
+            raise utils.InvalidSeasonError
+        return number
 
     async def autocomplete(self, itx: core.DoomItx, value: str) -> list[app_commands.Choice[str]]:
-        query = "SELECT name, number FROM tournament_seasons ORDER BY similarity(name, $1::text) DESC LIMIT 12;"
-        rows = await itx.client.database.fetch(query, value)
-        choices = [app_commands.Choice(name=f"{row['name']} (ID {row['number']})", value=row["name"]) async for row in rows]
-        return choices
+        if not itx.client.seasons.data:
+            return await cogs.search_autocomplete(itx, "season", value)
+        return itx.client.seasons.choices(value)
 
 
 class DateTransformer(app_commands.Transformer):
@@ -26,9 +26,10 @@ class SeasonManager(discord.ui.View):
         modal = AddSeasonModal()
         await itx.response.send_modal(modal)
         await modal.wait()
-        if modal.name.value is None:
+        if modal.name.value is None or modal.number is None:
             return
         self.dropdown.add_season(modal.name.value, modal.number)
+        itx.client.seasons.add(modal.number, modal.name.value)
         await itx.edit_original_response(view=self)
 
     @discord.ui.button(label="Change season", style=discord.ButtonStyle.red)
@@ -54,6 +55,7 @@ class SeasonManager(discord.ui.View):
         query = "UPDATE tournament_seasons SET active = TRUE WHERE number = $1;"
         await itx.client.database.execute(query, self.value)
         self.dropdown.activate_season(self.value)
+        itx.client.seasons.activate(self.value)
         itx.client.current_season = self.value
         await itx.edit_original_response(view=self)
         await itx.guild.get_channel(ANNOUNCEMENTS).send(
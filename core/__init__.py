@@ -1,8 +1,9 @@
 from core.doom import *
 from core.events import *
 from core.translations import *
+from core.tree import *
 
 if typing.TYPE_CHECKING:
     from core.types import DoomCtx, DoomItx
 
-__all__ = ["Doom", "DoomCtx", "DoomItx", "BotEvents", "DoomTranslator"]
+__all__ = ["Doom", "DoomCtx", "DoomItx", "BotEvents", "DoomTranslator", "DoomTree"]
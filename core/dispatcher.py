@@ -0,0 +1,112 @@
+from __future__ import annotations
+
+import asyncio
+import collections
+import logging
+import random
+import typing
+
+import aiohttp
+import discord
+
+log = logging.getLogger(__name__)
+
+Call = typing.Callable[[], typing.Awaitable[typing.Any]]
+
+
+class Dispatcher:
+    """Background queue for outbound Discord API calls.
+
+    Calls are grouped by route (e.g. ``("channel", id)`` or ``("dm", user_id)``).
+    Each route runs one call at a time, in order, so a burst on one route waits on
+    its own rate limit bucket instead of tying up every worker, while calls on
+    other routes keep flowing. Routes are served round-robin by a fixed pool of workers.
+
+    Rate limits pause the route for ``retry_after``; server errors and connection
+    failures are retried with exponential backoff. Other client errors (closed DMs,
+    deleted messages) are logged and dropped. Calls submitted with a ``key`` that
+    is already queued or running are ignored.
+    """
+
+    def __init__(self, workers: int = 4, *, retries: int = 3, backoff: float = 1.0):
+        self.workers = workers
+        self.retries = retries
+        self.backoff = backoff
+        self._pending: dict[typing.Hashable, collections.deque[tuple[Call, typing.Hashable | None]]] = {}
+        self._keys: set[typing.Hashable] = set()
+        self._ready: asyncio.Queue[typing.Hashable] = asyncio.Queue()
+        self._tasks: list[asyncio.Task] = []
+
+    def start(self) -> None:
+        if not self._tasks:
+            self._tasks = [asyncio.create_task(self._worker()) for _ in range(self.workers)]
+
+    async def close(self) -> None:
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+
+    def submit(self, route: typing.Hashable, call: Call, *, key: typing.Hashable | None = None) -> bool:
+        """Queue ``call`` (a zero-argument coroutine function) on ``route``.
+
+        Returns False if a call with the same ``key`` is still queued or running.
+        """
+        if key is not None:
+            if key in self._keys:
+                return False
+            self._keys.add(key)
+        if route in self._pending:
+            self._pending[route].append((call, key))
+            return True
+        self._pending[route] = collections.deque([(call, key)])
+        self._ready.put_nowait(route)
+        return True
+
+    @property
+    def pending(self) -> int:
+        return sum(len(calls) for calls in self._pending.values())
+
+    async def join(self) -> None:
+        """Wait until every queued call has run."""
+        await self._ready.join()
+
+    async def _worker(self) -> None:
+        while True:
+            route = await self._ready.get()
+            call, key = self._pending[route].popleft()
+            try:
+                await self._run(route, call)
+            finally:
+                # Held until the call is done so a duplicate submitted while it waits on its bucket is still ignored.
+                self._keys.discard(key)
+                # A route is in the ready queue at most once, so only one worker serves it at a time.
+                if self._pending[route]:
+                    self._ready.put_nowait(route)
+                else:
+                    del self._pending[route]
+                self._ready.task_done()
+
+    async def _run(self, route: typing.Hashable, call: Call) -> None:
+        for attempt in range(self.retries + 1):
+            try:
+                await call()
+                return
+            except discord.RateLimited as e:
+                delay = e.retry_after
+            except discord.HTTPException as e:
+                if e.status == 429:
+                    delay = float(e.response.headers.get("Retry-After", self.backoff))
+                elif e.status < 500:
+                    log.info("Dispatched call on route %s failed: %s", route, e)
+                    return
+                else:
+                    delay = self.backoff * 2**attempt
+            except (aiohttp.ClientError, asyncio.TimeoutError, OSError):
+                delay = self.backoff * 2**attempt
+            except Exception:
+                log.exception("Dispatched call on route %s failed.", route)
+                return
+            if attempt < self.retries:
+                await asyncio.sleep(delay + random.uniform(0, self.backoff / 2))
+        log.warning("Dispatched call on route %s gave up after %s attempts.", route, self.retries + 1)
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 import logging
 
 import aiohttp
@@ -10,9 +11,22 @@ from discord.ext import commands
 
 import cogs
 import database
-from cogs.tournament.utils.data import TournamentData
+from cogs.tournament.utils.data import SeasonStore, TournamentData
+from core.dispatcher import Dispatcher
+from core.loop_monitor import LoopMonitor, current_operation
+from core.metrics import CommandMetrics
+from core.sync import SyncManager
 from core.translations import DoomTranslator
-from utils import MapCacheData, UserCacheData
+from core.tree import DoomTree
+from utils import (
+    MapCacheData,
+    MapPicker,
+    MapStatsStore,
+    RecordIndex,
+    TagStore,
+    UserCacheData,
+    VerifierLeaderboard,
+)
 
 log = logging.getLogger(__name__)
 
@@ -22,10 +36,30 @@ class Doom(commands.Bot):
 
     pool: asyncpg.Pool
     database: database.Database
+    query_tracer: database.QueryTracer
     session: aiohttp.ClientSession
+    tree: DoomTree
+
+    # Translate every command scope at startup instead of on its first sync.
+    pretranslate_commands = False
+    # Sync every scope whose commands changed since the last sync at startup.
+    auto_sync_commands = False
+    # Callbacks blocking the event loop for longer than this many seconds are logged.
+    slow_callback_threshold = 0.1
+    # Serve command metrics for Prometheus on this local port.
+    metrics_port: int | None = None
+    # Trace every query from startup (``?perf trace on`` enables it at runtime).
+    trace_queries = False
 
     def __init__(self) -> None:
-        super().__init__("?", intents=self._generate_intents(), help_command=None)
+        self.metrics = CommandMetrics()
+        super().__init__(
+            "?",
+            intents=self._generate_intents(),
+            help_command=None,
+            tree_cls=DoomTree,
+            http_trace=self.metrics.trace_config(),
+        )
         self.logger = log
         # self.database.logger = self.logger
         # Caches
@@ -33,6 +67,10 @@ class Doom(commands.Bot):
         self.map_types: list[str] | None = None
         self.map_cache: dict[str, MapCacheData] | None = {}
         self.all_users: dict[int, UserCacheData] | None = {}
+        self.map_picker = MapPicker()
+        self.map_stats = MapStatsStore()
+        self.verifier_leaderboard = VerifierLeaderboard()
+        self.record_index = RecordIndex()
 
         self.map_names_choices: list[app_commands.Choice] | None = None
         self.map_codes_choices: list[app_commands.Choice] | None = None
@@ -43,6 +81,7 @@ class Doom(commands.Bot):
         self.exercise_names_search: list[app_commands.Choice] | None = None
         self.exercise_category_map: dict[str, str] | None = None
 
+        self.tags = TagStore()
         self.tag_cache: list[str] | None = None
         self.tag_choices: list[app_commands.Choice] | None = None
 
@@ -53,7 +92,11 @@ class Doom(commands.Bot):
 
         self.current_tournament: TournamentData | None = None
         self.current_season: int | None = None
+        self.seasons = SeasonStore()
         self.persistent_views_added = False
+        self.dispatcher = Dispatcher()
+        self.sync_manager = SyncManager(self.tree)
+        self.loop_monitor = LoopMonitor()
 
     async def setup_hook(self) -> None:
         """
@@ -70,9 +113,44 @@ class Doom(commands.Bot):
             None
         """
         await self.tree.set_translator(DoomTranslator())
+        self.dispatcher.start()
+        self.loop_monitor.slow_callback = self.slow_callback_threshold
+        self.loop_monitor.start()
+        self.database.query_listeners.append(self.metrics.record_query)
+        self.query_tracer = database.QueryTracer(self.database, operation=current_operation.get)
+        if self.trace_queries:
+            self.query_tracer.start()
+        if self.metrics_port:
+            await self.metrics.serve(self.metrics_port)
         for ext in cogs.EXTENSIONS + ["jishaku", "core.events"]:
             self.logger.info(f"Loading {ext}...")
             await self.load_extension(ext)
+        if self.pretranslate_commands:
+            await self.tree.pretranslate()
+        if self.auto_sync_commands:
+            await self.sync_manager.sync_all()
+
+    async def close(self) -> None:
+        await self.dispatcher.close()
+        await self.loop_monitor.close()
+        await self.metrics.close()
+        await super().close()
+
+    async def invoke(self, ctx: commands.Context) -> None:
+        if ctx.command is None:
+            return await super().invoke(ctx)
+        name = f"{ctx.prefix}{ctx.command.qualified_name}"
+        current_operation.set(name)
+        async with self.metrics.measure(name):
+            await super().invoke(ctx)
+
+    def _schedule_event(self, coro, event_name: str, *args, **kwargs) -> asyncio.Task:
+        # Name each listener's task after the listener, so the loop monitor can tell e.g. two on_message handlers apart.
+        token = current_operation.set(f"{coro.__qualname__} ({event_name})")
+        try:
+            return super()._schedule_event(coro, event_name, *args, **kwargs)
+        finally:
+            current_operation.reset(token)
 
     @staticmethod
     def _generate_intents() -> discord.Intents:
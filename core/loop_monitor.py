@@ -0,0 +1,150 @@
+from __future__ import annotations
+
+import asyncio
+import collections
+import contextlib
+import contextvars
+import logging
+import time
+import typing
+
+log = logging.getLogger(__name__)
+
+# Command or listener running in the current task.
+# Set by ``Doom.invoke``, ``Doom._schedule_event`` and ``DoomTree.interaction_check``.
+current_operation: contextvars.ContextVar[str | None] = contextvars.ContextVar("current_operation", default=None)
+
+_STOCK_HANDLE_RUN = asyncio.Handle._run
+
+
+class SlowCallbackStats(typing.NamedTuple):
+    label: str
+    count: int
+    total: float
+    longest: float
+
+
+def _label(handle: asyncio.Handle) -> str:
+    """The command that scheduled ``handle``, else its task's name, else the callback itself."""
+    context = getattr(handle, "_context", None)
+    operation = context.get(current_operation) if context is not None else None
+    if operation:
+        return operation
+    callback = handle._callback
+    owner = getattr(callback, "__self__", None)
+    if isinstance(owner, asyncio.Task):
+        return owner.get_name()
+    return getattr(callback, "__qualname__", repr(callback))
+
+
+class LoopMonitor:
+    """Event loop health: slow callbacks and scheduling lag.
+
+    Every callback the loop runs is timed; ones over ``slow_callback`` seconds are
+    logged and aggregated by the command, listener or task that scheduled them.
+    A probe sleeps for ``probe_interval`` and records how late it wakes up.
+    This is asyncio's debug-mode slow-callback warning without the rest of debug mode.
+
+    Timing wraps ``asyncio.Handle._run``, which is process-wide, so only callbacks
+    on the loop ``start`` ran on are recorded, and the wrapper is only installed
+    over the stock implementation and only removed if it is still in place. When
+    the loop already runs in debug mode, asyncio's own ``slow_callback_duration``
+    warning is used instead of patching.
+    """
+
+    def __init__(self, *, slow_callback: float = 0.1, probe_interval: float = 1.0, history: int = 300):
+        self._slow_callback = slow_callback
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self.probe_interval = probe_interval
+        self.lag: collections.deque[float] = collections.deque(maxlen=history)
+        self.recent: collections.deque[tuple[float, str, float]] = collections.deque(maxlen=20)
+        self._slow: dict[str, list[float]] = {}
+        self._original_run: typing.Callable[[asyncio.Handle], None] | None = None
+        self._patched_run: typing.Callable[[asyncio.Handle], None] | None = None
+        self._probe: asyncio.Task | None = None
+
+    @property
+    def slow_callback(self) -> float:
+        return self._slow_callback
+
+    @slow_callback.setter
+    def slow_callback(self, seconds: float) -> None:
+        self._slow_callback = seconds
+        if self._loop is not None and self._loop.get_debug():
+            self._loop.slow_callback_duration = seconds
+
+    def start(self) -> None:
+        if self._probe is not None:
+            return
+        loop = self._loop = asyncio.get_running_loop()
+        self._probe = asyncio.create_task(self._run_probe(), name="LoopMonitor probe")
+        if loop.get_debug():
+            loop.slow_callback_duration = self._slow_callback
+            log.info("Event loop is in debug mode, using asyncio's slow callback warnings.")
+            return
+        original = asyncio.Handle._run
+        if original is not _STOCK_HANDLE_RUN:
+            log.warning("asyncio.Handle._run is already wrapped, slow callbacks will not be timed.")
+            return
+        monitor = self
+
+        def _run(handle: asyncio.Handle) -> None:
+            if handle._loop is not loop:
+                return original(handle)
+            started = time.perf_counter()
+            original(handle)
+            duration = time.perf_counter() - started
+            if duration >= monitor.slow_callback:
+                monitor._record_slow(handle, duration)
+
+        self._original_run = original
+        self._patched_run = asyncio.Handle._run = _run
+
+    async def close(self) -> None:
+        if self._original_run is not None:
+            if asyncio.Handle._run is self._patched_run:
+                asyncio.Handle._run = self._original_run
+            self._original_run = self._patched_run = None
+        if self._probe is not None:
+            self._probe.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._probe
+            self._probe = None
+
+    def _record_slow(self, handle: asyncio.Handle, duration: float) -> None:
+        label = _label(handle)
+        stats = self._slow.setdefault(label, [0, 0.0, 0.0])
+        stats[0] += 1
+        stats[1] += duration
+        stats[2] = max(stats[2], duration)
+        self.recent.append((time.time(), label, duration))
+        log.warning("Slow callback from %s blocked the event loop for %.0fms.", label, duration * 1000)
+
+    async def _run_probe(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            expected = loop.time() + self.probe_interval
+            await asyncio.sleep(self.probe_interval)
+            lag = max(loop.time() - expected, 0.0)
+            self.lag.append(lag)
+            if lag >= self.slow_callback:
+                log.warning("Event loop lag of %.0fms.", lag * 1000)
+
+    def slow_callbacks(self, limit: int = 10) -> list[SlowCallbackStats]:
+        """Slow callback sources by total blocked time, worst first."""
+        stats = [
+            SlowCallbackStats(label, int(count), total, longest) for label, (count, total, longest) in self._slow.items()
+        ]
+        stats.sort(key=lambda s: s.total, reverse=True)
+        return stats[:limit]
+
+    def lag_summary(self) -> dict[str, float]:
+        """Median, 99th percentile and max lag in seconds over the probe history."""
+        if not self.lag:
+            return {"p50": 0.0, "p99": 0.0, "max": 0.0}
+        ordered = sorted(self.lag)
+        return {
+            "p50": ordered[len(ordered) // 2],
+            "p99": ordered[min(int(len(ordered) * 0.99), len(ordered) - 1)],
+            "max": ordered[-1],
+        }
@@ -0,0 +1,220 @@
+from __future__ import annotations
+
+import contextlib
+import contextvars
+import logging
+import time
+import typing
+
+import aiohttp
+from aiohttp import web
+
+if typing.TYPE_CHECKING:
+    from database import QueryEvent
+
+log = logging.getLogger(__name__)
+
+
+class Histogram:
+    """Log-linear histogram in the style of HdrHistogram.
+
+    Values are scaled to integers (microseconds by default) and counted in buckets
+    of ``2 ** (sub_bucket_bits - 1)`` per power of two, so a reported percentile is
+    within ``1 / 2 ** (sub_bucket_bits - 1)`` of the true value however large it is.
+    For the default 5 that is at most 6.25% and about 3% in practice, since values
+    sit mid-bucket on average. Only non-empty buckets are stored.
+    """
+
+    __slots__ = ("scale", "_bits", "_half", "_counts", "count", "total", "max")
+
+    def __init__(self, *, scale: float = 1_000_000, sub_bucket_bits: int = 5):
+        self.scale = scale
+        self._bits = sub_bucket_bits
+        self._half = 1 << (sub_bucket_bits - 1)
+        self._counts: dict[int, int] = {}
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def _index(self, value: int) -> int:
+        shift = max(value.bit_length() - self._bits, 0)
+        return shift * self._half + (value >> shift)
+
+    def _highest_equivalent(self, index: int) -> int:
+        if index < self._half * 2:
+            return index
+        shift = index // self._half - 1
+        return ((index - shift * self._half + 1) << shift) - 1
+
+    def record(self, value: float) -> None:
+        index = self._index(max(int(value * self.scale), 0))
+        self._counts[index] = self._counts.get(index, 0) + 1
+        self.count += 1
+        self.total += value
+        if value > self.max:
+            self.max = value
+
+    @property
+    def mean(self) -> float:
+        return self.total / self.count if self.count else 0.0
+
+    def percentile(self, percentile: float) -> float:
+        """The value ``percentile`` (0-100) percent of recorded values are at or below."""
+        if not self.count:
+            return 0.0
+        target = max(self.count * percentile / 100, 1)
+        seen = 0
+        for index in sorted(self._counts):
+            seen += self._counts[index]
+            if seen >= target:
+                return min(self._highest_equivalent(index) / self.scale, self.max)
+        return self.max
+
+
+class CommandStats:
+    """Histograms for one command. Times are in seconds."""
+
+    __slots__ = ("wall", "defer", "queries", "db", "api")
+
+    def __init__(self):
+        self.wall = Histogram()
+        # Time until the first interaction response (defer or message) was sent.
+        self.defer = Histogram()
+        self.queries = Histogram(scale=1)
+        self.db = Histogram()
+        self.api = Histogram()
+
+
+class _Span:
+    __slots__ = ("name", "started", "first_response", "queries", "db_time", "api_time")
+
+    def __init__(self, name: str):
+        self.name = name
+        self.started = time.perf_counter()
+        self.first_response: float | None = None
+        self.queries = 0
+        self.db_time = 0.0
+        self.api_time = 0.0
+
+
+_current_span: contextvars.ContextVar[_Span | None] = contextvars.ContextVar("current_span", default=None)
+
+# (metric suffix, help, CommandStats attribute)
+_EXPORTED = (
+    ("duration_seconds", "Wall time of the command.", "wall"),
+    ("defer_seconds", "Time until the first interaction response.", "defer"),
+    ("db_seconds", "Time spent waiting on database queries.", "db"),
+    ("api_seconds", "Time spent in Discord API requests.", "api"),
+    ("queries", "Database queries per command.", "queries"),
+)
+_QUANTILES = (0.5, 0.9, 0.99)
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+class CommandMetrics:
+    """Per-command latency, database and Discord API time.
+
+    ``measure`` wraps a command invocation; database queries (via ``record_query``,
+    a ``Database`` query listener) and HTTP requests (via ``trace_config``, passed
+    as the client's ``http_trace``) made in the same task are added to it.
+    Interaction responses go through the same session, so the first ``/callback``
+    request marks the time to defer.
+    """
+
+    def __init__(self):
+        self.commands: dict[str, CommandStats] = {}
+        self._runner: web.AppRunner | None = None
+
+    @contextlib.asynccontextmanager
+    async def measure(self, name: str) -> typing.AsyncIterator[None]:
+        if _current_span.get() is not None:
+            # Nested invocations (e.g. ``ctx.invoke``) count toward the outer command.
+            yield
+            return
+        span = _Span(name)
+        token = _current_span.set(span)
+        try:
+            yield
+        finally:
+            _current_span.reset(token)
+            self._finish(span)
+
+    def _finish(self, span: _Span) -> None:
+        stats = self.commands.get(span.name)
+        if stats is None:
+            stats = self.commands[span.name] = CommandStats()
+        stats.wall.record(time.perf_counter() - span.started)
+        if span.first_response is not None:
+            stats.defer.record(span.first_response - span.started)
+        stats.queries.record(span.queries)
+        stats.db.record(span.db_time)
+        stats.api.record(span.api_time)
+
+    def record_query(self, event: QueryEvent) -> None:
+        span = _current_span.get()
+        if span is not None:
+            span.queries += 1
+            span.db_time += event.duration
+
+    def trace_config(self) -> aiohttp.TraceConfig:
+        trace = aiohttp.TraceConfig()
+
+        async def on_request_start(session, context, params: aiohttp.TraceRequestStartParams) -> None:
+            context.started = time.perf_counter()
+
+        async def on_request_end(session, context, params: aiohttp.TraceRequestEndParams) -> None:
+            span = _current_span.get()
+            if span is None:
+                return
+            now = time.perf_counter()
+            span.api_time += now - context.started
+            if span.first_response is None and params.url.path.endswith("/callback"):
+                span.first_response = now
+
+        async def on_request_exception(session, context, params: aiohttp.TraceRequestExceptionParams) -> None:
+            span = _current_span.get()
+            if span is not None:
+                span.api_time += time.perf_counter() - context.started
+
+        trace.on_request_start.append(on_request_start)
+        trace.on_request_end.append(on_request_end)
+        trace.on_request_exception.append(on_request_exception)
+        return trace
+
+    def top(self, limit: int = 15) -> list[tuple[str, CommandStats]]:
+        """Commands by total wall time, slowest first."""
+        return sorted(self.commands.items(), key=lambda item: item[1].wall.total, reverse=True)[:limit]
+
+    def render_prometheus(self) -> str:
+        """Every command's histograms as Prometheus summaries."""
+        lines = []
+        for suffix, description, attribute in _EXPORTED:
+            metric = f"doom_command_{suffix}"
+            lines += [f"# HELP {metric} {description}", f"# TYPE {metric} summary"]
+            for name, stats in sorted(self.commands.items()):
+                histogram: Histogram = getattr(stats, attribute)
+                label = f'command="{_escape(name)}"'
+                lines += [f'{metric}{{{label},quantile="{q}"}} {histogram.percentile(q * 100):g}' for q in _QUANTILES]
+                lines += [f"{metric}_sum{{{label}}} {histogram.total:g}", f"{metric}_count{{{label}}} {histogram.count}"]
+        return "\n".join(lines) + "\n"
+
+    async def serve(self, port: int, host: str = "127.0.0.1") -> None:
+        """Serve ``render_prometheus`` at ``http://host:port/metrics``."""
+
+        async def metrics(request: web.Request) -> web.Response:
+            return web.Response(text=self.render_prometheus(), content_type="text/plain", charset="utf-8")
+
+        app = web.Application()
+        app.router.add_get("/metrics", metrics)
+        self._runner = web.AppRunner(app, access_log=None)
+        await self._runner.setup()
+        await web.TCPSite(self._runner, host, port).start()
+        log.info("Serving command metrics on http://%s:%s/metrics", host, port)
+
+    async def close(self) -> None:
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
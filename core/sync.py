@@ -0,0 +1,92 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import pathlib
+import typing
+
+import discord
+
+if typing.TYPE_CHECKING:
+    from discord import app_commands
+    from discord.abc import Snowflake
+
+    from core.tree import DoomTree
+
+log = logging.getLogger(__name__)
+
+SYNC_STATE_PATH = "data/command_sync.json"
+
+_GLOBAL = "global"
+
+
+class SyncManager:
+    """Syncs command scopes only when their translated payload changed since the last sync.
+
+    The hash of each scope's payload (``"global"`` or a guild id) is kept in a JSON
+    file, so unchanged scopes are skipped across restarts too. In Docker the file
+    should live on a volume, otherwise every deploy starts without hashes and syncs everything once.
+    """
+
+    def __init__(self, tree: DoomTree, path: str = SYNC_STATE_PATH):
+        self.tree = tree
+        self.path = pathlib.Path(path)
+        self._hashes: dict[str, str] | None = None
+
+    @property
+    def hashes(self) -> dict[str, str]:
+        if self._hashes is None:
+            try:
+                self._hashes = json.loads(self.path.read_text(encoding="utf8"))
+            except FileNotFoundError:
+                self._hashes = {}
+            except (OSError, ValueError):
+                log.warning("Could not read %s, every scope will be synced.", self.path, exc_info=True)
+                self._hashes = {}
+        return self._hashes
+
+    def _save(self) -> None:
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self.path.write_text(json.dumps(self.hashes, indent=2, sort_keys=True), encoding="utf8")
+        except OSError:
+            log.warning("Could not write %s.", self.path, exc_info=True)
+
+    @staticmethod
+    def _scope(guild: Snowflake | None) -> str:
+        return str(guild.id) if guild else _GLOBAL
+
+    async def digest(self, *, guild: Snowflake | None = None) -> str:
+        payload = await self.tree.translated_payload(guild=guild)
+        serialized = json.dumps(payload, sort_keys=True, separators=(",", ":"), default=str)
+        return hashlib.sha256(serialized.encode()).hexdigest()
+
+    async def sync(self, *, guild: Snowflake | None = None, force: bool = False) -> list[app_commands.AppCommand] | None:
+        """Sync ``guild`` (or the global commands) if it changed. Returns None when it was skipped."""
+        scope = self._scope(guild)
+        digest = await self.digest(guild=guild)
+        if not force and self.hashes.get(scope) == digest:
+            log.info("Commands for %s are unchanged, skipping sync.", scope)
+            return None
+        synced = await self.tree.sync(guild=guild)
+        self.hashes[scope] = digest
+        self._save()
+        log.info("Synced %s commands for %s.", len(synced), scope)
+        return synced
+
+    async def sync_all(self, *, force: bool = False) -> dict[str, bool]:
+        """Sync every changed scope: global, each guild with commands and each guild synced before.
+
+        Returns whether each scope was synced.
+        """
+        guild_ids = {int(scope) for scope in self.hashes if scope != _GLOBAL} | set(self.tree._guild_commands)
+        scopes: list[Snowflake | None] = [None, *(discord.Object(id=guild_id) for guild_id in sorted(guild_ids))]
+        results = {}
+        for guild in scopes:
+            try:
+                results[self._scope(guild)] = await self.sync(guild=guild, force=force) is not None
+            except discord.HTTPException:
+                log.exception("Failed to sync commands for %s.", self._scope(guild))
+                results[self._scope(guild)] = False
+        return results
@@ -1,22 +1,72 @@
 from __future__ import annotations
 
 import json
+import logging
+import typing
 
 import discord
 from discord import app_commands
 
-with open("assets/translations.json", encoding="utf8") as f:
-    translations = json.load(f)
+log = logging.getLogger(__name__)
+
+TRANSLATIONS_PATH = "assets/translations.json"
+
+# Locale keys in the asset are matched case-insensitively against Discord's locale codes.
+_LOCALES = {locale.value.lower(): locale.value for locale in discord.Locale}
+
+
+class TranslationCatalog:
+    """``assets/translations.json`` (message -> {locale: text}) compiled into lookup tables.
+
+    Each translation is stored once under ``(message, locale)`` for the translator
+    and grouped per locale for coverage stats.
+    """
+
+    def __init__(self, data: dict[str, dict[str, str]]):
+        self.messages = frozenset(data)
+        self.locales: dict[str, dict[str, str]] = {}
+        self._cache: dict[tuple[str, str], str] = {}
+        for message, translations in data.items():
+            for key, text in translations.items():
+                locale = _LOCALES.get(key.lower())
+                if locale is None:
+                    log.warning("Unknown locale %r for translation of %r.", key, message)
+                    locale = key
+                self.locales.setdefault(locale, {})[message] = text
+                self._cache[(message, locale)] = text
+
+    @classmethod
+    def from_file(cls, path: str = TRANSLATIONS_PATH) -> TranslationCatalog:
+        with open(path, encoding="utf8") as f:
+            return cls(json.load(f))
+
+    def get(self, message: str, locale: str) -> str | None:
+        return self._cache.get((message, locale))
+
+    def coverage(self) -> dict[str, float]:
+        """Fraction of the catalog's messages translated, per locale."""
+        if not self.messages:
+            return {}
+        return {locale: len(texts) / len(self.messages) for locale, texts in sorted(self.locales.items())}
 
 
 class DoomTranslator(app_commands.Translator):
+    def __init__(self, path: str = TRANSLATIONS_PATH):
+        self.path = path
+        self.catalog = TranslationCatalog({})
+
+    async def load(self) -> None:
+        self.catalog = TranslationCatalog.from_file(self.path)
+        log.info(
+            "Loaded %s translated messages. Coverage: %s",
+            len(self.catalog.messages),
+            ", ".join(f"{locale} {share:.0%}" for locale, share in self.catalog.coverage().items()),
+        )
+
     async def translate(
         self,
         string: app_commands.locale_str,
         locale: discord.Locale,
         context: app_commands.TranslationContext,
     ) -> str | None:
-        locales = translations.get(string.message, None)
-        if locales:
-            return locales.get(locale.value)
-        return None
+        return self.catalog.get(string.message, locale.value)
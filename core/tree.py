@@ -0,0 +1,98 @@
+from __future__ import annotations
+
+import typing
+
+import discord
+from discord import app_commands
+
+from core.loop_monitor import current_operation
+
+if typing.TYPE_CHECKING:
+    from discord.abc import Snowflake
+
+
+class DoomTree(app_commands.CommandTree):
+    """Command tree that keeps each scope's translated payload between syncs.
+
+    ``CommandTree.sync`` runs the translator over every string of every command for
+    every locale on each call. Here the payload is built once per scope and reused
+    until commands are added, removed or copied, or the translator changes.
+
+    Every app command and autocomplete invocation is measured by ``Doom.metrics``
+    and named in ``current_operation`` for the loop monitor and query tracer.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._payloads: dict[int | None, list[dict[str, typing.Any]]] = {}
+
+    def add_command(self, *args, **kwargs):
+        self._payloads.clear()
+        return super().add_command(*args, **kwargs)
+
+    def remove_command(self, *args, **kwargs):
+        self._payloads.clear()
+        return super().remove_command(*args, **kwargs)
+
+    def clear_commands(self, *args, **kwargs):
+        self._payloads.clear()
+        return super().clear_commands(*args, **kwargs)
+
+    def copy_global_to(self, *args, **kwargs):
+        self._payloads.clear()
+        return super().copy_global_to(*args, **kwargs)
+
+    async def set_translator(self, translator: app_commands.Translator | None) -> None:
+        self._payloads.clear()
+        await super().set_translator(translator)
+
+    async def interaction_check(self, interaction: discord.Interaction) -> bool:
+        if interaction.command is not None:
+            current_operation.set(f"/{interaction.command.qualified_name}")
+        return True
+
+    async def _call(self, interaction: discord.Interaction) -> None:
+        command = interaction.command
+        if command is None:
+            return await super()._call(interaction)
+        name = f"/{command.qualified_name}"
+        if interaction.type is discord.InteractionType.autocomplete:
+            name += " (autocomplete)"
+        async with self.client.metrics.measure(name):
+            await super()._call(interaction)
+
+    async def translated_payload(self, *, guild: Snowflake | None = None) -> list[dict[str, typing.Any]]:
+        """The payload ``sync`` uploads for ``guild`` (or global commands), translated once."""
+        scope = guild.id if guild else None
+        payload = self._payloads.get(scope)
+        if payload is None:
+            commands = self._get_all_commands(guild=guild)
+            if self.translator:
+                payload = [await command.get_translated_payload(self, self.translator) for command in commands]
+            else:
+                payload = [command.to_dict(self) for command in commands]
+            self._payloads[scope] = payload
+        return payload
+
+    async def pretranslate(self) -> None:
+        """Translate the global commands and every guild's commands up front."""
+        await self.translated_payload()
+        for guild_id in list(self._guild_commands):
+            await self.translated_payload(guild=discord.Object(id=guild_id))
+
+    async def sync(self, *, guild: Snowflake | None = None) -> list[app_commands.AppCommand]:
+        if self.client.application_id is None:
+            raise app_commands.MissingApplicationID
+
+        payload = await self.translated_payload(guild=guild)
+        try:
+            if guild is None:
+                data = await self._http.bulk_upsert_global_commands(self.client.application_id, payload=payload)
+            else:
+                data = await self._http.bulk_upsert_guild_commands(self.client.application_id, guild.id, payload=payload)
+        except discord.HTTPException as e:
+            if e.status == 400 and e.code == 50035:
+                raise app_commands.CommandSyncFailure(e, self._get_all_commands(guild=guild)) from None
+            raise
+
+        return [app_commands.AppCommand(data=d, state=self._state) for d in data]
@@ -1 +1,3 @@
 from database.database import *
+from database.search import *
+from database.tracing import *
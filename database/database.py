@@ -1,7 +1,10 @@
+import time
 import typing
 
 import asyncpg
 
+from database.search import SEARCH_QUERIES, SearchKind
+
 
 class DatabaseConnection:
     """Handles asyncronous context manager for database connection."""
@@ -37,12 +40,46 @@ class DotRecord(asyncpg.Record):
         return super().__getitem__(attr)
 
 
+class QueryEvent(typing.NamedTuple):
+    """Passed to ``Database.query_listeners`` after every query, whether or not it raised."""
+
+    method: str
+    query: str
+    # Positional arguments; for ``executemany``, a one-tuple holding the iterable of argument tuples.
+    args: tuple[typing.Any, ...]
+    # What asyncpg returned (rows, a row, a value or a status string), None if the query raised.
+    result: typing.Any
+    duration: float
+
+
 class Database:
     """Handles all database transactions."""
 
     def __init__(self, conn: asyncpg.Pool):
         # self.logger: logging.Logger | None = None
         self.pool = conn
+        self.query_listeners: list[typing.Callable[[QueryEvent], None]] = []
+
+    async def _run(
+        self,
+        method: str,
+        query: str,
+        args: tuple[typing.Any, ...],
+        connection: asyncpg.Connection | asyncpg.Pool | None,
+        **kwargs: typing.Any,
+    ):
+        _connection = connection or self.pool
+        if not self.query_listeners:
+            return await getattr(_connection, method)(query, *args, **kwargs)
+        started = time.perf_counter()
+        result = None
+        try:
+            result = await getattr(_connection, method)(query, *args, **kwargs)
+            return result
+        finally:
+            event = QueryEvent(method, query, args, result, time.perf_counter() - started)
+            for listener in self.query_listeners:
+                listener(event)
 
     async def fetch(
         self,
@@ -50,8 +87,7 @@ class Database:
         *args: typing.Any,
         connection: asyncpg.Connection | asyncpg.Pool | None = None,
     ):
-        _connection = connection or self.pool
-        return await _connection.fetch(query, *args, record_class=DotRecord)
+        return await self._run("fetch", query, args, connection, record_class=DotRecord)
 
     async def fetchval(
         self,
@@ -59,8 +95,7 @@ class Database:
         *args: typing.Any,
         connection: asyncpg.Connection | asyncpg.Pool | None = None,
     ):
-        _connection = connection or self.pool
-        return await _connection.fetchval(query, *args)
+        return await self._run("fetchval", query, args, connection)
 
     async def fetchrow(
         self,
@@ -68,8 +103,7 @@ class Database:
         *args: typing.Any,
         connection: asyncpg.Connection | asyncpg.Pool | None = None,
     ):
-        _connection = connection or self.pool
-        return await _connection.fetchrow(query, *args, record_class=DotRecord)
+        return await self._run("fetchrow", query, args, connection, record_class=DotRecord)
 
     async def execute(
         self,
@@ -77,8 +111,7 @@ class Database:
         *args: typing.Any,
         connection: asyncpg.Connection | asyncpg.Pool | None = None,
     ):
-        _connection = connection or self.pool
-        await _connection.execute(query, *args)
+        await self._run("execute", query, args, connection)
 
     async def executemany(
         self,
@@ -86,5 +119,24 @@ class Database:
         args: typing.Iterable[typing.Any],
         connection: asyncpg.Connection | asyncpg.Pool | None = None,
     ):
-        _connection = connection or self.pool
-        await _connection.executemany(query, args)
+        await self._run("executemany", query, (args,), connection)
+
+    async def search(
+        self,
+        kind: SearchKind,
+        text: str,
+        limit: int = 25,
+        *,
+        map_code: str | None = None,
+        connection: asyncpg.Connection | asyncpg.Pool | None = None,
+    ) -> list[DotRecord]:
+        """Rows of ``name`` and ``value`` for autocomplete, best ``pg_trgm`` word matches first.
+
+        An empty ``text`` lists the first ``limit`` alphabetically. ``map_code`` narrows level searches.
+        """
+        match, browse = SEARCH_QUERIES[kind]
+        text = text.strip()
+        args = (text, limit) if text else (limit,)
+        if kind == "level":
+            args += (map_code,)
+        return await self.fetch(match if text else browse, *args, connection=connection)
@@ -0,0 +1,48 @@
+from __future__ import annotations
+
+import typing
+
+SearchKind = typing.Literal["user", "map", "level", "tag", "season"]
+
+
+class _Search(typing.NamedTuple):
+    table: str
+    column: str
+    # SQL for the autocomplete choice's name and value.
+    name: str
+    value: str
+
+
+_SEARCHES: dict[str, _Search] = {
+    "user": _Search("users", "nickname", "nickname", "user_id::text"),
+    "map": _Search("maps", "map_name", "map_name || ' (' || map_code || ')'", "map_code"),
+    "level": _Search("map_levels", "level", "level", "level"),
+    "tag": _Search("tags", "name", "name", "name"),
+    "season": _Search("tournament_seasons", "name", "name || ' (ID ' || number || ')'", "name"),
+}
+
+
+def _queries(search: _Search) -> tuple[str, str]:
+    """``(match, browse)`` queries. ``$1 <% column`` is answered by the column's trigram GIN index.
+
+    ``match`` takes the text and limit, ``browse`` only the limit. Levels take the map code last.
+    """
+    levels = search.table == "map_levels"
+    match = f"""
+        SELECT {search.name} AS name, {search.value} AS value
+        FROM {search.table}
+        WHERE $1 <% {search.column} {"AND ($3::text IS NULL OR map_code = $3) GROUP BY level" if levels else ""}
+        ORDER BY word_similarity($1, {search.column}) DESC, {search.column}
+        LIMIT $2;
+    """
+    browse = f"""
+        SELECT {search.name} AS name, {search.value} AS value
+        FROM {search.table}
+        {"WHERE $2::text IS NULL OR map_code = $2 GROUP BY level" if levels else ""}
+        ORDER BY {search.column}
+        LIMIT $1;
+    """
+    return match, browse
+
+
+SEARCH_QUERIES: dict[str, tuple[str, str]] = {kind: _queries(search) for kind, search in _SEARCHES.items()}
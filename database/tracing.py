@@ -0,0 +1,202 @@
+from __future__ import annotations
+
+import asyncio
+import collections
+import functools
+import logging
+import re
+import sys
+import time
+import typing
+
+import asyncpg
+
+if typing.TYPE_CHECKING:
+    from database.database import Database, QueryEvent
+
+log = logging.getLogger(__name__)
+
+_COMMENTS = re.compile(r"--[^\n]*|/\*.*?\*/", re.DOTALL)
+_STRINGS = re.compile(r"'(?:[^']|'')*'")
+_NUMBERS = re.compile(r"(?<![$\w])-?\d+(?:\.\d+)?\b")
+_IN_LISTS = re.compile(r"\bIN\s*\(\s*\?(?:\s*,\s*\?)*\s*\)", re.IGNORECASE)
+_WHITESPACE = re.compile(r"\s+")
+_EXPLAINABLE = ("select", "with", "insert", "update", "delete")
+
+
+@functools.lru_cache(maxsize=1024)
+def fingerprint(query: str) -> str:
+    """``query`` with comments dropped, literals replaced by ``?`` and whitespace collapsed.
+
+    Queries differing only in inlined values share a fingerprint; ``$n`` parameters are kept.
+    """
+    query = _COMMENTS.sub(" ", query)
+    query = _STRINGS.sub("?", query)
+    query = _NUMBERS.sub("?", query)
+    query = _IN_LISTS.sub("IN (...)", query)
+    return _WHITESPACE.sub(" ", query).strip()
+
+
+def _args_count(event: QueryEvent) -> int | None:
+    """Parameters passed, or argument sets for ``executemany`` (None if they were a bare iterator)."""
+    if event.method != "executemany":
+        return len(event.args)
+    return len(event.args[0]) if isinstance(event.args[0], typing.Sized) else None
+
+
+def _row_count(event: QueryEvent) -> int | None:
+    result = event.result
+    if event.method == "fetch":
+        return len(result) if result is not None else None
+    if event.method in ("fetchrow", "fetchval"):
+        return int(result is not None)
+    if event.method == "execute" and isinstance(result, str):
+        # Status strings end with the affected row count, e.g. "UPDATE 3" or "INSERT 0 1".
+        count = result.rpartition(" ")[2]
+        return int(count) if count.isdigit() else None
+    return None
+
+
+def _caller() -> str:
+    """``module:function`` of the first frame outside this package and asyncpg."""
+    frame = sys._getframe(2)
+    while frame is not None:
+        module = frame.f_globals.get("__name__", "")
+        if not module.startswith(("database.", "asyncpg", "asyncio", "contextlib")):
+            return f"{module}:{frame.f_code.co_name}"
+        frame = frame.f_back
+    return "unknown"
+
+
+class QueryTrace(typing.NamedTuple):
+    fingerprint: str
+    method: str
+    args: int | None
+    rows: int | None
+    duration: float
+    # Command running when the query was made, if any.
+    operation: str | None
+    caller: str
+    timestamp: float
+
+
+class QueryStats:
+    __slots__ = ("count", "total", "max", "rows", "callers")
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+        self.rows = 0
+        self.callers: collections.Counter[str] = collections.Counter()
+
+    @property
+    def mean(self) -> float:
+        return self.total / self.count if self.count else 0.0
+
+
+class QueryTracer:
+    """Per-query tracing for a ``Database``, as one of its ``query_listeners``.
+
+    Every query is aggregated by fingerprint (count, total/max time, rows and
+    which commands or functions made it). Queries slower than ``slow_query``
+    seconds are logged and kept in ``slow``; their ``EXPLAIN`` plan is fetched in
+    the background, at most once per fingerprint every ``explain_cooldown`` seconds.
+    ``operation`` returns the name of the running command, if any.
+    """
+
+    def __init__(
+        self,
+        database: Database,
+        *,
+        slow_query: float = 0.2,
+        explain_cooldown: float = 300.0,
+        history: int = 50,
+        operation: typing.Callable[[], str | None] = lambda: None,
+    ):
+        self.database = database
+        self.slow_query = slow_query
+        self.explain_cooldown = explain_cooldown
+        self.operation = operation
+        self.stats: dict[str, QueryStats] = {}
+        self.slow: collections.deque[QueryTrace] = collections.deque(maxlen=history)
+        self.plans: dict[str, str] = {}
+        self._explained: dict[str, float] = {}
+        self._tasks: set[asyncio.Task] = set()
+
+    @property
+    def enabled(self) -> bool:
+        return self in self.database.query_listeners
+
+    def start(self) -> None:
+        if not self.enabled:
+            self.database.query_listeners.append(self)
+
+    def stop(self) -> None:
+        if self.enabled:
+            self.database.query_listeners.remove(self)
+
+    def reset(self) -> None:
+        self.stats.clear()
+        self.slow.clear()
+        self.plans.clear()
+        self._explained.clear()
+
+    def __call__(self, event: QueryEvent) -> None:
+        operation = self.operation()
+        trace = QueryTrace(
+            fingerprint(event.query),
+            event.method,
+            _args_count(event),
+            _row_count(event),
+            event.duration,
+            operation,
+            _caller(),
+            time.time(),
+        )
+        stats = self.stats.get(trace.fingerprint)
+        if stats is None:
+            stats = self.stats[trace.fingerprint] = QueryStats()
+        stats.count += 1
+        stats.total += trace.duration
+        stats.max = max(stats.max, trace.duration)
+        stats.rows += trace.rows or 0
+        stats.callers[operation or trace.caller] += 1
+
+        if trace.duration >= self.slow_query:
+            self.slow.append(trace)
+            log.warning(
+                "Slow query (%.0fms, %s rows) from %s: %s",
+                trace.duration * 1000,
+                trace.rows,
+                operation or trace.caller,
+                trace.fingerprint,
+            )
+            self._schedule_explain(trace, event)
+
+    def _schedule_explain(self, trace: QueryTrace, event: QueryEvent) -> None:
+        if event.method == "executemany" or not trace.fingerprint.lower().startswith(_EXPLAINABLE):
+            return
+        now = time.monotonic()
+        if now - self._explained.get(trace.fingerprint, -self.explain_cooldown) < self.explain_cooldown:
+            return
+        self._explained[trace.fingerprint] = now
+        task = asyncio.create_task(self._explain(trace.fingerprint, event.query, event.args))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _explain(self, key: str, query: str, args: tuple[typing.Any, ...]) -> None:
+        # Plain EXPLAIN plans without executing, so it is safe for writes too.
+        # Runs on the pool directly so it is not traced itself.
+        try:
+            rows = await self.database.pool.fetch(f"EXPLAIN {query}", *args)
+        except (asyncpg.PostgresError, asyncpg.InterfaceError) as e:
+            log.debug("Could not explain %s: %s", key, e)
+            return
+        plan = "\n".join(row[0] for row in rows)
+        self.plans[key] = plan
+        log.warning("Plan for slow query %s:\n%s", key, plan)
+
+    def top(self, limit: int = 10) -> list[tuple[str, QueryStats]]:
+        """Fingerprints by total time, most expensive first."""
+        return sorted(self.stats.items(), key=lambda item: item[1].total, reverse=True)[:limit]
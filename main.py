@@ -23,6 +23,11 @@ async def main() -> None:
                 bot.session = session
                 bot.pool = pool
                 bot.database = database.Database(pool)
+                if port := os.environ.get("METRICS_PORT"):
+                    bot.metrics_port = int(port)
+                bot.trace_queries = bool(os.environ.get("TRACE_QUERIES"))
+                if threshold := os.environ.get("SLOW_CALLBACK_SECONDS"):
+                    bot.slow_callback_threshold = float(threshold)
                 await bot.start(os.environ["TOKEN"])
 
 
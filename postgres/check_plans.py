@@ -0,0 +1,155 @@
+"""
+Index advisor for the bot's hot queries.
+
+Runs every registered query through ``EXPLAIN`` with arguments sampled from the
+database itself and flags sequential scans on tables above ``--min-rows``.
+
+    python -m postgres.check_plans --min-rows 10000
+
+Exits with status 1 when a sequential scan is found, so it can gate a deploy.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import sys
+import typing
+
+import asyncpg
+
+from database.search import SEARCH_QUERIES
+from postgres.migrate import default_dsn
+
+
+class PlanCheck(typing.NamedTuple):
+    name: str
+    query: str
+    # Returns a single row whose values are the query's arguments, in order.
+    sample: str
+    # Positions of arguments that may be NULL; a NULL anywhere else means there is no sample data.
+    optional: tuple[int, ...] = ()
+
+
+CHECKS: list[PlanCheck] = [
+    PlanCheck(
+        "submit_record_old_row",
+        """
+            SELECT record, hidden_id FROM records r
+            WHERE r.map_code = $1 AND level_name = $2 AND user_id = $3
+            ORDER BY inserted_at DESC
+        """,
+        "SELECT map_code, level_name, user_id FROM records LIMIT 1;",
+    ),
+    PlanCheck(
+        "verification_row",
+        "SELECT * FROM records WHERE hidden_id=$1",
+        "SELECT hidden_id FROM records WHERE hidden_id IS NOT NULL LIMIT 1;",
+    ),
+    PlanCheck(
+        "verification_queue",
+        "SELECT hidden_id FROM records WHERE hidden_id is not null;",
+        "SELECT;",
+    ),
+    PlanCheck(
+        "top_record_message",
+        "SELECT user_id, hidden_id FROM records WHERE message_id = $1;",
+        "SELECT message_id FROM records WHERE message_id IS NOT NULL LIMIT 1;",
+    ),
+    PlanCheck(
+        "top_record_votes",
+        """
+            SELECT COUNT(*) as count, max(top_record_id) as top_record_id
+            FROM top_records
+            WHERE original_message_id = $1 AND channel_id = $2
+            GROUP BY original_message_id, channel_id
+        """,
+        "SELECT original_message_id, channel_id FROM top_records LIMIT 1;",
+    ),
+    PlanCheck(
+        "tournament_old_record",
+        """
+            SELECT record
+            FROM tournament_records
+            WHERE user_id = $1 AND category = $2 AND tournament_id = $3
+            ORDER BY inserted_at DESC
+            LIMIT 1;
+        """,
+        "SELECT user_id, category, tournament_id FROM tournament_records LIMIT 1;",
+    ),
+    PlanCheck(
+        "duel_in_match",
+        "SELECT 1 FROM user_duels WHERE (user_id = $1 or user_id = $2) AND result = 0 LIMIT 1;",
+        "SELECT min(user_id), max(user_id) FROM user_duels;",
+    ),
+    PlanCheck(
+        "search_users",
+        SEARCH_QUERIES["user"][0],
+        "SELECT left(nickname, 4), 25 FROM users LIMIT 1;",
+    ),
+    PlanCheck(
+        "search_levels",
+        SEARCH_QUERIES["level"][0],
+        "SELECT left(level, 4), 25, NULL FROM map_levels LIMIT 1;",
+        optional=(2,),
+    ),
+    PlanCheck(
+        "search_levels_on_map",
+        SEARCH_QUERIES["level"][0],
+        "SELECT left(level, 4), 25, map_code FROM map_levels LIMIT 1;",
+    ),
+]
+
+
+def _seq_scans(plan: dict) -> typing.Iterator[str]:
+    if plan.get("Node Type") == "Seq Scan":
+        yield plan["Relation Name"]
+    for child in plan.get("Plans", []):
+        yield from _seq_scans(child)
+
+
+async def _row_estimates(connection: asyncpg.Connection) -> dict[str, float]:
+    query = """
+        SELECT relname, reltuples
+        FROM pg_class c
+                 JOIN pg_namespace n ON n.oid = c.relnamespace
+        WHERE relkind = 'r' AND nspname = current_schema();
+    """
+    return {row["relname"]: row["reltuples"] for row in await connection.fetch(query)}
+
+
+async def check(connection: asyncpg.Connection, min_rows: int) -> list[str]:
+    """Return a description of every sequential scan on a table with at least ``min_rows`` rows."""
+    estimates = await _row_estimates(connection)
+    problems = []
+    for plan_check in CHECKS:
+        args = await connection.fetchrow(plan_check.sample)
+        if args is None or any(v is None for i, v in enumerate(args.values()) if i not in plan_check.optional):
+            print(f"{plan_check.name:<28} skipped (no sample data)", file=sys.stderr)
+            continue
+        raw = await connection.fetchval("EXPLAIN (FORMAT JSON) " + plan_check.query, *args.values())
+        plan = (json.loads(raw) if isinstance(raw, str) else raw)[0]["Plan"]
+        large = [t for t in _seq_scans(plan) if estimates.get(t, 0) >= min_rows]
+        for table in large:
+            problems.append(f"{plan_check.name}: sequential scan on {table} (~{int(estimates[table])} rows)")
+        print(f"{plan_check.name:<28} {'SEQ SCAN ' + ', '.join(large) if large else 'ok'}", file=sys.stderr)
+    return problems
+
+
+async def main(args: argparse.Namespace) -> int:
+    connection = await asyncpg.connect(args.dsn or default_dsn())
+    try:
+        problems = await check(connection, args.min_rows)
+    finally:
+        await connection.close()
+    for problem in problems:
+        print(problem)
+    return 1 if problems else 0
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(prog="python -m postgres.check_plans", description="Flag unindexed hot queries.")
+    parser.add_argument("--dsn", help="Connection string. Defaults to the bot's PSQL_* environment variables.")
+    parser.add_argument("--min-rows", type=int, default=10_000, help="Only flag tables at least this large.")
+    sys.exit(asyncio.run(main(parser.parse_args())))
@@ -0,0 +1,112 @@
+"""
+Versioned schema migrations.
+
+Migrations are the ``NNNN_name.sql`` files in ``postgres/migrations``,
+applied in order and recorded in ``schema_migrations``. Each file runs in its own transaction.
+
+    python -m postgres.migrate            # apply pending migrations
+    python -m postgres.migrate --list     # show applied/pending migrations
+
+Without ``--dsn`` the connection is built from the same environment variables as ``main.py``.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import os
+import pathlib
+import re
+import typing
+
+import asyncpg
+
+MIGRATIONS_DIR = pathlib.Path(__file__).with_name("migrations")
+_FILENAME = re.compile(r"^(\d{4})_(\w+)\.sql$")
+# Arbitrary key so concurrent runs (e.g. two containers starting) don't interleave.
+_LOCK_KEY = 0x0D00_3000
+
+
+class Migration(typing.NamedTuple):
+    version: int
+    name: str
+    path: pathlib.Path
+
+    @property
+    def sql(self) -> str:
+        return self.path.read_text(encoding="utf8")
+
+
+def discover(directory: pathlib.Path = MIGRATIONS_DIR) -> list[Migration]:
+    migrations = []
+    for path in directory.iterdir():
+        if match := _FILENAME.match(path.name):
+            migrations.append(Migration(int(match.group(1)), match.group(2), path))
+    migrations.sort()
+    versions = [m.version for m in migrations]
+    if len(versions) != len(set(versions)):
+        raise RuntimeError("Duplicate migration version found.")
+    return migrations
+
+
+async def applied_versions(connection: asyncpg.Connection) -> set[int]:
+    query = """
+        CREATE TABLE IF NOT EXISTS schema_migrations
+        (
+            version    int PRIMARY KEY,
+            name       text        NOT NULL,
+            applied_at timestamptz NOT NULL DEFAULT now()
+        );
+    """
+    await connection.execute(query)
+    rows = await connection.fetch("SELECT version FROM schema_migrations;")
+    return {row["version"] for row in rows}
+
+
+async def apply_migrations(connection: asyncpg.Connection, *, target: int | None = None) -> list[Migration]:
+    """Apply every pending migration up to ``target`` (inclusive) and return the ones applied."""
+    await connection.execute("SELECT pg_advisory_lock($1);", _LOCK_KEY)
+    try:
+        done = await applied_versions(connection)
+        applied = []
+        for migration in discover():
+            if migration.version in done or (target is not None and migration.version > target):
+                continue
+            async with connection.transaction():
+                await connection.execute(migration.sql)
+                await connection.execute(
+                    "INSERT INTO schema_migrations (version, name) VALUES ($1, $2);",
+                    migration.version,
+                    migration.name,
+                )
+            applied.append(migration)
+        return applied
+    finally:
+        await connection.execute("SELECT pg_advisory_unlock($1);", _LOCK_KEY)
+
+
+def default_dsn() -> str:
+    return f"postgres://{os.environ['PSQL_USER']}:{os.environ['PSQL_PASSWORD']}@db/doom3"
+
+
+async def main(args: argparse.Namespace) -> None:
+    connection = await asyncpg.connect(args.dsn or default_dsn())
+    try:
+        if args.list:
+            done = await applied_versions(connection)
+            for migration in discover():
+                status = "applied" if migration.version in done else "pending"
+                print(f"{migration.version:04} {migration.name:<40} {status}")
+            return
+        for migration in await apply_migrations(connection, target=args.target):
+            print(f"Applied {migration.version:04} {migration.name}")
+    finally:
+        await connection.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(prog="python -m postgres.migrate", description="Apply schema migrations.")
+    parser.add_argument("--dsn", help="Connection string. Defaults to the bot's PSQL_* environment variables.")
+    parser.add_argument("--target", type=int, help="Stop after this migration version.")
+    parser.add_argument("--list", action="store_true", help="List migrations and whether they are applied.")
+    asyncio.run(main(parser.parse_args()))
@@ -0,0 +1,244 @@
+-- Baseline schema, reconstructed from the queries in the bot.
+-- Everything is IF NOT EXISTS so this is a no-op on a database that predates the migrations.
+
+CREATE TABLE IF NOT EXISTS users
+(
+    user_id   bigint PRIMARY KEY,
+    nickname  text    NOT NULL,
+    alertable boolean NOT NULL DEFAULT TRUE
+);
+
+CREATE TABLE IF NOT EXISTS maps
+(
+    map_code text PRIMARY KEY,
+    map_name text    NOT NULL,
+    map_type text[]  NOT NULL DEFAULT '{}',
+    "desc"   text,
+    official boolean NOT NULL DEFAULT FALSE,
+    image    text
+);
+
+CREATE TABLE IF NOT EXISTS map_creators
+(
+    map_code text   NOT NULL REFERENCES maps ON UPDATE CASCADE ON DELETE CASCADE,
+    user_id  bigint NOT NULL REFERENCES users ON UPDATE CASCADE ON DELETE CASCADE,
+    PRIMARY KEY (map_code, user_id)
+);
+
+CREATE TABLE IF NOT EXISTS map_levels
+(
+    map_code text NOT NULL REFERENCES maps ON UPDATE CASCADE ON DELETE CASCADE,
+    level    text NOT NULL,
+    PRIMARY KEY (map_code, level)
+);
+
+CREATE TABLE IF NOT EXISTS map_level_ratings
+(
+    map_code text   NOT NULL,
+    level    text   NOT NULL,
+    user_id  bigint NOT NULL,
+    rating   int    NOT NULL,
+    PRIMARY KEY (map_code, level, user_id)
+);
+
+CREATE TABLE IF NOT EXISTS records
+(
+    map_code    text          NOT NULL REFERENCES maps ON UPDATE CASCADE ON DELETE CASCADE,
+    user_id     bigint        NOT NULL REFERENCES users ON UPDATE CASCADE ON DELETE CASCADE,
+    level_name  text          NOT NULL,
+    record      numeric(10, 2) NOT NULL,
+    screenshot  text,
+    video       text,
+    message_id  bigint,
+    channel_id  bigint,
+    hidden_id   bigint,
+    verified    boolean       NOT NULL DEFAULT FALSE,
+    inserted_at timestamptz   NOT NULL DEFAULT now()
+);
+
+CREATE TABLE IF NOT EXISTS tournament
+(
+    id      serial PRIMARY KEY,
+    title   text,
+    start   timestamptz NOT NULL,
+    "end"   timestamptz NOT NULL,
+    active  boolean     NOT NULL DEFAULT FALSE,
+    bracket boolean     NOT NULL DEFAULT FALSE,
+    roles   bigint[]
+);
+
+CREATE TABLE IF NOT EXISTS tournament_maps
+(
+    id       int  NOT NULL REFERENCES tournament ON DELETE CASCADE,
+    code     text NOT NULL,
+    level    text NOT NULL,
+    creator  text,
+    category text NOT NULL,
+    PRIMARY KEY (id, category)
+);
+
+CREATE TABLE IF NOT EXISTS tournament_records
+(
+    tournament_id int            NOT NULL REFERENCES tournament ON DELETE CASCADE,
+    user_id       bigint         NOT NULL REFERENCES users ON UPDATE CASCADE ON DELETE CASCADE,
+    category      text           NOT NULL,
+    record        numeric(10, 2) NOT NULL,
+    screenshot    text,
+    inserted_at   timestamptz    NOT NULL DEFAULT now()
+);
+
+CREATE TABLE IF NOT EXISTS tournament_ranks
+(
+    value text PRIMARY KEY
+);
+
+CREATE TABLE IF NOT EXISTS user_ranks
+(
+    user_id  bigint NOT NULL REFERENCES users ON UPDATE CASCADE ON DELETE CASCADE,
+    category text   NOT NULL,
+    value    text   NOT NULL DEFAULT 'Unranked',
+    PRIMARY KEY (user_id, category)
+);
+
+CREATE TABLE IF NOT EXISTS tournament_missions
+(
+    id           int     NOT NULL REFERENCES tournament ON DELETE CASCADE,
+    type         text    NOT NULL,
+    target       numeric NOT NULL,
+    extra_target text,
+    difficulty   text    NOT NULL,
+    category     text    NOT NULL,
+    PRIMARY KEY (id, category, difficulty)
+);
+
+CREATE TABLE IF NOT EXISTS user_xp
+(
+    user_id bigint NOT NULL REFERENCES users ON UPDATE CASCADE ON DELETE CASCADE,
+    xp      int    NOT NULL DEFAULT 0,
+    season  int    NOT NULL,
+    PRIMARY KEY (user_id, season)
+);
+
+CREATE TABLE IF NOT EXISTS user_duels
+(
+    user_id bigint NOT NULL REFERENCES users ON UPDATE CASCADE ON DELETE CASCADE,
+    duel_id int    NOT NULL,
+    num     int,
+    ready   boolean NOT NULL DEFAULT FALSE,
+    result  int     NOT NULL DEFAULT 0,
+    wins    int     NOT NULL DEFAULT 0,
+    losses  int     NOT NULL DEFAULT 0,
+    PRIMARY KEY (duel_id, user_id)
+);
+
+CREATE TABLE IF NOT EXISTS verification_counts
+(
+    user_id bigint PRIMARY KEY REFERENCES users ON UPDATE CASCADE ON DELETE CASCADE,
+    amount  int NOT NULL DEFAULT 0
+);
+
+CREATE TABLE IF NOT EXISTS top_records
+(
+    user_id             bigint NOT NULL,
+    original_message_id bigint NOT NULL,
+    channel_id          bigint NOT NULL,
+    top_record_id       bigint,
+    PRIMARY KEY (user_id, original_message_id, channel_id)
+);
+
+CREATE TABLE IF NOT EXISTS guides
+(
+    map_code text NOT NULL REFERENCES maps ON UPDATE CASCADE ON DELETE CASCADE,
+    url      text NOT NULL,
+    PRIMARY KEY (map_code, url)
+);
+
+CREATE TABLE IF NOT EXISTS all_map_names
+(
+    name text PRIMARY KEY
+);
+
+CREATE TABLE IF NOT EXISTS all_map_types
+(
+    name text PRIMARY KEY
+);
+
+CREATE TABLE IF NOT EXISTS tournament_seasons
+(
+    number serial PRIMARY KEY,
+    name   text    NOT NULL,
+    active boolean NOT NULL DEFAULT FALSE
+);
+
+CREATE TABLE IF NOT EXISTS map_contest
+(
+    user_id       bigint NOT NULL REFERENCES users ON UPDATE CASCADE ON DELETE CASCADE,
+    tournament_id int    NOT NULL REFERENCES tournament ON DELETE CASCADE,
+    map_code      text   NOT NULL,
+    PRIMARY KEY (user_id, tournament_id)
+);
+
+CREATE TABLE IF NOT EXISTS duels
+(
+    id         serial PRIMARY KEY,
+    thread_id  bigint,
+    thread_msg bigint,
+    wager      int NOT NULL DEFAULT 0,
+    start      timestamptz,
+    "end"      timestamptz
+);
+
+CREATE TABLE IF NOT EXISTS tags
+(
+    name  text PRIMARY KEY,
+    value text NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS keep_alives
+(
+    thread_id bigint PRIMARY KEY
+);
+
+CREATE TABLE IF NOT EXISTS auto_join_thread
+(
+    channel_id bigint NOT NULL,
+    thread_id  bigint NOT NULL,
+    PRIMARY KEY (channel_id, thread_id)
+);
+
+CREATE TABLE IF NOT EXISTS insults
+(
+    id    serial PRIMARY KEY,
+    value text NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS colors
+(
+    role_id    bigint PRIMARY KEY,
+    label      text NOT NULL,
+    emoji      text,
+    sort_order int  NOT NULL DEFAULT 0
+);
+
+CREATE TABLE IF NOT EXISTS all_exercises
+(
+    name text PRIMARY KEY,
+    type text NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS exercises
+(
+    name      text PRIMARY KEY,
+    location  text,
+    target    text,
+    equipment text,
+    url       text
+);
+
+CREATE TABLE IF NOT EXISTS gym_records
+(
+    user_id  bigint  NOT NULL,
+    exercise text    NOT NULL,
+    value    numeric NOT NULL,
+    PRIMARY KEY (user_id, exercise)
+);
@@ -0,0 +1,26 @@
+-- Indexes for the predicates the bot filters on most often.
+
+-- Latest record per user/map/level (submit_record, remove_record).
+CREATE INDEX IF NOT EXISTS records_map_level_user_inserted_idx
+    ON records (map_code, level_name, user_id, inserted_at DESC);
+
+-- Verification queue lookups (VerificationView, persistent views on startup).
+CREATE INDEX IF NOT EXISTS records_hidden_id_idx
+    ON records (hidden_id)
+    WHERE hidden_id IS NOT NULL;
+
+-- Top record reactions.
+CREATE INDEX IF NOT EXISTS records_message_id_idx
+    ON records (message_id);
+
+CREATE INDEX IF NOT EXISTS top_records_original_message_channel_idx
+    ON top_records (original_message_id, channel_id);
+
+-- Latest submission per user/category (tournament submissions and leaderboards).
+CREATE INDEX IF NOT EXISTS tournament_records_tournament_category_user_inserted_idx
+    ON tournament_records (tournament_id, category, user_id, inserted_at DESC)
+    INCLUDE (record);
+
+-- Duel requests check whether either player is already in a match.
+CREATE INDEX IF NOT EXISTS user_duels_user_id_result_idx
+    ON user_duels (user_id, result);
@@ -0,0 +1,19 @@
+-- Trigram indexes behind Database.search (autocomplete fallbacks for users, maps, levels, tags and seasons).
+-- Serve the word_similarity operator (<%) used by database/search.py.
+
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+
+CREATE INDEX IF NOT EXISTS users_nickname_trgm_idx
+    ON users USING gin (nickname gin_trgm_ops);
+
+CREATE INDEX IF NOT EXISTS maps_map_name_trgm_idx
+    ON maps USING gin (map_name gin_trgm_ops);
+
+CREATE INDEX IF NOT EXISTS map_levels_level_trgm_idx
+    ON map_levels USING gin (level gin_trgm_ops);
+
+CREATE INDEX IF NOT EXISTS tags_name_trgm_idx
+    ON tags USING gin (name gin_trgm_ops);
+
+CREATE INDEX IF NOT EXISTS tournament_seasons_name_trgm_idx
+    ON tournament_seasons USING gin (name gin_trgm_ops);
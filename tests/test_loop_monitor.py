@@ -0,0 +1,38 @@
+import asyncio
+import time
+import types
+
+import core
+from core.loop_monitor import LoopMonitor
+
+
+class Relay:
+    async def on_message(self, message):
+        time.sleep(0.03)
+
+
+class Redirect:
+    async def on_message(self, message):
+        time.sleep(0.03)
+
+
+def test_listeners_are_attributed_separately():
+    async def run():
+        bot = core.Doom()
+        bot.loop = asyncio.get_running_loop()
+        bot.add_listener(Relay().on_message)
+        bot.add_listener(Redirect().on_message)
+        # A bot author makes the bot's own on_message (process_commands) return straight away.
+        message = types.SimpleNamespace(author=types.SimpleNamespace(bot=True))
+        monitor = LoopMonitor(slow_callback=0.02, probe_interval=10)
+        monitor.start()
+        try:
+            bot.dispatch("message", message)
+            await asyncio.sleep(0.2)
+        finally:
+            await monitor.close()
+        return {stats.label for stats in monitor.slow_callbacks()}
+
+    labels = asyncio.run(run())
+    assert "Relay.on_message (on_message)" in labels
+    assert "Redirect.on_message (on_message)" in labels
@@ -0,0 +1,67 @@
+import decimal
+import random
+
+import pytest
+
+import core  # noqa: F401  (imported first to settle the utils <-> cogs import cycle)
+from benchmarks.times import legacy_pretty_record, legacy_time_convert, make_times
+from utils.times import pretty_record, pretty_records, time_convert
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_matches_legacy_on_random_times(seed):
+    times = make_times(2_000, random.Random(seed))
+    assert any(t < 0 for t in times)
+    assert pretty_records(times) == [legacy_pretty_record(t) for t in times]
+    for record in times:
+        formatted = legacy_pretty_record(record)
+        assert pretty_record(record) == formatted
+        assert time_convert(formatted) == legacy_time_convert(formatted)
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_round_trip(seed):
+    for record in make_times(2_000, random.Random(seed)):
+        formatted = pretty_record(record)
+        if formatted == "-0.00":
+            # Negative times under a centisecond parse back to zero, which formats without the sign.
+            continue
+        assert pretty_record(time_convert(formatted)) == formatted
+
+
+@pytest.mark.parametrize(
+    ("record", "expected"),
+    [
+        (decimal.Decimal("-5.25"), "-5.25"),
+        (-61.5, "-1:01.50"),
+        (-3661.01, "-01:01:01.01"),
+        (9.999, "9.99"),
+    ],
+)
+def test_known_values(record, expected):
+    assert pretty_record(record) == expected == legacy_pretty_record(record)
+
+
+def test_hours_are_not_wrapped_at_24():
+    assert pretty_record(90_000.5) == "25:00:00.50"
+    assert pretty_records([90_000.5]) == ["25:00:00.50"]
+    # The datetime-based formatter rolled over into the next day.
+    assert legacy_pretty_record(90_000.5) == "01:00:00.50"
+    assert time_convert("25:00:00.50") == 90_000.5
+
+
+@pytest.mark.parametrize("string", ["1:75", "1:60:00", "1:2:3:4", "abc", "", "1:-30", "--5"])
+def test_strict_parser_rejects(string):
+    with pytest.raises(ValueError):
+        time_convert(string)
+
+
+def test_legacy_parser_accepted_out_of_range_units():
+    assert legacy_time_convert("1:75") == 135.0
+    with pytest.raises(ValueError):
+        time_convert("1:75")
+
+
+@pytest.mark.parametrize(("string", "expected"), [("-1:30.5", -90.5), (" 12.34 ", 12.34), (".5", 0.5), ("01:02:03", 3723.0)])
+def test_parser_values(string, expected):
+    assert time_convert(string) == expected
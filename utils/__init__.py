@@ -1,8 +1,18 @@
+from utils.assets import *
+from utils.attachments import *
 from utils.constants import *
+from utils.embed_assets import *
 from utils.embeds import *
 from utils.emojify import *
 from utils.errors import *
+from utils.map_stats import *
 from utils.maps import *
+from utils.random_maps import *
+from utils.record_index import *
 from utils.records import *
+from utils.tag_store import *
+from utils.times import *
 from utils.translations import *
+from utils.trigrams import *
 from utils.utils import *
+from utils.verifications import *
@@ -0,0 +1,94 @@
+from __future__ import annotations
+
+import array
+import bisect
+import functools
+import json
+import logging
+import math
+import random
+import sys
+import time
+
+log = logging.getLogger(__name__)
+
+ASSETS_DIR = "assets"
+
+# Resident size in bytes of every compiled asset, by name, filled in as each one is first loaded.
+_sizes: dict[str, int] = {}
+
+
+def _load_json(name: str):
+    with open(f"{ASSETS_DIR}/{name}", "r", encoding="utf8") as f:
+        return json.load(f)
+
+
+class EmojiTable:
+    """``emoji-data.json`` (word -> {emoji: frequency}) packed into flat arrays.
+
+    Each word maps to a row; a row's emojis are ids into one pool of interned strings,
+    stored next to the running total of their frequencies so a weighted pick is a
+    ``bisect`` over the row's slice.
+    """
+
+    def __init__(self, data: dict[str, dict[str, int]]):
+        self._rows: dict[str, int] = {}
+        self._starts = array.array("I", [0])
+        self._emoji_ids = array.array("I")
+        self._cum_weights = array.array("I")
+        pool: dict[str, int] = {}
+        for word, frequencies in data.items():
+            total = 0
+            for emoji, freq in frequencies.items():
+                if freq <= 0:
+                    continue
+                total += freq
+                self._emoji_ids.append(pool.setdefault(sys.intern(emoji), len(pool)))
+                self._cum_weights.append(total)
+            if total:
+                self._rows[sys.intern(word)] = len(self._starts) - 1
+                self._starts.append(len(self._emoji_ids))
+        self._emojis = tuple(pool)
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def __contains__(self, word: str) -> bool:
+        return word in self._rows
+
+    def sample(self, word: str) -> str | None:
+        """A random emoji for ``word``, weighted by frequency, or None if it has none."""
+        row = self._rows.get(word)
+        if row is None:
+            return None
+        lo, hi = self._starts[row], self._starts[row + 1]
+        pick = math.floor(random.random() * self._cum_weights[hi - 1])
+        return self._emojis[self._emoji_ids[bisect.bisect_right(self._cum_weights, pick, lo, hi)]]
+
+    def nbytes(self) -> int:
+        """Approximate resident size of the table, including its strings."""
+        size = sys.getsizeof(self._rows) + sys.getsizeof(self._emojis)
+        size += sum(sys.getsizeof(word) for word in self._rows)
+        size += sum(sys.getsizeof(emoji) for emoji in self._emojis)
+        size += sum(a.buffer_info()[1] * a.itemsize for a in (self._starts, self._emoji_ids, self._cum_weights))
+        return size
+
+
+@functools.cache
+def emoji_table() -> EmojiTable:
+    """The emoji table, parsed and packed on first use and shared by every caller."""
+    started = time.perf_counter()
+    table = EmojiTable(_load_json("emoji-data.json"))
+    _sizes["emoji-data.json"] = table.nbytes()
+    log.info(
+        "Loaded emoji-data.json: %s words, %.0f KiB in %.0fms",
+        len(table),
+        _sizes["emoji-data.json"] / 1024,
+        (time.perf_counter() - started) * 1000,
+    )
+    return table
+
+
+def asset_sizes() -> dict[str, int]:
+    """Resident size in bytes of each asset loaded so far."""
+    return dict(_sizes)
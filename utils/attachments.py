@@ -0,0 +1,55 @@
+from __future__ import annotations
+
+import asyncio
+import io
+
+import discord
+from PIL import Image, UnidentifiedImageError
+
+# Screenshots above this size are downscaled before being uploaded again.
+MAX_SCREENSHOT_BYTES = 4 * 1024 * 1024
+MAX_SCREENSHOT_DIMENSION = 2560
+
+
+def _shrink(data: bytes, max_dimension: int) -> bytes:
+    """Downscale to fit ``max_dimension`` and re-encode as an optimized PNG.
+
+    Returns the original bytes if they aren't an image or shrinking doesn't help.
+    """
+    try:
+        with Image.open(io.BytesIO(data)) as image:
+            image.thumbnail((max_dimension, max_dimension))
+            out = io.BytesIO()
+            image.save(out, format="PNG", optimize=True)
+    except (UnidentifiedImageError, OSError, ValueError):
+        return data
+    shrunk = out.getvalue()
+    return shrunk if len(shrunk) < len(data) else data
+
+
+class Screenshot:
+    """An attachment downloaded once and re-uploadable any number of times.
+
+    ``discord.File`` is consumed by the upload it is sent with, so each call to
+    ``to_file`` wraps the same in-memory bytes in a new one.
+    """
+
+    def __init__(self, data: bytes, filename: str = "image.png"):
+        self.data = data
+        self.filename = filename
+
+    @classmethod
+    async def from_attachment(
+        cls,
+        attachment: discord.Attachment,
+        *,
+        filename: str = "image.png",
+        shrink: bool = True,
+    ) -> Screenshot:
+        data = await attachment.read()
+        if shrink and len(data) > MAX_SCREENSHOT_BYTES:
+            data = await asyncio.to_thread(_shrink, data, MAX_SCREENSHOT_DIMENSION)
+        return cls(data, filename)
+
+    def to_file(self) -> discord.File:
+        return discord.File(io.BytesIO(self.data), filename=self.filename)
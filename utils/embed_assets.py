@@ -0,0 +1,46 @@
+from __future__ import annotations
+
+import functools
+import re
+import typing
+
+DEFAULT_THUMBNAIL_URL = "https://i.imgur.com/kxjwdYi.png"
+DEFAULT_IMAGE_URL = "https://i.imgur.com/YhJokJW.png"
+
+_MAP_THUMBNAIL_URL = "https://bkan0n.com/assets/images/maps/{}.png"
+_MAP_BANNER_URL = "https://bkan0n.com/assets/images/map_banners/{}.png"
+_SLUG_PATTERN = re.compile(r"[:'\s]")
+
+
+class MapAssets(typing.NamedTuple):
+    slug: str
+    thumbnail: str
+    banner: str
+
+
+# Every map in views.maps.MAP_DATA, filled in as its metadata is created.
+_REGISTRY: dict[str, MapAssets] = {}
+
+
+@functools.lru_cache(maxsize=512)
+def _build_map_assets(map_name: str) -> MapAssets:
+    slug = _SLUG_PATTERN.sub("", map_name).lower()
+    return MapAssets(slug, _MAP_THUMBNAIL_URL.format(slug), _MAP_BANNER_URL.format(slug))
+
+
+def register_map_assets(map_name: str) -> MapAssets:
+    """Precompute and keep the slug and URLs for a known map."""
+    assets = _REGISTRY[map_name] = _build_map_assets(map_name)
+    return assets
+
+
+def map_assets(map_name: str) -> MapAssets:
+    """Slug and image URLs for ``map_name``.
+
+    Registered maps are a dict lookup; any other name is memoized, so building
+    every page of a large result set doesn't redo the string work.
+    """
+    assets = _REGISTRY.get(map_name)
+    if assets is None:
+        assets = _build_map_assets(map_name)
+    return assets
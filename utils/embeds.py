@@ -1,10 +1,11 @@
 from __future__ import annotations
 
-import re
 import typing
 
 import discord
 
+from utils.embed_assets import DEFAULT_IMAGE_URL, DEFAULT_THUMBNAIL_URL, map_assets
+
 
 class DoomEmbed(discord.Embed):
     def __init__(
@@ -22,15 +23,8 @@ class DoomEmbed(discord.Embed):
 
         super().__init__(color=color, title=title, url=url, description=description)
 
-        if not thumbnail:
-            self.set_thumbnail(url="https://i.imgur.com/kxjwdYi.png")
-        else:
-            self.set_thumbnail(url=thumbnail)
-
-        if not image:
-            self.set_image(url="https://i.imgur.com/YhJokJW.png")
-        else:
-            self.set_image(url=image)
+        self.set_thumbnail(url=thumbnail or DEFAULT_THUMBNAIL_URL)
+        self.set_image(url=image or DEFAULT_IMAGE_URL)
 
     def add_description_field(self, name: str, value: str):
         if not self.description:
@@ -74,8 +68,7 @@ def set_embed_thumbnail_maps(map_name: str, embed: discord.Embed) -> discord.Emb
     Returns:
         The embed object with the thumbnail set to a map's image
     """
-    map_name = re.sub(r"[:'\s]", "", map_name).lower()
-    embed.set_thumbnail(url=f"https://bkan0n.com/assets/images/maps/{map_name}.png")
+    embed.set_thumbnail(url=map_assets(map_name).thumbnail)
     return embed
 
 
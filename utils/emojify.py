@@ -1,53 +1,37 @@
-import json
-import math
-import random
-
-with open("assets/emoji-data.json", "r", encoding="utf8") as f:
-    mapping = json.load(f)
-
-common_words = [
-    "a",
-    "an",
-    "as",
-    "is",
-    "if",
-    "of",
-    "the",
-    "it",
-    "its",
-    "or",
-    "are",
-    "this",
-    "with",
-    "so",
-    "to",
-    "at",
-    "was",
-    "and",
-]
+from utils.assets import emoji_table
+
+common_words = frozenset(
+    {
+        "a",
+        "an",
+        "as",
+        "is",
+        "if",
+        "of",
+        "the",
+        "it",
+        "its",
+        "or",
+        "are",
+        "this",
+        "with",
+        "so",
+        "to",
+        "at",
+        "was",
+        "and",
+    }
+)
 
 
 def emojify(text: str) -> str:
-    split_text = text.split()
-    res = ""
-    for raw in split_text:
+    table = emoji_table()
+    res = []
+    for raw in text.split():
         word = raw.lower()
-        random_choice = random.random() * 100 <= 100
-        is_common = word in common_words
-        emojis = []
-
-        temp_map = mapping.get(word, None)
-        if temp_map:
-            for emoji, freq in temp_map.items():
-                emojis += [emoji] * freq
-
-        if is_common or not random_choice or len(emojis) == 0:
-            res += raw
-        else:
-            emojis = emojis[math.floor(random.random() * len(emojis))]
-            res += f"{raw} {emojis}"
-        res += " "
-    return res
+        emoji = None if word in common_words else table.sample(word)
+        res.append(raw if emoji is None else f"{raw} {emoji}")
+    return "".join(f"{part} " for part in res)
 
 
 def uwuify(string: str) -> str:
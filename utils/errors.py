@@ -115,6 +115,10 @@ class NoDataOnCurrentSeason(BaseParkourException):
     """No data found for this user during the selected season."""
 
 
+class InvalidSeasonError(BaseParkourException, app_commands.errors.AppCommandError):
+    """Invalid season given. Please make sure to use the autocompleted seasons."""
+
+
 async def on_app_command_error(interaction: DoomItx, error: app_commands.errors.AppCommandError):
     exception = getattr(error, "original", error)
     if isinstance(exception, utils.BaseParkourException):
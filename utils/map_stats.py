@@ -0,0 +1,97 @@
+from __future__ import annotations
+
+import bisect
+import typing
+
+if typing.TYPE_CHECKING:
+    from utils import UserCacheData
+
+
+class MapStats(typing.TypedDict):
+    map_code: str
+    map_name: str
+    map_type: list[str]
+    desc: str | None
+    official: bool
+    image: str | None
+    creator_ids: list[int]
+    rating_total: int
+    rating_count: int
+
+
+class MapStatsStore:
+    """Map details and rating aggregates for /map_search and /random_map.
+
+    Creator names are resolved from ``all_users`` when displayed so nickname
+    changes never leave a stale copy here.
+    """
+
+    def __init__(self):
+        self._maps: dict[str, MapStats] = {}
+        self._codes: list[str] = []
+
+    def load(self, rows: typing.Iterable[MapStats]) -> None:
+        self._maps = {row["map_code"]: row for row in rows}
+        self._codes = sorted(self._maps)
+
+    def add(self, stats: MapStats) -> None:
+        if stats["map_code"] not in self._maps:
+            bisect.insort(self._codes, stats["map_code"])
+        self._maps[stats["map_code"]] = stats
+
+    def get(self, map_code: str) -> MapStats | None:
+        return self._maps.get(map_code)
+
+    def set_image(self, map_code: str, image: str) -> None:
+        if map_code in self._maps:
+            self._maps[map_code]["image"] = image
+
+    def add_creator(self, map_code: str, user_id: int) -> None:
+        if map_code in self._maps and user_id not in self._maps[map_code]["creator_ids"]:
+            self._maps[map_code]["creator_ids"].append(user_id)
+
+    def remove_creator(self, map_code: str, user_id: int) -> None:
+        if map_code in self._maps and user_id in self._maps[map_code]["creator_ids"]:
+            self._maps[map_code]["creator_ids"].remove(user_id)
+
+    def rate(self, map_code: str, old_rating: int | None, new_rating: int) -> None:
+        """Apply a user's rating upsert. ``old_rating`` is their previous rating, if any."""
+        if map_code not in self._maps:
+            return
+        stats = self._maps[map_code]
+        if old_rating is None:
+            stats["rating_count"] += 1
+            stats["rating_total"] += new_rating
+        else:
+            stats["rating_total"] += new_rating - old_rating
+
+    @staticmethod
+    def rating(stats: MapStats) -> float | None:
+        return stats["rating_total"] / stats["rating_count"] if stats["rating_count"] else None
+
+    @staticmethod
+    def creators(stats: MapStats, users: dict[int, UserCacheData]) -> str:
+        names = {users[user_id]["nickname"] for user_id in stats["creator_ids"] if user_id in users}
+        return ", ".join(sorted(names))
+
+    def search(
+        self,
+        *,
+        map_type: str | None = None,
+        map_name: str | None = None,
+        creator: int | None = None,
+        map_code: str | None = None,
+    ) -> list[MapStats]:
+        """Maps matching every given filter, ordered by map code. Maps without creators are excluded."""
+        if map_code is not None:
+            candidates = [self._maps[map_code]] if map_code in self._maps else []
+        else:
+            candidates = (self._maps[code] for code in self._codes)
+        return [
+            stats
+            for stats in candidates
+            if stats["creator_ids"]
+            and (map_type is None or map_type in stats["map_type"])
+            and (map_name is None or stats["map_name"] == map_name)
+            and (creator is None or creator in stats["creator_ids"])
+        ]
@@ -0,0 +1,157 @@
+from __future__ import annotations
+
+import random
+import typing
+
+if typing.TYPE_CHECKING:
+    from utils import MapCacheData
+
+# Weight given to levels nobody has rated yet, so new maps still come up in weighted picks.
+UNRATED_WEIGHT = 2.5
+
+
+class AliasTable:
+    """Vose's alias method. O(n) to build, O(1) per sample."""
+
+    def __init__(self, weights: typing.Sequence[float]):
+        n = len(weights)
+        self.prob = [0.0] * n
+        self.alias = [0] * n
+        total = sum(weights)
+        if not n or total <= 0:
+            return
+        scaled = [w * n / total for w in weights]
+        small = [i for i, w in enumerate(scaled) if w < 1]
+        large = [i for i, w in enumerate(scaled) if w >= 1]
+        while small and large:
+            s, g = small.pop(), large.pop()
+            self.prob[s] = scaled[s]
+            self.alias[s] = g
+            scaled[g] -= 1 - scaled[s]
+            (small if scaled[g] < 1 else large).append(g)
+        for i in small + large:
+            self.prob[i] = 1.0
+
+    def __len__(self) -> int:
+        return len(self.prob)
+
+    def sample(self, rng: random.Random | None = None) -> int:
+        rng = rng or random
+        i = rng.randrange(len(self.prob))
+        return i if rng.random() < self.prob[i] else self.alias[i]
+
+
+class MapPicker:
+    """Random map and level selection over the maps in ``map_cache``.
+
+    Maps and levels are kept in flat lists with a position index so picks are O(1)
+    and additions/removals are O(1) swap-removes. Rating-weighted picks use an alias
+    table that is rebuilt lazily after the levels or ratings change.
+    """
+
+    def __init__(self):
+        self._codes: list[str] = []
+        self._code_index: dict[str, int] = {}
+        self._levels: list[tuple[str, str]] = []
+        self._level_index: dict[tuple[str, str], int] = {}
+        self._map_levels: dict[str, list[str]] = {}
+        # (map_code, level) -> [sum of ratings, number of ratings]
+        self._ratings: dict[tuple[str, str], list[int]] = {}
+        self._alias: AliasTable | None = None
+
+    @staticmethod
+    def _append(items: list, index: dict, item) -> None:
+        if item in index:
+            return
+        index[item] = len(items)
+        items.append(item)
+
+    @staticmethod
+    def _swap_remove(items: list, index: dict, item) -> None:
+        pos = index.pop(item, None)
+        if pos is None:
+            return
+        last = items.pop()
+        if pos < len(items):
+            items[pos] = last
+            index[last] = pos
+
+    def load(
+        self,
+        map_cache: dict[str, MapCacheData],
+        ratings: typing.Iterable[tuple[str, str, int, int]] = (),
+    ) -> None:
+        """Rebuild from ``map_cache`` and ``(map_code, level, rating_sum, rating_count)`` rows."""
+        self.__init__()
+        for map_code, data in map_cache.items():
+            self.add_map(map_code, data["levels"])
+        for map_code, level, total, count in ratings:
+            self._ratings[(map_code, level)] = [total, count]
+
+    def add_map(self, map_code: str, levels: typing.Iterable[str | None]) -> None:
+        self._append(self._codes, self._code_index, map_code)
+        for level in levels:
+            if level is not None:
+                self.add_level(map_code, level)
+
+    def remove_map(self, map_code: str) -> None:
+        for level in list(self._map_levels.get(map_code, [])):
+            self.remove_level(map_code, level)
+        self._map_levels.pop(map_code, None)
+        self._swap_remove(self._codes, self._code_index, map_code)
+
+    def add_level(self, map_code: str, level: str) -> None:
+        if (map_code, level) in self._level_index:
+            return
+        self._append(self._levels, self._level_index, (map_code, level))
+        self._map_levels.setdefault(map_code, []).append(level)
+        self._alias = None
+
+    def remove_level(self, map_code: str, level: str) -> None:
+        if (map_code, level) not in self._level_index:
+            return
+        self._swap_remove(self._levels, self._level_index, (map_code, level))
+        self._map_levels[map_code].remove(level)
+        self._ratings.pop((map_code, level), None)
+        self._alias = None
+
+    def rename_level(self, map_code: str, level: str, new_level: str) -> None:
+        ratings = self._ratings.pop((map_code, level), None)
+        self.remove_level(map_code, level)
+        self.add_level(map_code, new_level)
+        if ratings:
+            self._ratings[(map_code, new_level)] = ratings
+
+    def rate(self, map_code: str, level: str, old_rating: int | None, new_rating: int) -> None:
+        """Apply a user's rating upsert. ``old_rating`` is their previous rating, if any."""
+        total, count = self._ratings.setdefault((map_code, level), [0, 0])
+        if old_rating is None:
+            self._ratings[(map_code, level)] = [total + new_rating, count + 1]
+        else:
+            self._ratings[(map_code, level)] = [total - old_rating + new_rating, count]
+        self._alias = None
+
+    def level_rating(self, map_code: str, level: str) -> float | None:
+        total, count = self._ratings.get((map_code, level), (0, 0))
+        return total / count if count else None
+
+    def random_map(self) -> str | None:
+        """Uniformly random map code."""
+        return random.choice(self._codes) if self._codes else None
+
+    def random_level(self, map_code: str | None = None, *, weighted: bool = False) -> tuple[str, str] | None:
+        """Random ``(map_code, level)``.
+
+        With ``map_code`` the level is uniform within that map, otherwise uniform over
+        every level, or proportional to the level's average rating when ``weighted``.
+        """
+        if map_code is not None:
+            levels = self._map_levels.get(map_code)
+            return (map_code, random.choice(levels)) if levels else None
+        if not self._levels:
+            return None
+        if not weighted:
+            return random.choice(self._levels)
+        if self._alias is None or len(self._alias) != len(self._levels):
+            self._alias = AliasTable([self.level_rating(*level) or UNRATED_WEIGHT for level in self._levels])
+        return self._levels[self._alias.sample()]
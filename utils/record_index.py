@@ -0,0 +1,133 @@
+from __future__ import annotations
+
+import decimal
+import typing
+
+
+class PersonalRecord(typing.NamedTuple):
+    record: decimal.Decimal
+    screenshot: str | None
+    video: str | None
+
+
+class WorldRecordChange(typing.NamedTuple):
+    """Payload of the ``world_record`` event, dispatched when a verified record sets a new best time.
+
+    Subscribe with ``@commands.Cog.listener()`` on ``on_world_record(change)``.
+    """
+
+    map_code: str
+    level_name: str
+    user_id: int
+    record: decimal.Decimal
+    previous_record: decimal.Decimal | None
+    # Everyone who held the previous best time; may include ``user_id`` when they beat their own WR.
+    previous_holders: frozenset[int]
+
+    @property
+    def dethroned(self) -> frozenset[int]:
+        return self.previous_holders - {self.user_id}
+
+
+def level_sort_key(level_name: str) -> tuple[bool, str]:
+    """Numbered ``Level ...`` names first, then the rest, as the record queries order them."""
+    return level_name[:5] != "Level", level_name
+
+
+class RecordIndex:
+    """Each user's latest verified record per (map_code, level_name).
+
+    Backs /personal_records and the PR/WR context menus. Kept current by
+    verification, rejection and record removal. Also keeps the current best
+    time and its holders per level, so WR checks are O(1).
+    """
+
+    def __init__(self):
+        self._levels: dict[tuple[str, str], dict[int, PersonalRecord]] = {}
+        self._users: dict[int, set[tuple[str, str]]] = {}
+        self._best: dict[tuple[str, str], tuple[decimal.Decimal, frozenset[int]]] = {}
+
+    def load(self, rows: typing.Iterable[typing.Mapping[str, typing.Any]]) -> None:
+        """Rebuild from rows with user_id, map_code, level_name, record, screenshot and video."""
+        self.__init__()
+        for row in rows:
+            self.set(
+                row["user_id"],
+                row["map_code"],
+                row["level_name"],
+                PersonalRecord(row["record"], row["screenshot"], row["video"]),
+            )
+
+    def set(
+        self,
+        user_id: int,
+        map_code: str,
+        level_name: str,
+        record: PersonalRecord,
+    ) -> WorldRecordChange | None:
+        """Store ``record`` as the user's PR. Returns the change if it is a new best time for the level."""
+        key = (map_code, level_name)
+        level = self._levels.setdefault(key, {})
+        replaced = level.get(user_id)
+        level[user_id] = record
+        self._users.setdefault(user_id, set()).add(key)
+
+        best = self._best.get(key)
+        if best is None or record.record < best[0]:
+            self._best[key] = (record.record, frozenset({user_id}))
+            return WorldRecordChange(
+                map_code,
+                level_name,
+                user_id,
+                record.record,
+                best[0] if best else None,
+                best[1] if best else frozenset(),
+            )
+        if record.record == best[0]:
+            self._best[key] = (best[0], best[1] | {user_id})
+        elif replaced and user_id in best[1]:
+            # Only reachable when a PR gets slower (e.g. after a removal); recompute.
+            self._recompute_best(key)
+        return None
+
+    def remove(self, user_id: int, map_code: str, level_name: str) -> None:
+        key = (map_code, level_name)
+        level = self._levels.get(key, {})
+        level.pop(user_id, None)
+        if not level:
+            self._levels.pop(key, None)
+        self._users.get(user_id, set()).discard(key)
+        if user_id in self._best.get(key, (None, ()))[1]:
+            self._recompute_best(key)
+
+    def _recompute_best(self, key: tuple[str, str]) -> None:
+        level = self._levels.get(key)
+        if not level:
+            self._best.pop(key, None)
+            return
+        best = min(r.record for r in level.values())
+        self._best[key] = (best, frozenset(u for u, r in level.items() if r.record == best))
+
+    def world_record(self, map_code: str, level_name: str) -> tuple[decimal.Decimal, frozenset[int]] | None:
+        """Best time for the level and everyone holding it."""
+        return self._best.get((map_code, level_name))
+
+    def get(self, user_id: int, map_code: str, level_name: str) -> PersonalRecord | None:
+        return self._levels.get((map_code, level_name), {}).get(user_id)
+
+    def is_world_record(self, user_id: int, map_code: str, level_name: str) -> bool:
+        return user_id in self._best.get((map_code, level_name), (None, ()))[1]
+
+    def personal_records(
+        self,
+        user_id: int,
+        *,
+        wr_only: bool = False,
+    ) -> list[tuple[str, str, PersonalRecord]]:
+        """``(map_code, level_name, record)`` ordered by map code, then level."""
+        keys = sorted(self._users.get(user_id, ()), key=lambda k: (k[0], *level_sort_key(k[1])))
+        return [
+            (map_code, level_name, self._levels[(map_code, level_name)][user_id])
+            for map_code, level_name in keys
+            if not wr_only or self.is_world_record(user_id, map_code, level_name)
+        ]
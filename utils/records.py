@@ -1,17 +1,15 @@
 from __future__ import annotations
 
-import datetime
-import decimal
+import itertools
 import re
 import typing
 
-import discord
 from discord import Embed, app_commands
 
 import cogs
 import database
 import utils
-from utils import DoomEmbed
+from utils import HALF_VERIFIED, TROPHY, VERIFIED, DoomEmbed
 
 if typing.TYPE_CHECKING:
     from core import DoomItx
@@ -60,11 +58,10 @@ class MapLevelTransformer(app_commands.Transformer):
         return value
 
     async def autocomplete(self, itx: DoomItx, value: str) -> list[app_commands.Choice[str]]:
-        assert itx.client.map_cache
-        return await cogs.autocomplete(
-            value,
-            (itx.client.map_cache.get(itx.namespace.map_code.upper(), {})).get("choices", None),
-        )
+        map_code = itx.namespace.map_code.upper()
+        if not itx.client.map_cache:
+            return await cogs.search_autocomplete(itx, "level", value, map_code=map_code)
+        return await cogs.autocomplete(value, (itx.client.map_cache.get(map_code, {})).get("choices", None))
 
 
 class UserTransformer(app_commands.Transformer):
@@ -74,6 +71,8 @@ class UserTransformer(app_commands.Transformer):
         return int(value)
 
     async def autocomplete(self, itx: DoomItx, value: str) -> list[app_commands.Choice[str]]:
+        if not itx.client.users_choices:
+            return await cogs.search_autocomplete(itx, "user", value)
         return await cogs.autocomplete(value, itx.client.users_choices)
 
 
@@ -97,149 +96,80 @@ class URLTransformer(app_commands.Transformer):
             return str(resp.url)
 
 
-def time_convert(string: str) -> float:
-    """Convert HH:MM:SS.ss string into seconds (float)."""
-    negative = -1 if string[0] == "-" else 1
-    time = string.split(":")
-    match len(time):
-        case 1:
-            res = float(time[0])
-        case 2:
-            res = float((int(time[0]) * 60) + (negative * float(time[1])))
-        case 3:
-            res = float((int(time[0]) * 3600) + (negative * (int(time[1]) * 60)) + (negative * float(time[2])))
-        case _:
-            raise ValueError("Failed to match any cases.")
-    return res
-
-
-def pretty_record(record: decimal.Decimal | float) -> str:
-    """
-    The pretty_record property takes the record time for a given
-    document and returns a string representation of that time.
-    The function is used to display the record times in an easily
-    readable format on the leaderboard page.
-
-    Returns:
-        A string
-    """
-    record = float(record)
-    negative = "-" if record < 0 else ""
-    dt = datetime.datetime.min + datetime.timedelta(seconds=abs(record))
-    hour_remove = 0
-    seconds_remove = -4
-
-    if dt.hour == 0 and dt.minute == 0:
-        hour_remove = 6
-        if dt.second < 10:
-            hour_remove += 1
-
-    elif dt.hour == 0:
-        hour_remove = 3
-        if dt.minute < 10:
-            hour_remove = 4
+def _page_bounds(total: int, per_page: int = 9) -> typing.Iterator[tuple[int, int]]:
+    """Page slices matching ``split_nth_conditional(i, per_page, ...)``: the first page holds one extra row."""
+    start, end = 0, per_page + 1
+    while start < total:
+        yield start, min(end, total)
+        start, end = end, end + per_page
 
-    if dt.microsecond == 0:
-        seconds_remove = -4
 
-    return negative + dt.strftime("%H:%M:%S.%f")[hour_remove:seconds_remove]
+# The listings below format every time up front, then render each row with the f-string for
+# its verification state. f-strings compile to a single BUILD_STRING, which measured faster
+# than calling prebuilt ``str.format`` templates per row.
 
 
 def all_levels_records_embed(
-    records: list[database.DotRecord],
+    records: typing.Sequence[database.DotRecord],
     title: str,
     single: bool = False,
 ) -> list[Embed | DoomEmbed]:
     embed_list = []
-    embed = utils.DoomEmbed(title=title)
-    for i, record in enumerate(records):
-        if record["tournament"]:
-            description = (
-                f"┣ `Name` {record['nickname']}\n"
-                f"┗ `Record` [{pretty_record(record['record'])}]"
-                f"({record['screenshot']}) "
-                f"{utils.TROPHY}\n"
-            )
-        elif not record["video"]:
-            description = (
-                f"┣ `Name` {record['nickname']}\n"
-                f"┗ `Record` [{pretty_record(record['record'])}]"
-                f"({record['screenshot']}) "
-                f"{utils.HALF_VERIFIED}\n"
-            )
-        else:
-            description = (
-                f"┣ `Name` {record['nickname']}\n"
-                f"┣ `Record` [{pretty_record(record['record'])}]"
-                f"({record['screenshot']}) "
-                f"{utils.VERIFIED}\n "
-                f"┗ `Video` [Link]({record['video']})\n"
-            )
-        embed.add_field(
-            name=(
-                f"{utils.PLACEMENTS.get(record['rank_num'], '')} {make_ordinal(record['rank_num'])}"
-                if single
-                else record["level_name"]
-            ),
-            value=description,
-            inline=False,
-        )
-        if utils.split_nth_conditional(i, 9, records):
-            embed = utils.set_embed_thumbnail_maps(record["map_name"], embed)
-            embed_list.append(embed)
-            embed = utils.DoomEmbed(title=title)
+    times = utils.pretty_records([record["record"] for record in records])
+    for start, end in _page_bounds(len(records)):
+        embed = utils.DoomEmbed(title=title)
+        for i in range(start, end):
+            record = records[i]
+            if record["tournament"]:
+                value = f"┣ `Name` {record['nickname']}\n┗ `Record` [{times[i]}]({record['screenshot']}) {TROPHY}\n"
+            elif not record["video"]:
+                value = f"┣ `Name` {record['nickname']}\n┗ `Record` [{times[i]}]({record['screenshot']}) {HALF_VERIFIED}\n"
+            else:
+                value = (
+                    f"┣ `Name` {record['nickname']}\n"
+                    f"┣ `Record` [{times[i]}]({record['screenshot']}) {VERIFIED}\n "
+                    f"┗ `Video` [Link]({record['video']})\n"
+                )
+            if single:
+                name = f"{utils.PLACEMENTS.get(record['rank_num'], '')} {make_ordinal(record['rank_num'])}"
+            else:
+                name = record["level_name"]
+            embed.add_field(name=name, value=value, inline=False)
+        embed_list.append(utils.set_embed_thumbnail_maps(records[end - 1]["map_name"], embed))
     return embed_list
 
 
 def pr_records_embed(
-    records: list[database.DotRecord],
+    records: typing.Sequence[database.DotRecord],
     title: str,
 ) -> list[Embed | DoomEmbed]:
+    """One field per map and page, grouped in a single pass over records ordered by map code."""
     embed_list = []
-    embed = utils.DoomEmbed(title=title)
-    description = ""
-    cur_code = f"{records[0]['map_name']} by {records[0]['creators']} ({records[0]['map_code']})"
-    for i, record in enumerate(records):
-        if cur_code != f"{record['map_name']} by {record['creators']} ({record['map_code']})":
-            cur_code, description = _add_pr_field(cur_code, description, embed, record)
-        if not record["video"]:
-            description += (
-                f"┣ `Level` ***{record['level_name']}***\n"
-                f"┣ `Record` [{pretty_record(record['record'])}]"
-                f"({record['screenshot']}) "
-                f"{utils.HALF_VERIFIED}\n┃\n"
-            )
-        else:
-            description += (
-                f"┣ `Level` ***{record['level_name']}***\n"
-                f"┣ `Record` [{pretty_record(record['record'])}]"
-                f"({record['screenshot']})"
-                f"{utils.VERIFIED}\n "
-                f"┣ `Video` [Link]({record['video']})\n┃\n"
-            )
-        if utils.split_nth_conditional(i, 9, records):
-            cur_code, description = _add_pr_field(cur_code, description, embed, record)
-            embed_list.append(embed)
-            embed = utils.DoomEmbed(title=title)
+    times = utils.pretty_records([record["record"] for record in records])
+    for start, end in _page_bounds(len(records)):
+        embed = utils.DoomEmbed(title=title)
+        for map_code, group in itertools.groupby(range(start, end), key=lambda i: records[i]["map_code"]):
+            lines = []
+            for i in group:
+                record = records[i]
+                if not record["video"]:
+                    lines.append(
+                        f"┣ `Level` ***{record['level_name']}***\n"
+                        f"┣ `Record` [{times[i]}]({record['screenshot']}) {HALF_VERIFIED}\n┃\n"
+                    )
+                else:
+                    lines.append(
+                        f"┣ `Level` ***{record['level_name']}***\n"
+                        f"┣ `Record` [{times[i]}]({record['screenshot']}){VERIFIED}\n "
+                        f"┣ `Video` [Link]({record['video']})\n┃\n"
+                    )
+            # Drop the trailing spacer and close the field's last branch.
+            value = "┗".join("".join(lines)[:-3].rsplit("┣", 1))
+            embed.add_field(name=f"{record['map_name']} by {record['creators']} ({map_code})", value=value, inline=False)
+        embed_list.append(embed)
     return embed_list
 
 
-def _add_pr_field(
-    cur_code: str,
-    description: str,
-    embed: discord.Embed | DoomEmbed,
-    record: database.DotRecord,
-) -> tuple[str, str]:
-    embed.add_field(
-        name=f"{cur_code}",
-        value="┗".join(description[:-3].rsplit("┣", 1)),
-        inline=False,
-    )
-    description = ""
-    cur_code = f"{record['map_name']} by {record['creators']} ({record['map_code']})"
-    return cur_code, description
-
-
 def make_ordinal(n: int) -> str:
     """
     Convert an integer into its ordinal representation::
@@ -0,0 +1,42 @@
+from __future__ import annotations
+
+import typing
+
+import discord
+
+from utils.trigrams import TrigramIndex
+
+
+class TagStore:
+    """Every tag's message, rendered once, with a trigram index over the names for suggestions."""
+
+    def __init__(self):
+        self._content: dict[str, str] = {}
+        self._index = TrigramIndex()
+
+    def load(self, rows: typing.Iterable[typing.Mapping[str, str]]) -> None:
+        """Rebuild from rows with name and value."""
+        self.__init__()
+        for row in rows:
+            self.set(row["name"], row["value"])
+
+    @staticmethod
+    def render(name: str, value: str) -> str:
+        value = discord.utils.escape_mentions(value).replace(r"\n", "\n")
+        return f"**{name}**\n\n{value}"
+
+    def set(self, name: str, value: str) -> None:
+        self._content[name] = self.render(name, value)
+        self._index.add(name)
+
+    def remove(self, name: str) -> None:
+        self._content.pop(name, None)
+        self._index.remove(name)
+
+    def get(self, name: str) -> str | None:
+        """The tag's message, ready to send."""
+        return self._content.get(name)
+
+    def suggest(self, name: str, limit: int = 10) -> list[str]:
+        """Tag names most similar to ``name``, best first."""
+        return self._index.search(name, limit)
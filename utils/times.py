@@ -0,0 +1,81 @@
+from __future__ import annotations
+
+import decimal
+import math
+import re
+import typing
+
+# [-][[H:]M:]S[.fraction]; minutes and seconds must be below 60 when a larger unit precedes them.
+_RECORD_PATTERN = re.compile(r"(-)?(?:(?:(\d+):)?(\d+):)?(\d+(?:\.\d*)?|\.\d+)")
+
+
+def time_convert(string: str) -> float:
+    """Convert HH:MM:SS.ss string into seconds (float).
+
+    Raises ``ValueError`` for anything that isn't ``S``, ``M:SS`` or ``H:MM:SS``
+    with an optional leading ``-`` and fraction.
+    """
+    match = _RECORD_PATTERN.fullmatch(string.strip())
+    if not match:
+        raise ValueError(f"Invalid record time: {string!r}")
+    sign, hours, minutes, seconds = match.groups()
+    if minutes is None:
+        res = float(seconds)
+    elif float(seconds) >= 60 or (hours is not None and int(minutes) >= 60):
+        raise ValueError(f"Minutes and seconds must be below 60: {string!r}")
+    else:
+        # Whole units first, then the seconds, so the float matches the old split-based parser exactly.
+        res = int(hours or 0) * 3600 + int(minutes) * 60 + float(seconds)
+    return -res if sign else res
+
+
+def _centiseconds(seconds: float) -> int:
+    """Whole centiseconds in a non-negative time, truncated after rounding to the microsecond."""
+    frac, whole = math.modf(seconds)
+    return int(whole) * 100 + round(frac * 1_000_000) // 10_000
+
+
+def _format_centiseconds(sign: str, centiseconds: int) -> str:
+    seconds, centiseconds = divmod(centiseconds, 100)
+    minutes, seconds = divmod(seconds, 60)
+    hours, minutes = divmod(minutes, 60)
+    if hours:
+        return f"{sign}{hours:02}:{minutes:02}:{seconds:02}.{centiseconds:02}"
+    if minutes:
+        return f"{sign}{minutes}:{seconds:02}.{centiseconds:02}"
+    return f"{sign}{seconds}.{centiseconds:02}"
+
+
+def pretty_record(record: decimal.Decimal | float) -> str:
+    """Format a time in seconds as ``S.cc``, ``M:SS.cc`` or ``HH:MM:SS.cc``.
+
+    Centiseconds are truncated, not rounded. Hours are not wrapped at 24.
+    """
+    record = float(record)
+    if record < 0:
+        return _format_centiseconds("-", _centiseconds(-record))
+    return _format_centiseconds("", _centiseconds(record))
+
+
+def pretty_records(records: typing.Iterable[decimal.Decimal | float]) -> list[str]:
+    """``pretty_record`` for every time in ``records``.
+
+    Same arithmetic inlined into one loop, so a whole leaderboard is formatted without a call per row.
+    """
+    result = []
+    append = result.append
+    modf = math.modf
+    for record in records:
+        record = float(record)
+        sign = "-" if record < 0 else ""
+        frac, whole = modf(abs(record))
+        seconds, centiseconds = divmod(int(whole) * 100 + round(frac * 1_000_000) // 10_000, 100)
+        minutes, seconds = divmod(seconds, 60)
+        if minutes >= 60:
+            hours, minutes = divmod(minutes, 60)
+            append(f"{sign}{hours:02}:{minutes:02}:{seconds:02}.{centiseconds:02}")
+        elif minutes:
+            append(f"{sign}{minutes}:{seconds:02}.{centiseconds:02}")
+        else:
+            append(f"{sign}{seconds}.{centiseconds:02}")
+    return result
@@ -91,6 +91,15 @@ remove_record_args = {
 change_name = _Desc(name=_T("change-name"), description=_T("Change a user's display name"))
 change_name_args = {_user_a: _user, _nickname_a: _nickname}
 
+bulk_verify = _Desc(name=_T("bulk-verify"), description=_T("Verify or reject several queued records at once"))
+bulk_verify_args = {
+    "action": _T("Verify or reject"),
+    "amount": _T("How many records, oldest first"),
+    _map_code_a: _T("Only records for this map"),
+    _user_a: _T("Only records from this user"),
+    "reason": _T("Rejection reason sent to users"),
+}
+
 # PERSONAL COG -----------------------------------------------------------------
 alerts = _Desc(name=_T("alerts"), description=_T("Toggle Doombot verification alerts on/off"))
 alerts_args = {"value": _T("Alerts on/off")}
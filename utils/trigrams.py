@@ -0,0 +1,71 @@
+from __future__ import annotations
+
+import collections
+import re
+
+_WORDS = re.compile(r"[^\W_]+")
+
+# ``pg_trgm.similarity_threshold``'s default, so results match the SQL ``%`` operator.
+SIMILARITY_THRESHOLD = 0.3
+
+
+def trigrams(text: str) -> frozenset[str]:
+    """Trigrams of ``text`` the way ``pg_trgm`` extracts them.
+
+    Lowercased alphanumeric words, each padded with two spaces in front and one behind.
+    """
+    grams = set()
+    for word in _WORDS.findall(text.lower()):
+        padded = f"  {word} "
+        grams.update(padded[i : i + 3] for i in range(len(padded) - 2))
+    return frozenset(grams)
+
+
+def similarity(a: frozenset[str], b: frozenset[str]) -> float:
+    """``pg_trgm``'s ``similarity()``: shared trigrams over the trigrams of both."""
+    if not a or not b:
+        return 0.0
+    shared = len(a & b)
+    return shared / (len(a) + len(b) - shared)
+
+
+class TrigramIndex:
+    """Inverted index from trigram to the names containing it.
+
+    A search only scores names sharing at least one trigram with the query,
+    instead of comparing the query with every name.
+    """
+
+    def __init__(self):
+        self._names: dict[str, frozenset[str]] = {}
+        self._postings: dict[str, set[str]] = collections.defaultdict(set)
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+    def add(self, name: str) -> None:
+        if name in self._names:
+            return
+        grams = self._names[name] = trigrams(name)
+        for gram in grams:
+            self._postings[gram].add(name)
+
+    def remove(self, name: str) -> None:
+        for gram in self._names.pop(name, ()):
+            self._postings[gram].discard(name)
+            if not self._postings[gram]:
+                del self._postings[gram]
+
+    def search(self, text: str, limit: int = 10, threshold: float = SIMILARITY_THRESHOLD) -> list[str]:
+        """Names at least ``threshold`` similar to ``text``, best first."""
+        query = trigrams(text)
+        shared: collections.Counter[str] = collections.Counter()
+        for gram in query:
+            shared.update(self._postings.get(gram, ()))
+        scored = []
+        for name, count in shared.items():
+            score = count / (len(query) + len(self._names[name]) - count)
+            if score >= threshold:
+                scored.append((-score, name))
+        scored.sort()
+        return [name for _, name in scored[:limit]]
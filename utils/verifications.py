@@ -0,0 +1,56 @@
+from __future__ import annotations
+
+import bisect
+import typing
+
+T = typing.TypeVar("T")
+
+
+class VerifierLeaderboard:
+    """Verification counts kept sorted by amount, highest first.
+
+    Entries are ``(-amount, user_id)`` so ``bisect`` keeps them ordered and a
+    user's ``RANK()`` is the position of the first entry with the same amount.
+    Rendered pages are cached until the counts change.
+    """
+
+    def __init__(self):
+        self._counts: dict[int, int] = {}
+        self._entries: list[tuple[int, int]] = []
+        self._pages = None
+
+    def load(self, rows: typing.Iterable[tuple[int, int]]) -> None:
+        """Rebuild from ``(user_id, amount)`` rows."""
+        self._counts = dict(rows)
+        self._entries = sorted((-amount, user_id) for user_id, amount in self._counts.items())
+        self._pages = None
+
+    def increment(self, user_id: int, amount: int = 1) -> None:
+        old = self._counts.get(user_id)
+        if old is not None:
+            del self._entries[bisect.bisect_left(self._entries, (-old, user_id))]
+        self._counts[user_id] = (old or 0) + amount
+        bisect.insort(self._entries, (-self._counts[user_id], user_id))
+        self._pages = None
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def count(self, user_id: int) -> int:
+        return self._counts.get(user_id, 0)
+
+    def rank(self, user_id: int) -> int | None:
+        if user_id not in self._counts:
+            return None
+        return bisect.bisect_left(self._entries, (-self._counts[user_id],)) + 1
+
+    @staticmethod
+    def entry_rank(entries: typing.Sequence[tuple[int, int]], entry: tuple[int, int]) -> int:
+        """``RANK()`` of ``entry`` within a snapshot from ``pages``."""
+        return bisect.bisect_left(entries, (entry[0],)) + 1
+
+    def pages(self, build: typing.Callable[[list[tuple[int, int]]], T]) -> T:
+        """Pages built by ``build`` from a snapshot of the entries, reused until the counts change."""
+        if self._pages is None:
+            self._pages = build(list(self._entries))
+        return self._pages
@@ -16,9 +16,6 @@ if TYPE_CHECKING:
     from core import DoomItx
 
 
-_MAPS_BASE_URL = "https://bkan0n.com/assets/images/map_banners/"
-
-
 @dataclass
 class MapMetadata:
     NAME: str
@@ -26,10 +23,7 @@ class MapMetadata:
     IMAGE_URL: str = ""
 
     def __post_init__(self):
-        self.IMAGE_URL = _MAPS_BASE_URL + self._remove_extra_chars(self.NAME) + ".png"
-
-    def _remove_extra_chars(self, string: str):
-        return string.lower().replace(" ", "").replace(":", "").replace("'", "")
+        self.IMAGE_URL = utils.register_map_assets(self.NAME).banner
 
 
 all_map_constants = [
@@ -133,8 +127,12 @@ class MapSubmit(discord.ui.Modal, title="MapSubmit"):
                 f"`  Map ` {self.data['map_name']}\n"
                 f"` Type ` {', '.join(map_types)}\n" + description
             ),
-            color=MAP_DATA.get(self.data["map_name"], discord.Color.from_str("#000000")).COLOR,
-            image=MAP_DATA.get(self.data["map_name"], None).IMAGE_URL,
+            color=(
+                MAP_DATA[self.data["map_name"]].COLOR
+                if self.data["map_name"] in MAP_DATA
+                else discord.Color.from_str("#000000")
+            ),
+            image=utils.map_assets(self.data["map_name"]).banner,
             thumbnail=itx.client.user.display_avatar.url,
         )
         embed.add_field(
@@ -173,6 +171,20 @@ class MapSubmit(discord.ui.Modal, title="MapSubmit"):
             user_ids=[itx.user.id],
             choices=[app_commands.Choice(name=x, value=x) for x in levels],
         )
+        itx.client.map_picker.add_map(self.data["map_code"], levels)
+        itx.client.map_stats.add(
+            utils.MapStats(
+                map_code=self.data["map_code"],
+                map_name=self.data["map_name"],
+                map_type=map_types,
+                desc=self.desc.value,
+                official=False,
+                image=getattr(self.data["image"], "url", None),
+                creator_ids=[itx.user.id],
+                rating_total=0,
+                rating_count=0,
+            )
+        )
         # Cache map code choice
         itx.client.map_codes_choices.append(app_commands.Choice(name=self.data["map_code"], value=self.data["map_code"]))
         embed.title = f"New Map by {self.data['creator_name']}"
@@ -187,6 +199,7 @@ class MapSubmit(discord.ui.Modal, title="MapSubmit"):
                 self.data["map_code"],
                 new_map.attachments[0].url,
             )
+            itx.client.map_stats.set_image(self.data["map_code"], new_map.attachments[0].url)
 
         await new_map.create_thread(name=f"Discuss {self.data['map_code']} here.")
         map_maker = itx.guild.get_role(746167804121841744)
@@ -1,6 +1,8 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+import math
+from collections.abc import Callable, Sequence
+from typing import TYPE_CHECKING, Generic, TypeVar
 
 import discord
 
@@ -9,13 +11,43 @@ import utils
 if TYPE_CHECKING:
     from core import DoomItx
 
+T = TypeVar("T")
+
+
+class LazyPages(Sequence, Generic[T]):
+    """Pages rendered on first view from ``per_page`` sized chunks of ``items``."""
+
+    def __init__(
+        self,
+        items: Sequence[T],
+        per_page: int,
+        render: Callable[[Sequence[T]], discord.Embed | utils.DoomEmbed | str],
+    ) -> None:
+        self.items = items
+        self.per_page = per_page
+        self.render = render
+        self._rendered: dict[int, discord.Embed | utils.DoomEmbed | str] = {}
+
+    def __len__(self) -> int:
+        return max(math.ceil(len(self.items) / self.per_page), 1)
+
+    def __getitem__(self, index: int) -> discord.Embed | utils.DoomEmbed | str:
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError(index)
+        if index not in self._rendered:
+            start = index * self.per_page
+            self._rendered[index] = self.render(self.items[start : start + self.per_page])
+        return self._rendered[index]
+
 
 class Paginator(discord.ui.View):
     """ "A view for paginating multiple embeds."""
 
     def __init__(
         self,
-        embeds: list[discord.Embed | utils.DoomEmbed | str],
+        embeds: Sequence[discord.Embed | utils.DoomEmbed | str],
         author: discord.Member | discord.User,
         timeout=None,
     ) -> None:
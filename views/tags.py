@@ -23,9 +23,8 @@ class TagFuzzView(discord.ui.View):
     @discord.ui.select()
     async def matches(self, itx: DoomItx, select: discord.ui.Select):
         await itx.response.defer()
-        query = "SELECT * FROM tags WHERE name=$1;"
-        tag = await itx.client.database.fetchrow(query, select.values[0])
-        await itx.edit_original_response(content=f"**{tag['name']}**\n\n{tag['value']}", view=None, embed=None)
+        content = itx.client.tags.get(select.values[0])
+        await itx.edit_original_response(content=content, view=None, embed=None)
 
 
 class TagCreate(discord.ui.Modal, title="Create Tag"):
@@ -44,5 +43,6 @@ class TagCreate(discord.ui.Modal, title="Create Tag"):
             self.name.value,
             self.value.value,
         )
+        itx.client.tags.set(self.name.value, self.value.value)
         itx.client.tag_cache.append(self.name.value)
         itx.client.tag_choices.append(app_commands.Choice(name=self.name.value, value=self.name.value))
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 from typing import TYPE_CHECKING
 
 import discord
@@ -48,76 +49,97 @@ class VerificationView(discord.ui.View):
         rejection: str | None = None,
     ):
         """Verify a record."""
-        query = "SELECT * FROM records WHERE hidden_id=$1"
-        row = await itx.client.database.fetchrow(
-            query,
-            itx.message.id,
-        )
+        if verified:
+            row = await self.verify_record(itx)
+        else:
+            row = await self.reject_record(itx)
         if not row:
             return
 
-        original_message = await self.find_original_message(itx, row["channel_id"], row["message_id"])
-        if not original_message:
-            return
+        self.update_record_index(itx, row, verified)
+        if verified:
+            self.increment_verification_count(itx)
+            data = self.accepted(itx, row)
+        else:
+            data = self.rejected(itx, row, rejection)
 
+        self.stop()
         user = itx.guild.get_member(row["user_id"])
+        if user and itx.client.all_users.get(row["user_id"], {}).get("alertable"):
+            message = self.direct_message(data)
+            itx.client.dispatcher.submit(
+                ("dm", user.id),
+                lambda: user.send(message),
+                key=("verification", itx.message.id),
+            )
+        # The record is already committed, so a deleted records channel must not stop the rest.
+        calls = [itx.message.delete()]
+        if channel := itx.guild.get_channel(row["channel_id"]):
+            calls.insert(0, channel.get_partial_message(row["message_id"]).edit(content=data["edit"]))
+        results = await asyncio.gather(*calls, return_exceptions=True)
+        for result in results:
+            if isinstance(result, Exception):
+                itx.client.logger.info(result)
 
+    @staticmethod
+    def update_record_index(itx: DoomItx, row: database.DotRecord, verified: bool) -> None:
+        """Verified records become the user's PR for the level; rejections delete all of them.
+
+        Dispatches ``world_record`` when a verified record sets a new best time.
+        """
         if verified:
-            data = self.accepted(itx, row)
-            await self.increment_verification_count(itx)
-            query = "UPDATE records SET verified=TRUE, hidden_id=null WHERE hidden_id=$1;"
-            await itx.client.database.execute(
-                query,
-                itx.message.id,
-            )
+            record = utils.PersonalRecord(row["record"], row["screenshot"], row["video"])
+            change = itx.client.record_index.set(row["user_id"], row["map_code"], row["level_name"], record)
+            if change:
+                itx.client.dispatch("world_record", change)
         else:
-            data = self.rejected(itx, row, rejection)
-            query = "DELETE FROM records WHERE user_id=$1 AND map_code=$2 AND level_name=$3;"
-            await itx.client.database.execute(
-                query,
-                row["user_id"],
-                row["map_code"],
-                row["level_name"],
+            itx.client.record_index.remove(row["user_id"], row["map_code"], row["level_name"])
+
+    @staticmethod
+    def increment_verification_count(itx: DoomItx, amount: int = 1) -> None:
+        """Mirror a verification_counts bump in the in-memory leaderboard."""
+        itx.client.verifier_leaderboard.increment(itx.user.id, amount)
+
+    @staticmethod
+    async def verify_record(itx: DoomItx) -> database.DotRecord | None:
+        """Mark the queued record as verified and credit the verifier in one statement."""
+        query = """
+            WITH verified AS (
+                UPDATE records SET verified=TRUE, hidden_id=null WHERE hidden_id=$1 RETURNING *
+            ), counted AS (
+                INSERT INTO verification_counts (user_id, amount)
+                SELECT $2, 1 FROM verified
+                ON CONFLICT (user_id)
+                    DO UPDATE SET amount = verification_counts.amount + 1
             )
-        await original_message.edit(content=data["edit"])
-        query = "SELECT alertable FROM users WHERE user_id=$1;"
-        if await itx.client.database.fetchval(
+            SELECT * FROM verified;
+        """
+        return await itx.client.database.fetchrow(
             query,
-            row["user_id"],
-        ):
-            try:
-                await user.send(
-                    "`- - - - - - - - - - - - - -`\n" + data["direct_message"] + "\n`- - - - - - - - - - - - - -`"
-                )
-            except Exception as e:
-                itx.client.logger.info(e)
-        await self.stop_view(itx)
-
-    async def stop_view(self, itx: DoomItx):
-        self.stop()
-        await itx.message.delete()
+            itx.message.id,
+            itx.user.id,
+        )
 
     @staticmethod
-    async def increment_verification_count(itx: DoomItx):
+    async def reject_record(itx: DoomItx) -> database.DotRecord | None:
+        """Delete the queued record, and the user's other records for that level, in one statement."""
         query = """
-            INSERT INTO verification_counts (user_id, amount)
-            VALUES ($1, 1)
-            ON CONFLICT (user_id)
-                DO UPDATE SET amount = verification_counts.amount + 1;
+            WITH queued AS (
+                SELECT * FROM records WHERE hidden_id=$1
+            ), deleted AS (
+                DELETE FROM records r USING queued q
+                WHERE r.user_id=q.user_id AND r.map_code=q.map_code AND r.level_name=q.level_name
+            )
+            SELECT * FROM queued;
         """
-        await itx.client.database.execute(
+        return await itx.client.database.fetchrow(
             query,
-            itx.user.id,
+            itx.message.id,
         )
 
     @staticmethod
-    async def find_original_message(itx: DoomItx, channel_id: int, message_id: int) -> discord.Message | None:
-        """Try to fetch message from either Records channel."""
-        try:
-            res = await itx.guild.get_channel(channel_id).fetch_message(message_id)
-        except (discord.NotFound, discord.HTTPException):
-            res = None
-        return res
+    def direct_message(data: dict[str, str]) -> str:
+        return "`- - - - - - - - - - - - - -`\n" + data["direct_message"] + "\n`- - - - - - - - - - - - - -`"
 
     @staticmethod
     def accepted(
@@ -134,15 +156,13 @@ class VerificationView(discord.ui.View):
             edit = f"{utils.VERIFIED} Complete verification by {itx.user.mention}!"
         else:
             edit = f"{utils.HALF_VERIFIED} Partial verification by {itx.user.mention}! " f"No video proof supplied."
-        message = itx.guild.get_channel(search["channel_id"]).get_partial_message(search["message_id"])
+        channel = itx.guild.get_channel(search["channel_id"])
+        jump_url = f"{channel.get_partial_message(search['message_id']).jump_url}\n" if channel else ""
         return {
             "edit": edit,
             "direct_message": (
                 f"**Map Code:** {search['map_code']}\n"
-                f"**Level:** {search['level_name']}\n"
-                + record
-                + f"\nVerified by {itx.user.mention}!\n{message.jump_url}\n\n"
-                + ALERT
+                f"**Level:** {search['level_name']}\n" + record + f"\nVerified by {itx.user.mention}!\n{jump_url}\n" + ALERT
             ),
         }
 